@@ -1,8 +1,10 @@
 from django.contrib import admin
-from audit.models import TransactionLogBase,Notifications,EventTypes
+from audit.models import TransactionLogBase,Notifications,EventTypes,DashboardCounter,EmailOutbox
 
 # Register your models here.
 # admin.site.register(EventCategory)
 admin.site.register(EventTypes)
 admin.site.register(TransactionLogBase)
-admin.site.register(Notifications)
\ No newline at end of file
+admin.site.register(Notifications)
+admin.site.register(DashboardCounter)
+admin.site.register(EmailOutbox)
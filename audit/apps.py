@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class AuditConfig(AppConfig):
     name = 'audit'
+
+    def ready(self):
+        import audit.signals  # noqa: F401 — registers the lookup registry receivers
@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from audit.services.dashboard_service import DashBoardController
+from services.services import DashboardService
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs DashBoardController.get_dashboard for a user, reports the number of "
+        "queries and the average latency, and fails if the query count exceeds the budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--email",
+            help="Email of the user to render the dashboard for. Defaults to the first active user.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="How many times to render the dashboard for the latency average.",
+        )
+        parser.add_argument(
+            "--max-queries",
+            type=int,
+            default=DashboardService.QUERY_BUDGET,
+            help="Fail when a single dashboard render issues more queries than this.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.select_related("role", "status").filter(is_active=True)
+        if options["email"]:
+            users = users.filter(email=options["email"])
+        user = users.first()
+        if not user:
+            raise CommandError("No active user found to render the dashboard for.")
+
+        request = RequestFactory().get("/api/v1/audit/dashboard/")
+        request.user = user
+
+        with CaptureQueriesContext(connection) as captured:
+            response = DashBoardController.get_dashboard(request)
+
+        if response.status_code != 200:
+            raise CommandError(
+                f"Dashboard returned {response.status_code}: {response.content.decode()}"
+            )
+
+        started = time.perf_counter()
+        for _ in range(options["iterations"]):
+            DashBoardController.get_dashboard(request)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / max(options["iterations"], 1)
+
+        query_count = len(captured.captured_queries)
+        self.stdout.write(
+            f"dashboard for {user.email}: {query_count} queries, {elapsed_ms:.2f} ms avg "
+            f"over {options['iterations']} runs (budget {options['max_queries']} queries)"
+        )
+
+        if query_count > options["max_queries"]:
+            for query in captured.captured_queries:
+                self.stderr.write(query["sql"])
+            raise CommandError(
+                f"Dashboard query count regressed: {query_count} > {options['max_queries']}"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Dashboard query budget OK"))
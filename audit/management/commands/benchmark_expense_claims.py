@@ -0,0 +1,185 @@
+import math
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection
+
+from audit.models import TransactionLogBase
+from finance.models import ExpenseRequest
+from services.lookup_registry import LookupRegistry
+from services.services import DashboardCounterService, ExpenseRequestService
+from users.models import Role, User
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulates several Finance Officers working the pending expense queue in parallel "
+        "threads, first the old way (everyone reads get_all_pending_for_fo and decides from "
+        "the top) and then through claim_next (SELECT ... FOR UPDATE SKIP LOCKED with a lease). "
+        "Reports wall time, throughput, wasted attempts on requests someone else already took, "
+        "and decision latency. Seeds and removes its own reviewers and requests. "
+        "Row locks only exist on PostgreSQL; on sqlite the numbers show the duplicate work only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reviewers", type=int, default=4, help="Simulated Finance Officers.")
+        parser.add_argument("--requests", type=int, default=200, help="Pending requests per mode.")
+        parser.add_argument("--batch", type=int, default=10, help="Requests a reviewer takes per round.")
+        parser.add_argument(
+            "--think-ms",
+            type=float,
+            default=5.0,
+            help="Simulated review time per request before deciding it.",
+        )
+
+    def handle(self, *args, **options):
+        role = Role.objects.filter(code="FO").first()
+        if role is None:
+            raise CommandError("No FO role found to create the simulated reviewers with.")
+
+        run_id = secrets.token_hex(4)
+        employee = self._user(f"bench-employee-{run_id}@bench.local", role)
+        reviewers = [
+            self._user(f"bench-fo-{run_id}-{i}@bench.local", role)
+            for i in range(options["reviewers"])
+        ]
+        self.stdout.write(
+            f"{options['reviewers']} reviewers, {options['requests']} requests, "
+            f"batch {options['batch']}, {options['think_ms']} ms per review on {connection.vendor}"
+        )
+
+        try:
+            for label, work in (("shared list", self._shared_list), ("claim_next", self._claim_next)):
+                self._run(label, work, employee, reviewers, options)
+        finally:
+            User.objects.filter(id__in=[employee.id, *(r.id for r in reviewers)]).delete()
+
+    @staticmethod
+    def _user(email, role) -> User:
+        return User.objects.create_user(
+            email,
+            secrets.token_urlsafe(16),
+            role=role,
+            status=LookupRegistry.status("ACT"),
+            first_name="Bench",
+            last_name="User",
+        )
+
+    @staticmethod
+    def _shared_list(reviewer, options, decide):
+        """Every reviewer reads the same pending list and works it from the top."""
+        service = ExpenseRequestService()
+        while True:
+            ids = list(
+                service.get_all_pending_for_fo()
+                .order_by("created_at", "id")
+                .values_list("id", flat=True)[: options["batch"]]
+            )
+            if not ids:
+                return
+            for expense_id in ids:
+                decide(reviewer, expense_id)
+
+    @staticmethod
+    def _claim_next(reviewer, options, decide):
+        """Every reviewer claims its own batch and decides only that."""
+        service = ExpenseRequestService()
+        while True:
+            try:
+                claimed = service.claim_next(reviewer, options["batch"])
+            except DatabaseError:
+                # sqlite only: a concurrent writer held the database; claim again
+                continue
+            if not claimed:
+                return
+            for expense in claimed:
+                decide(reviewer, expense.id)
+
+    def _run(self, label, work, employee, reviewers, options):
+        expenses = ExpenseRequest.objects.bulk_create(
+            [
+                ExpenseRequest(
+                    employee=employee,
+                    title=f"bench {i}",
+                    amount=Decimal("10.00"),
+                )
+                for i in range(options["requests"])
+            ]
+        )
+        DashboardCounterService.record_transitions(expenses, new_status_code="pending")
+
+        service = ExpenseRequestService()
+        lock = threading.Lock()
+        latencies = []
+        wasted = [0]
+        errors = [0]
+        start = threading.Barrier(len(reviewers))
+
+        def decide(reviewer, expense_id):
+            time.sleep(options["think_ms"] / 1000)
+            started = time.perf_counter()
+            try:
+                service.approve_or_reject(None, expense_id, "approved", reviewer)
+            except ValueError:
+                # someone else decided it first, or holds its claim
+                with lock:
+                    wasted[0] += 1
+                return
+            except DatabaseError:
+                # sqlite "database is locked" — the request stays pending for another round
+                with lock:
+                    errors[0] += 1
+                return
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+        def reviewer_thread(reviewer):
+            start.wait()
+            try:
+                work(reviewer, options, decide)
+            finally:
+                connection.close()
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=len(reviewers)) as pool:
+                list(pool.map(reviewer_thread, reviewers))
+            elapsed = time.perf_counter() - started
+            self._report(label, elapsed, latencies, wasted[0], errors[0])
+        finally:
+            self._cleanup(expenses)
+
+    def _report(self, label, elapsed, latencies, wasted, errors):
+        latencies = sorted(latencies)
+
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, math.ceil(p * len(latencies)) - 1)] * 1000
+
+        self.stdout.write(f"\n{label}")
+        self.stdout.write(
+            f"  decided {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f}/s), "
+            f"wasted attempts {wasted}, database errors {errors}"
+        )
+        self.stdout.write(
+            f"  decision latency p50 {percentile(0.50):.1f} ms, p99 {percentile(0.99):.1f} ms"
+        )
+
+    @staticmethod
+    def _cleanup(expenses):
+        ids = [expense.id for expense in expenses]
+        by_status = {}
+        for expense in ExpenseRequest.objects.filter(id__in=ids):
+            by_status.setdefault(expense.status_code, []).append(expense)
+        for status_code, group in by_status.items():
+            DashboardCounterService.record_transitions(group, old_status_code=status_code)
+
+        TransactionLogBase.objects.filter(
+            entity_type="ExpenseRequest", entity_id__in=[str(i) for i in ids]
+        ).delete()
+        ExpenseRequest.objects.filter(id__in=ids).delete()
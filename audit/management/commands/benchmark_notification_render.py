@@ -0,0 +1,98 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import render_to_string
+
+from audit.models import EventTypes, Notifications, TransactionLogBase
+from services.otp_email.email_service import EmailService
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares rendering notification_email.html per recipient with render_to_string "
+        "against the shared render path used by EmailService.send_notification_batch, "
+        "for one transaction log fanned out to N recipients. Nothing touches the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--recipients",
+            type=int,
+            default=50,
+            help="How many recipients the transaction log fans out to.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="How many fan-outs to time for each strategy.",
+        )
+
+    def handle(self, *args, **options):
+        sender = User(email="employee@example.com", first_name="Test", last_name="Employee")
+        log = TransactionLogBase(
+            event_type=EventTypes(code="expense_submitted", name="Expense Submitted"),
+            event_message="Expense request 'Fuel' of KES 4,500 submitted for approval",
+            triggered_by=sender,
+        )
+        notifications = [
+            Notifications(
+                transaction_log=log,
+                recipient=User(
+                    email=f"officer{i}@example.com",
+                    first_name=f"Officer{i}",
+                    last_name="O'Neil & Sons",  # exercises HTML escaping
+                ),
+            )
+            for i in range(options["recipients"])
+        ]
+
+        baseline = self._per_recipient(notifications)
+        shared = self._shared(notifications)
+        if baseline != shared:
+            raise CommandError("Shared render output differs from the per-recipient render")
+
+        per_recipient_ms = self._time(self._per_recipient, notifications, options["iterations"])
+        shared_ms = self._time(self._shared, notifications, options["iterations"])
+
+        self.stdout.write(
+            f"{options['recipients']} recipients, {options['iterations']} runs: "
+            f"render_to_string per recipient {per_recipient_ms:.2f} ms, "
+            f"shared render {shared_ms:.2f} ms "
+            f"({per_recipient_ms / max(shared_ms, 1e-9):.1f}x)"
+        )
+        self.stdout.write(self.style.SUCCESS("Rendered bodies are identical"))
+
+    @staticmethod
+    def _per_recipient(notifications):
+        bodies = []
+        for notification in notifications:
+            user, log = notification.recipient, notification.transaction_log
+            bodies.append(
+                render_to_string(
+                    "notification_email.html",
+                    {
+                        "fullname": user.first_name + " " + user.last_name,
+                        "event_name": log.event_type.name,
+                        "message": log.event_message,
+                        "triggered_by": log.triggered_by.email if log.triggered_by else "System",
+                    },
+                )
+            )
+        return bodies
+
+    @staticmethod
+    def _shared(notifications):
+        shared = EmailService.render_notification_shared(notifications[0])
+        return [
+            EmailService.build_notification(n.recipient, n, shared).alternatives[0][0]
+            for n in notifications
+        ]
+
+    @staticmethod
+    def _time(render, notifications, iterations: int) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            render(notifications)
+        return (time.perf_counter() - started) * 1000 / max(iterations, 1)
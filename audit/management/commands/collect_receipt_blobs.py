@@ -0,0 +1,75 @@
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from finance.models import DisbursementReconciliation, ExpenseRequest
+from services.services import ReceiptStorageService
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves receipts uploaded before deduplication onto ReceiptBlobs: each legacy file is "
+        "hashed in chunks, attached to the blob for its content and, when that content was "
+        "already stored, repointed at the blob's file and the redundant copy deleted. Then "
+        "purges blobs no expense request or reconciliation references any more, and blob "
+        "files left without a row by rolled-back uploads. Safe to re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-backfill",
+            action="store_true",
+            help="Only purge unreferenced blobs; leave legacy receipts alone.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["no_backfill"]:
+            for model in (ExpenseRequest, DisbursementReconciliation):
+                self._backfill(model)
+
+        purged = ReceiptStorageService.purge_unreferenced()
+        orphans = ReceiptStorageService.purge_orphan_files()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purged {purged} unreferenced receipt blob(s) and {orphans} orphaned file(s)."
+            )
+        )
+
+    def _backfill(self, model):
+        legacy = (
+            model.objects.filter(receipt_blob__isnull=True)
+            .exclude(receipt="")
+            .exclude(receipt__isnull=True)
+        )
+        adopted = deduplicated = missing = 0
+
+        for row_id, name in legacy.values_list("id", "receipt").iterator():
+            try:
+                with transaction.atomic():
+                    row = legacy.select_for_update().filter(id=row_id).first()
+                    if row is None:
+                        continue  # attached by a concurrent run
+                    blob = ReceiptStorageService.adopt(name)
+                    row.receipt_blob = blob
+                    row.receipt = blob.file.name
+                    row.save(update_fields=["receipt_blob", "receipt", "updated_at"])
+            except FileNotFoundError:
+                missing += 1
+                continue
+
+            adopted += 1
+            if blob.file.name != name and not self._still_used(name):
+                default_storage.delete(name)
+                deduplicated += 1
+
+        self.stdout.write(
+            f"{model._meta.verbose_name_plural}: {adopted} receipt(s) attached to blobs, "
+            f"{deduplicated} duplicate file(s) deleted, {missing} file(s) missing from storage"
+        )
+
+    @staticmethod
+    def _still_used(name) -> bool:
+        return (
+            ExpenseRequest.objects.filter(receipt=name).exists()
+            or DisbursementReconciliation.objects.filter(receipt=name).exists()
+        )
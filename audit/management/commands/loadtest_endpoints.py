@@ -0,0 +1,165 @@
+import math
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+
+from authenticate.services.token_service import TokenService
+from users.models import User
+
+# --compare pool: the same server with database connection reuse off, then the psycopg pool on
+POOL_MODES = (
+    ("no reuse", "runserver", {"DB_POOL": "false", "DB_CONN_MAX_AGE": "0"}),
+    ("pool", "runserver", {"DB_POOL": "true"}),
+)
+# --compare server: the development server against the production gunicorn setup (gunicorn.conf.py)
+SERVER_MODES = (
+    ("runserver", "runserver", {}),
+    ("gunicorn", "gunicorn", {}),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-tests api/v1/health/, auth/me/, finance/expense/mine/ and the notification badge "
+        "(audit/notifications/unread/count/) over HTTP and reports "
+        "p50/p99 latency and throughput. It starts a local server per mode and compares them: "
+        "--compare pool runs with connection reuse off and with the psycopg pool on (DB_POOL), "
+        "--compare server runs manage.py runserver and gunicorn. --base-url measures an "
+        "already running server instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            help="Measure this running server (e.g. http://localhost:8000) instead of spawning one per mode.",
+        )
+        parser.add_argument(
+            "--compare",
+            choices=("pool", "server"),
+            default="pool",
+            help="Which pair of server modes to spawn and compare.",
+        )
+        parser.add_argument(
+            "--email",
+            help="Email of the user to authenticate as. Defaults to the first active user.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="How many requests to send to each endpoint in each mode.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=8,
+            help="How many requests are in flight at once.",
+        )
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=8765,
+            help="Port for the spawned server.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options["email"]:
+            users = users.filter(email=options["email"])
+        user = users.first()
+        if not user:
+            raise CommandError("No active user found to authenticate as.")
+        token = TokenService.generate_access_token(user)
+
+        if options["base_url"]:
+            self._measure("target", options["base_url"].rstrip("/"), token, options)
+            return
+
+        if options["compare"] == "pool" and connection.vendor != "postgresql":
+            raise CommandError("Comparing pool on/off needs PostgreSQL; use --base-url for other databases.")
+
+        base_url = f"http://127.0.0.1:{options['port']}"
+        modes = POOL_MODES if options["compare"] == "pool" else SERVER_MODES
+        for label, server_name, overrides in modes:
+            server = self._start_server(server_name, options["port"], overrides, base_url)
+            try:
+                self._measure(label, base_url, token, options)
+            finally:
+                server.terminate()
+                server.wait()
+
+    def _start_server(self, server_name: str, port: int, overrides: dict, base_url: str):
+        if server_name == "gunicorn":
+            command = [
+                sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+                "--bind", f"127.0.0.1:{port}", "pettycash_system.wsgi:application",
+            ]
+        else:
+            command = [sys.executable, "manage.py", "runserver", "--noreload", f"127.0.0.1:{port}"]
+
+        server = subprocess.Popen(
+            command,
+            cwd=settings.BASE_DIR,
+            env={**os.environ, **overrides},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                urllib.request.urlopen(base_url + reverse("health"), timeout=1)
+                return server
+            except OSError:  # refused, reset or timed out
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError(f"The server on port {port} did not come up within 30s.")
+
+    def _measure(self, label: str, base_url: str, token: str, options: dict):
+        endpoints = (
+            ("health", base_url + reverse("health"), {}),
+            ("auth/me", base_url + reverse("get-auth-user"), {"Authorization": f"Bearer {token}"}),
+            ("expense/mine", base_url + reverse("list-my-expense-requests"), {"Authorization": f"Bearer {token}"}),
+            ("unread count", base_url + reverse("get-unread-count"), {"Authorization": f"Bearer {token}"}),
+        )
+        for name, url, headers in endpoints:
+            self._timed_get(url, headers)  # warm-up
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+                started = time.perf_counter()
+                results = list(executor.map(lambda _: self._timed_get(url, headers), range(options["requests"])))
+                elapsed = time.perf_counter() - started
+
+            latencies = sorted(duration for duration, ok in results)
+            errors = sum(1 for duration, ok in results if not ok)
+            self.stdout.write(
+                f"{label:<9} {name:<13} p50 {self._percentile(latencies, 50):7.1f} ms  "
+                f"p99 {self._percentile(latencies, 99):7.1f} ms  "
+                f"{len(results) / elapsed:7.0f} req/s  {errors} errors"
+            )
+
+    @staticmethod
+    def _timed_get(url: str, headers: dict) -> tuple:
+        """Returns (milliseconds, succeeded)."""
+        request = urllib.request.Request(url, headers={"Host": "localhost", **headers})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                response.read()
+                ok = response.status < 400
+        except OSError:  # refused, reset or timed out
+            ok = False
+        return (time.perf_counter() - started) * 1000, ok
+
+    @staticmethod
+    def _percentile(sorted_values: list, percent: int) -> float:
+        if not sorted_values:
+            return 0.0
+        index = max(0, math.ceil(len(sorted_values) * percent / 100) - 1)
+        return sorted_values[index]
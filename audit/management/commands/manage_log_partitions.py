@@ -0,0 +1,121 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from audit import partitions
+from audit.models import Notifications
+from services.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintains the monthly transaction_logs partitions (PostgreSQL): creates the "
+        "partitions for the coming months and, with --retain-months, detaches partitions "
+        "older than the retention window into gzip CSV archives and drops them. "
+        "Notifications of archived logs are kept with a copy of the log fields they show "
+        "unless --delete-notifications is given. Run it daily from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Make sure partitions exist up to this many months after the current one.",
+        )
+        parser.add_argument(
+            "--retain-months",
+            type=int,
+            default=getattr(settings, "AUDIT_LOG_RETENTION_MONTHS", None),
+            help="Archive partitions whose month ended more than this many months ago. "
+            "Defaults to AUDIT_LOG_RETENTION_MONTHS; nothing is archived when unset.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=getattr(
+                settings, "AUDIT_LOG_ARCHIVE_DIR", settings.BASE_DIR / "archives" / "transaction_logs"
+            ),
+            help="Directory the <partition>.csv.gz archives are written to.",
+        )
+        parser.add_argument(
+            "--delete-notifications",
+            action="store_true",
+            help="Delete the notifications of archived logs instead of keeping them "
+            "with a copy of the log fields (archived_log).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be created and archived.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("transaction_logs partitioning requires PostgreSQL.")
+
+        with connection.cursor() as cursor:
+            if not partitions.is_partitioned(cursor):
+                raise CommandError(
+                    "transaction_logs is not partitioned yet — run migrate (audit 0011) first."
+                )
+
+        current = partitions.month_start(datetime.datetime.now(datetime.timezone.utc))
+        self._create_upcoming(current, options["months_ahead"], options["dry_run"])
+
+        if options["retain_months"] is not None:
+            self._archive_expired(
+                partitions.add_months(current, -options["retain_months"]),
+                str(options["archive_dir"]),
+                options["delete_notifications"],
+                options["dry_run"],
+            )
+
+    def _create_upcoming(self, current, months_ahead: int, dry_run: bool):
+        for offset in range(months_ahead + 1):
+            month = partitions.add_months(current, offset)
+            if dry_run:
+                self.stdout.write(f"would ensure {partitions.partition_name(month)}")
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                if partitions.ensure_month(cursor, month):
+                    self.stdout.write(f"created {partitions.partition_name(month)}")
+
+    def _archive_expired(self, cutoff, archive_dir: str, delete_notifications: bool, dry_run: bool):
+        """Archives every monthly partition that ends on or before the cutoff month."""
+        with connection.cursor() as cursor:
+            expired = [
+                (name, month)
+                for name, month in partitions.monthly_partitions(cursor)
+                if partitions.add_months(month, 1) <= cutoff
+            ]
+
+        for name, month in expired:
+            if dry_run:
+                self.stdout.write(f"would archive {name}")
+                continue
+
+            with transaction.atomic():
+                # there is no FK to enforce it, so notifications pointing at the
+                # archived logs are detached from them (or deleted) first
+                notifications = Notifications.objects.filter(
+                    transaction_log__created_at__gte=partitions.month_bound(month),
+                    transaction_log__created_at__lt=partitions.month_bound(
+                        partitions.add_months(month, 1)
+                    ),
+                )
+                if delete_notifications:
+                    recipients = set(
+                        notifications.filter(is_read=False).values_list("recipient_id", flat=True)
+                    )
+                    count, _ = notifications.delete()
+                    NotificationService.rebuild_unread_counts(user_ids=recipients)
+                    outcome = "removed"
+                else:
+                    count = NotificationService.detach_from_logs(notifications)
+                    outcome = "kept with archived_log"
+                with connection.cursor() as cursor:
+                    path = partitions.archive_partition(cursor, name, archive_dir)
+
+            self.stdout.write(f"archived {name} → {path} ({count} notification rows {outcome})")
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from services.services import DashboardCounterService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the materialized dashboard counters from the expense, top-up and "
+        "reconciliation tables and reports every bucket that has drifted. "
+        "Pass --fix to rebuild the counters table from the source tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild all counters from the source tables after reporting drift.",
+        )
+
+    def handle(self, *args, **options):
+        drift = DashboardCounterService.find_drift()
+
+        for bucket in drift:
+            self.stdout.write(
+                f"{bucket['entity_type']}:{bucket['status_code']} "
+                f"user={bucket['user_id'] or 'all'} month={bucket['month'] or 'all'} "
+                f"expected={bucket['expected'][0]} ({bucket['expected'][1]}) "
+                f"stored={bucket['stored'][0]} ({bucket['stored'][1]})"
+            )
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Dashboard counters are in sync."))
+        else:
+            self.stdout.write(self.style.WARNING(f"{len(drift)} counter bucket(s) drifted."))
+
+        if options["fix"]:
+            written = DashboardCounterService.rebuild()
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} counter row(s)."))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from services.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares every user's unread_notifications counter with a COUNT over their "
+        "unread notifications and reports the users that have drifted. "
+        "Pass --fix to recompute all counters from the notifications table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recompute every user's counter after reporting drift.",
+        )
+
+    def handle(self, *args, **options):
+        drift = NotificationService.find_unread_drift()
+
+        for user in drift:
+            self.stdout.write(
+                f"{user['email']} ({user['user_id']}): "
+                f"expected={user['expected']} stored={user['stored']}"
+            )
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Unread notification counters are in sync."))
+        else:
+            self.stdout.write(self.style.WARNING(f"{len(drift)} user counter(s) drifted."))
+
+        if options["fix"]:
+            updated = NotificationService.rebuild_unread_counts()
+            self.stdout.write(self.style.SUCCESS(f"Recomputed {updated} user counter(s)."))
@@ -0,0 +1,101 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from services.otp_email.email_service import EmailService
+from services.services import EmailOutboxService
+
+
+class Command(BaseCommand):
+    help = (
+        "Drains the email outbox: claims due rows, sends them over a pool of SMTP "
+        "connections, records delivery on the notification and retries failures "
+        "with exponential backoff."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="How many outbox rows to claim per round.",
+        )
+        parser.add_argument(
+            "--pool-size",
+            type=int,
+            default=4,
+            help="How many SMTP connections to send over in parallel.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=EmailOutboxService.MAX_ATTEMPTS,
+            help="Give up on a row and mark its notification failed after this many attempts.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the outbox has no due rows instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+
+        while True:
+            entries = EmailOutboxService.claim_batch(options["batch_size"])
+            if not entries:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            sent, failed = self._deliver(entries, options["pool_size"], options["max_attempts"])
+            total_sent += sent
+            total_failed += failed
+            self.stdout.write(f"outbox round: {sent} sent, {failed} failed")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Outbox drained: {total_sent} sent, {total_failed} failed")
+        )
+
+    def _deliver(self, entries, pool_size: int, max_attempts: int):
+        """
+        Splits the claimed entries into pool_size chunks and sends each chunk as one
+        EmailService batch (one SMTP session per chunk). All database writes happen
+        on this thread — the pool threads only render and talk SMTP.
+        """
+        pool_size = max(1, min(pool_size, len(entries)))
+        chunks = [entries[i::pool_size] for i in range(pool_size)]
+
+        sent, failed = [], []
+        with ThreadPoolExecutor(max_workers=pool_size) as pool:
+            for chunk_sent, chunk_failed in pool.map(self._send_chunk, chunks):
+                sent.extend(chunk_sent)
+                failed.extend(chunk_failed)
+
+        if sent:
+            EmailOutboxService.mark_sent(sent)
+        for entry, error in failed:
+            EmailOutboxService.mark_failed(entry, error, max_attempts=max_attempts)
+
+        return len(sent), len(failed)
+
+    @staticmethod
+    def _send_chunk(chunk):
+        """Sends one chunk of outbox entries over a single SMTP session."""
+        results = EmailService.send_notification_batch([entry.notification for entry in chunk])
+
+        sent, failed = [], []
+        for entry, result in zip(chunk, results):
+            if result["sent"]:
+                sent.append(entry)
+            else:
+                failed.append((entry, result["error"]))
+        return sent, failed
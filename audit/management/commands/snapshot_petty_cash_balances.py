@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from services.services import PettyCashLedgerService
+
+
+class Command(BaseCommand):
+    help = (
+        "Records a balance snapshot for every active petty cash account. "
+        "Run it periodically (e.g. nightly from cron) — PettyCashLedgerService.balance_as_of "
+        "starts from the latest snapshot and only sums the ledger entries after it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--account",
+            action="append",
+            dest="accounts",
+            help="Snapshot only this account id (repeatable), including inactive accounts.",
+        )
+
+    def handle(self, *args, **options):
+        created = PettyCashLedgerService.take_snapshots(account_ids=options["accounts"])
+        self.stdout.write(self.style.SUCCESS(f"Recorded {created} balance snapshot(s)."))
@@ -0,0 +1,146 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from finance.models import PettyCashAccount, PettyCashBalanceSnapshot, PettyCashLedgerEntry
+from services.services import PettyCashLedgerService
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammers one throwaway petty cash account with parallel credits and debits through "
+        "PettyCashLedgerService.record() and checks that no update was lost: the final balance, "
+        "the ledger total and the running balance chain must all agree. --compare also runs the "
+        "old read-modify-write (balance += amount; save()) under the same load to show what it loses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=8, help="Parallel writer threads.")
+        parser.add_argument("--operations", type=int, default=50, help="Balance changes per writer.")
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Also run the unlocked read-modify-write for comparison.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the stress account and its ledger instead of deleting them afterwards.",
+        )
+
+    def handle(self, *args, **options):
+        writers, operations = options["writers"], options["operations"]
+        self.stdout.write(
+            f"{writers} writers x {operations} operations on {connection.vendor}"
+        )
+
+        failed = self._run("ledger", self._ledger_write, writers, operations, options["keep"])
+        if options["compare"]:
+            self._run("read-modify-write", self._naive_write, writers, operations, options["keep"])
+
+        if failed:
+            self.stdout.write(self.style.ERROR("Ledger lost or misordered updates."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Ledger: zero lost updates."))
+
+    # every other operation is a debit, so the chain is checked in both directions
+    @staticmethod
+    def _delta(writer: int, operation: int) -> Decimal:
+        amount = Decimal(writer + 1)
+        return amount * 2 if operation % 2 == 0 else -amount
+
+    @staticmethod
+    def _ledger_write(account_id, delta: Decimal) -> None:
+        account = PettyCashAccount.objects.get(id=account_id)
+        entry_type = (
+            PettyCashLedgerEntry.EntryType.CREDIT if delta > 0 else PettyCashLedgerEntry.EntryType.DEBIT
+        )
+        PettyCashLedgerService.record(account, abs(delta), entry_type, description="stress")
+
+    @staticmethod
+    def _naive_write(account_id, delta: Decimal) -> None:
+        account = PettyCashAccount.objects.get(id=account_id)
+        account.current_balance += delta
+        account.save(update_fields=["current_balance", "updated_at"])
+
+    def _run(self, label, write, writers, operations, keep) -> bool:
+        account = PettyCashAccount.objects.create(
+            name=f"ledger stress {timezone.now():%H%M%S}",
+            description="stress_petty_cash_ledger",
+            is_active=False,  # never picked up as the organisation's account
+        )
+        applied = []
+        errors = []
+        lock = threading.Lock()
+        start = threading.Barrier(writers)
+
+        def worker(writer):
+            start.wait()
+            try:
+                for operation in range(operations):
+                    delta = self._delta(writer, operation)
+                    try:
+                        write(account.id, delta)
+                    except Exception as e:  # e.g. sqlite "database is locked"
+                        with lock:
+                            errors.append(e)
+                        continue
+                    with lock:
+                        applied.append(delta)
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            list(pool.map(worker, range(writers)))
+        elapsed = time.perf_counter() - started
+
+        expected = sum(applied, Decimal("0"))
+        account.refresh_from_db(fields=["current_balance"])
+        lost = expected - account.current_balance
+
+        self.stdout.write(f"\n{label}")
+        self.stdout.write(
+            f"  applied {len(applied)} ops in {elapsed:.2f}s ({len(applied) / elapsed:.0f}/s), "
+            f"{len(errors)} failed"
+        )
+        self.stdout.write(f"  expected balance {expected}, stored {account.current_balance}")
+        if errors:
+            self.stdout.write(f"  first error: {errors[0]}")
+
+        failed = lost != 0
+        if write == self._ledger_write:
+            failed |= self._check_ledger(account, expected, len(applied))
+        else:
+            self.stdout.write(f"  lost updates: {abs(lost)} in balance")
+
+        if not keep:
+            # the stress account's entries are not part of any real statement
+            PettyCashLedgerEntry.objects.filter(account=account).delete()
+            PettyCashBalanceSnapshot.objects.filter(account=account).delete()
+            account.delete()
+        return failed
+
+    def _check_ledger(self, account, expected, applied) -> bool:
+        entries = list(
+            PettyCashLedgerEntry.objects.filter(account=account)
+            .order_by("created_at", "id")
+            .values_list("entry_type", "amount", "balance_after")
+        )
+        running = Decimal("0")
+        breaks = 0
+        for entry_type, amount, balance_after in entries:
+            running += amount if entry_type == PettyCashLedgerEntry.EntryType.CREDIT else -amount
+            breaks += running != balance_after
+
+        as_of = PettyCashLedgerService.balance_as_of(account, timezone.now())
+        self.stdout.write(
+            f"  ledger entries {len(entries)}/{applied}, ledger total {running}, "
+            f"running balance breaks {breaks}, balance_as_of(now) {as_of}"
+        )
+        return len(entries) != applied or running != expected or breaks > 0 or as_of != expected
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from services.services import PettyCashThresholdMonitor
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks every active petty cash account against its minimum_threshold in one query "
+        "and raises an auto top-up for each account below it that has no pending top-up. "
+        "Debits already trigger the check per account; run this periodically as a backstop."
+    )
+
+    def handle(self, *args, **options):
+        topups = PettyCashThresholdMonitor.sweep()
+
+        for topup in topups:
+            self.stdout.write(
+                f"{topup.pettycash_account.name}: auto top-up of {topup.amount} ({topup.id})"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Raised {len(topups)} auto top-up(s)."))
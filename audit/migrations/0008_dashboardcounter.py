@@ -0,0 +1,97 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:17
+
+import datetime
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+# entity model -> (owner FK attname, amount field or None)
+TRACKED_ENTITIES = {
+    "ExpenseRequest": ("employee_id", "amount"),
+    "TopUpRequest": ("requested_by_id", "amount"),
+    "DisbursementReconciliation": ("submitted_by_id", None),
+}
+
+
+def backfill_counters(apps, schema_editor):
+    """Seed the counters from existing rows so the dashboard is correct right after migrating."""
+    DashboardCounter = apps.get_model("audit", "DashboardCounter")
+    buckets = {}
+
+    for entity_type, (owner_field, amount_field) in TRACKED_ENTITIES.items():
+        model = apps.get_model("finance", entity_type)
+        totals = {"row_count": Count("id")}
+        if amount_field:
+            totals["row_amount"] = Sum(amount_field)
+
+        rows = (
+            model.objects.filter(is_active=True, status__isnull=False)
+            .annotate(bucket_month=TruncMonth("created_at", tzinfo=datetime.timezone.utc))
+            .values("status__code", owner_field, "bucket_month")
+            .annotate(**totals)
+        )
+        for row in rows:
+            month = row["bucket_month"].date()
+            amount = Decimal(str(row.get("row_amount") or 0))
+            for user_id, bucket_month in (
+                (row[owner_field], month),
+                (row[owner_field], None),
+                (None, month),
+                (None, None),
+            ):
+                key = (entity_type, row["status__code"], user_id, bucket_month)
+                count, total = buckets.get(key, (0, Decimal("0")))
+                buckets[key] = (count + row["row_count"], total + amount)
+
+    DashboardCounter.objects.bulk_create(
+        [
+            DashboardCounter(
+                entity_type=entity_type,
+                status_code=status_code,
+                user_id=user_id,
+                month=month,
+                count=count,
+                total_amount=total,
+            )
+            for (entity_type, status_code, user_id, month), (count, total) in buckets.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0007_notifications_is_active_transactionlogbase_is_active'),
+        ('finance', '0013_remove_disbursementreconciliation_total_amount_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date created')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Date modified')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('entity_type', models.CharField(max_length=50, verbose_name='Entity Type')),
+                ('status_code', models.CharField(max_length=20, verbose_name='Status Code')),
+                ('month', models.DateField(blank=True, null=True, verbose_name='Month')),
+                ('count', models.IntegerField(default=0, verbose_name='Count')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='Total Amount')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_counters', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Dashboard Counter',
+                'verbose_name_plural': 'Dashboard Counters',
+                'db_table': 'dashboard_counters',
+                'constraints': [models.UniqueConstraint(fields=('entity_type', 'status_code', 'user', 'month'), name='unique_dashboard_counter_bucket', nulls_distinct=False)],
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:27
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0009_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transactionlogbase',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Created At'),
+        ),
+    ]
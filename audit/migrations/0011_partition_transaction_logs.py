@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from audit.partitions import convert_to_partitioned
+
+
+def partition_transaction_logs(apps, schema_editor):
+    # declarative partitioning is PostgreSQL only — other backends keep the plain table
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        convert_to_partitioned(cursor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0010_transaction_log_created_at_default'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notifications',
+            name='transaction_log',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.PROTECT, related_name='notifications', to='audit.transactionlogbase'),
+        ),
+        migrations.RunPython(partition_transaction_logs),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0011_partition_transaction_logs'),
+        ('base', '0005_category_is_active_status_is_active'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notifications',
+            index=models.Index(fields=['recipient', '-created_at', '-id'], name='notif_recipient_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notifications',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient', '-created_at'], name='notif_recipient_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionlogbase',
+            index=models.Index(fields=['event_type', 'created_at'], name='txlog_event_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionlogbase',
+            index=models.Index(fields=['triggered_by', '-created_at'], name='txlog_trigger_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.2 on 2026-10-17 07:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0012_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notifications',
+            name='archived_log',
+            field=models.JSONField(blank=True, null=True, verbose_name='Archived log'),
+        ),
+        migrations.AlterField(
+            model_name='notifications',
+            name='transaction_log',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='notifications', to='audit.transactionlogbase'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from base.models import GenericBaseModel, BaseModel, Status, Category
 from users.models import User
@@ -73,7 +74,10 @@ class TransactionLogBase(BaseModel):
     entity_id = models.CharField(
         max_length=100, blank=True, verbose_name=_("Entity ID")
     )
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created At"))
+    # set at log() time rather than INSERT time so deferred (bulk) writes keep event order
+    created_at = models.DateTimeField(
+        default=timezone.now, editable=False, verbose_name=_("Created At")
+    )
 
     # USAGE:
     # log.event_type.code          → "expense_approved"
@@ -90,6 +94,10 @@ class TransactionLogBase(BaseModel):
         indexes = [
             models.Index(fields=["entity_type", "entity_id"]),
             models.Index(fields=["triggered_by"]),
+            # dashboard approval summary: event_type IN (...) AND created_at >= month_start
+            models.Index(fields=["event_type", "created_at"], name="txlog_event_created_idx"),
+            # dashboard recent activities: triggered_by = user ORDER BY created_at DESC
+            models.Index(fields=["triggered_by", "-created_at"], name="txlog_trigger_recent_idx"),
         ]
 
     def __str__(self):
@@ -103,7 +111,15 @@ class Notifications(BaseModel):
         TransactionLogBase,
         on_delete=models.PROTECT,  # You cannot delete a log if notifications reference it
         related_name="notifications",  # → log.notifications.all()
+        # transaction_logs is partitioned on PostgreSQL (see audit.partitions) and its
+        # primary key there is (id, created_at), so no database FK can point at id alone
+        db_constraint=False,
+        # cleared when manage_log_partitions archives the log — see archived_log
+        null=True,
+        blank=True,
     )
+    # the log fields a notification displays, copied here before its log is archived
+    archived_log = models.JSONField(null=True, blank=True, verbose_name=_("Archived log"))
 
     recipient = models.ForeignKey(
         User,
@@ -125,6 +141,23 @@ class Notifications(BaseModel):
     is_read = models.BooleanField(default=False, verbose_name=_("Is read"))
     read_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Read at"))
 
+    class DeliveryStatus(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        SENT = "sent", _("Sent")
+        FAILED = "failed", _("Failed")
+
+    # only set for channels delivered out of band (email) — updated by the outbox worker
+    delivery_status = models.CharField(
+        max_length=20,
+        choices=DeliveryStatus,
+        null=True,
+        blank=True,
+        verbose_name=_("Delivery status"),
+    )
+    delivered_at = models.DateTimeField(
+        null=True, blank=True, verbose_name=_("Delivered at")
+    )
+
     # USAGE:
     # user.notifications.filter(is_read=False)
     #     .select_related("transaction_log__event_type",
@@ -142,8 +175,12 @@ class Notifications(BaseModel):
         super().save(*args, **kwargs)
 
     def __str__(self):
-        event = self.transaction_log.event_type.name
-        entity = self.transaction_log.entity_id or "N/A"
+        if self.transaction_log_id is None:
+            event = (self.archived_log or {}).get("event_name")
+            entity = (self.archived_log or {}).get("entity_id") or "N/A"
+        else:
+            event = self.transaction_log.event_type.name
+            entity = self.transaction_log.entity_id or "N/A"
         status = "Read" if self.is_read else "Unread"
 
         return f"{self.recipient.email} | {event} | Entity: {entity} | {status}"
@@ -151,4 +188,99 @@ class Notifications(BaseModel):
     class Meta:
         db_table = "notifications"
         ordering = ["-created_at"]
-        indexes = [models.Index(fields=["is_read", "recipient", "transaction_log"])]
+        indexes = [
+            models.Index(fields=["is_read", "recipient", "transaction_log"]),
+            # inbox listing: recipient = user ORDER BY created_at DESC, id DESC
+            models.Index(fields=["recipient", "-created_at", "-id"], name="notif_recipient_recent_idx"),
+            # unread badge count and mark-all-as-read: recipient = user AND NOT is_read
+            models.Index(
+                fields=["recipient", "-created_at"],
+                condition=Q(is_read=False),
+                name="notif_recipient_unread_idx",
+            ),
+        ]
+
+
+class EmailOutbox(BaseModel):
+    """
+    Durable queue of notification emails.
+    Rows are written in the same transaction as the Notifications they deliver,
+    so a slow or failing SMTP server can never hold workflow row locks or roll
+    back an approval. Drained by the send_outbox_emails management command.
+    """
+
+    notification = models.ForeignKey(
+        Notifications,
+        on_delete=models.CASCADE,
+        related_name="outbox_entries",  # → notification.outbox_entries.all()
+        verbose_name=_("Notification"),
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Notifications.DeliveryStatus,
+        default=Notifications.DeliveryStatus.PENDING,
+        verbose_name=_("Status"),
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name=_("Attempts"))
+    # when the row next becomes eligible — doubles as the worker's claim lease
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name=_("Next attempt at")
+    )
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Sent at"))
+    last_error = models.TextField(blank=True, verbose_name=_("Last error"))
+
+    class Meta:
+        db_table = "email_outbox"
+        verbose_name = _("Email Outbox")
+        verbose_name_plural = _("Email Outbox")
+        ordering = ["next_attempt_at"]
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self):
+        return f"{self.notification_id} | {self.status} | attempts: {self.attempts}"
+
+
+class DashboardCounter(BaseModel):
+    """
+    Materialized dashboard count for one (entity_type, status_code) bucket.
+    Maintained incrementally by DashboardCounterService on every workflow
+    transition and rebuilt from the source tables by reconcile_dashboard_counters.
+
+    A null user means "all users" and a null month means "all time", so one
+    transition touches four rows: (user, month), (user, all), (all, month), (all, all).
+    """
+
+    entity_type = models.CharField(max_length=50, verbose_name=_("Entity Type"))
+    status_code = models.CharField(max_length=20, verbose_name=_("Status Code"))
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="dashboard_counters",
+        verbose_name=_("User"),
+    )
+    month = models.DateField(null=True, blank=True, verbose_name=_("Month"))
+    count = models.IntegerField(default=0, verbose_name=_("Count"))
+    total_amount = models.DecimalField(
+        max_digits=15, decimal_places=2, default=0, verbose_name=_("Total Amount")
+    )
+
+    # USAGE:
+    # DashboardCounter.objects.get(entity_type="ExpenseRequest", status_code="pending",
+    #                              user=None, month=None).count  → all pending expenses
+
+    class Meta:
+        db_table = "dashboard_counters"
+        verbose_name = _("Dashboard Counter")
+        verbose_name_plural = _("Dashboard Counters")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entity_type", "status_code", "user", "month"],
+                nulls_distinct=False,
+                name="unique_dashboard_counter_bucket",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.entity_type}:{self.status_code} = {self.count}"
@@ -0,0 +1,179 @@
+"""
+PostgreSQL monthly range partitioning of transaction_logs on created_at.
+
+    transaction_logs            partitioned parent, PRIMARY KEY (id, created_at)
+    transaction_logs_p202601    FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')
+    ...
+    transaction_logs_default    catches rows outside every monthly partition
+
+Queries filtering on created_at (the dashboard's created_at__gte=month_start)
+are pruned to the matching partitions. A partitioned table's unique
+constraints must include the partition key, so id alone is no longer unique
+in the database — Notifications.transaction_log is therefore db_constraint=False.
+Before a partition is archived its notifications are detached from their logs
+(NotificationService.detach_from_logs), so users keep them.
+
+Used by migration audit 0011 (one-off conversion) and the
+manage_log_partitions command (future partitions, retention, archival).
+Everything here is PostgreSQL only; callers check connection.vendor first.
+"""
+
+import datetime
+import gzip
+import os
+import re
+
+TABLE = "transaction_logs"
+DEFAULT_PARTITION = f"{TABLE}_default"
+_PARTITION_NAME = re.compile(rf"^{TABLE}_p(\d{{4}})(\d{{2}})$")
+
+
+def month_start(value) -> datetime.date:
+    return datetime.date(value.year, value.month, 1)
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def month_bound(month: datetime.date) -> datetime.datetime:
+    # partition bounds are UTC midnights
+    return datetime.datetime(month.year, month.month, 1, tzinfo=datetime.timezone.utc)
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def is_partitioned(cursor) -> bool:
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s)",
+        [TABLE],
+    )
+    return cursor.fetchone()[0]
+
+
+def monthly_partitions(cursor) -> list:
+    """Returns [(name, month)] of the attached monthly partitions, oldest first."""
+    cursor.execute(
+        "SELECT child.relname FROM pg_inherits i "
+        "JOIN pg_class parent ON parent.oid = i.inhparent "
+        "JOIN pg_class child ON child.oid = i.inhrelid "
+        "WHERE parent.relname = %s",
+        [TABLE],
+    )
+    partitions = []
+    for (name,) in cursor.fetchall():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions.append((name, datetime.date(int(match[1]), int(match[2]), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def ensure_month(cursor, month: datetime.date) -> bool:
+    """
+    Creates the partition for one month if it does not exist yet.
+    Rows for that month that already landed in the default partition are moved
+    into it first — ATTACH refuses while the default partition holds them.
+
+    Returns:
+        bool: True if a partition was created.
+    """
+    name = partition_name(month)
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+    if cursor.fetchone()[0]:
+        return False
+
+    start, end = month, add_months(month, 1)
+    cursor.execute(f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS)')
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+        f"WHERE created_at >= %s AND created_at < %s RETURNING *) "
+        f'INSERT INTO "{name}" SELECT * FROM moved',
+        [start, end],
+    )
+    cursor.execute(
+        f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" FOR VALUES FROM (%s) TO (%s)',
+        [start, end],
+    )
+    return True
+
+
+def convert_to_partitioned(cursor, months_ahead: int = 3) -> None:
+    """
+    Rebuilds transaction_logs as a partitioned table, keeping its rows, index
+    names (transaction_entity__b4020c_idx, transaction_trigger_d2b13d_idx) and
+    foreign keys. Runs inside the migration's transaction.
+    """
+    if is_partitioned(cursor):
+        return
+
+    # everything except the primary key / unique(id), which cannot survive partitioning
+    cursor.execute(
+        "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+        "JOIN pg_class t ON t.oid = i.indrelid "
+        "WHERE t.relname = %s AND NOT i.indisprimary AND NOT i.indisunique",
+        [TABLE],
+    )
+    index_definitions = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT c.conname, pg_get_constraintdef(c.oid) FROM pg_constraint c "
+        "JOIN pg_class t ON t.oid = c.conrelid "
+        "WHERE t.relname = %s AND c.contype = 'f'",
+        [TABLE],
+    )
+    foreign_keys = cursor.fetchall()
+
+    staging = f"{TABLE}_partitioned"
+    cursor.execute(
+        f'CREATE TABLE "{staging}" (LIKE "{TABLE}" INCLUDING DEFAULTS) '
+        f"PARTITION BY RANGE (created_at)"
+    )
+    cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{staging}" DEFAULT')
+
+    cursor.execute(f'SELECT MIN(created_at) FROM "{TABLE}"')
+    oldest = cursor.fetchone()[0]
+    current = month_start(datetime.datetime.now(datetime.timezone.utc))
+    month = month_start(oldest) if oldest else current
+    while month <= add_months(current, months_ahead):
+        name = partition_name(month)
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{staging}" FOR VALUES FROM (%s) TO (%s)',
+            [month, add_months(month, 1)],
+        )
+        month = add_months(month, 1)
+
+    cursor.execute(f'INSERT INTO "{staging}" SELECT * FROM "{TABLE}"')
+    # no CASCADE: Notifications' FK was dropped by the migration, and anything else
+    # still referencing the table should stop the conversion rather than lose its FK
+    cursor.execute(f'DROP TABLE "{TABLE}"')
+    cursor.execute(f'ALTER TABLE "{staging}" RENAME TO "{TABLE}"')
+    cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id, created_at)')
+
+    for definition in index_definitions:
+        cursor.execute(definition)
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def archive_partition(cursor, name: str, archive_dir: str) -> str:
+    """
+    Detaches a monthly partition, writes its rows to <archive_dir>/<name>.csv.gz
+    (COPY ... CSV HEADER) and drops it.
+
+    Returns:
+        str: Path of the archive file.
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{name}.csv.gz")
+
+    cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{name}"')
+    with gzip.open(path, "wb") as archive:
+        # the psycopg cursor under Django's wrapper streams COPY output block by block
+        with cursor.cursor.copy(f'COPY "{name}" TO STDOUT WITH CSV HEADER') as copy:
+            for block in copy:
+                archive.write(block)
+    cursor.execute(f'DROP TABLE "{name}"')
+    return path
@@ -0,0 +1,45 @@
+from services.services import TransactionLogService
+from utils.response_provider import ResponseProvider
+
+
+class AuditLogController:
+
+    @classmethod
+    def export_logs(cls, request):
+        """
+        Streams the full audit trail, newest first.
+        The log table is the largest in the system, so rows are encoded as they are
+        read instead of being loaded into one JSON response.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            StreamingHttpResponse: 200 with every serialized transaction log.
+        """
+        try:
+            return ResponseProvider.stream(
+                TransactionLogService.get_all_logs(), cls._serialize, request=request
+            )
+        except Exception as ex:
+            return ResponseProvider.handle_exception(ex)
+
+    @staticmethod
+    def _serialize(log) -> dict:
+        """
+        Converting a TransactionLogBase model → JSON-safe dictionary.
+        event_type, triggered_by and status are expected to be select_related.
+        """
+        return {
+            "id": str(log.id),
+            "created_at": log.created_at.isoformat(),
+            "event_code": log.event_type.code,
+            "event_name": log.event_type.name,
+            "message": log.event_message,
+            "status": log.status.name,
+            "triggered_by": log.triggered_by.email if log.triggered_by else "System",
+            "entity_type": log.entity_type,
+            "entity_id": log.entity_id,
+            "ip_address": log.user_ip_address,
+            "metadata": log.metadata,
+        }
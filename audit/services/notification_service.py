@@ -1,26 +1,36 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+
 from services.services import NotificationService
+from services.unread_count_broker import UnreadCountBroker
 from utils.response_provider import ResponseProvider
+from utils.pagination import CursorPaginator
 
 class NotificationController:
 
     @classmethod
     def get_my_notifications(cls, request):
         """
-        Retrieves all notifications for the authenticated user ordered by
-        most recent first, with full transaction log context pre-fetched.
+        Retrieves one page of the authenticated user's notifications, most
+        recent first, with full transaction log context pre-fetched.
 
         Args:
-            request: The HTTP request object.
+            request: The HTTP request object. Reads the limit/cursor query params.
 
         Returns:
-            JsonResponse: 200 with list of serialized notifications.
+            JsonResponse: 200 with a page of serialized notifications and next_cursor.
         """
         try:
-            notifications = NotificationService().list_auth_user_notifications(
-                auth_user=request.user.id
+            notifications, next_cursor = CursorPaginator.from_request(request).paginate(
+                NotificationService().list_auth_user_notifications(auth_user=request.user.id)
             )
-            return ResponseProvider.success(
-                data=[cls._serialize(n) for n in notifications]
+            return ResponseProvider.paginated(
+                data=[cls._serialize(n) for n in notifications],
+                next_cursor=next_cursor,
             )
         except Exception as ex:
             return ResponseProvider.handle_exception(ex)
@@ -43,6 +53,127 @@ class NotificationController:
         except Exception as ex:
             return ResponseProvider.handle_exception(ex)
 
+    @classmethod
+    async def aget_my_notifications(cls, request):
+        """
+        Async get_my_notifications() for the ASGI notification list view.
+
+        Args:
+            request: The HTTP request object. Reads the limit/cursor query params.
+
+        Returns:
+            JsonResponse: 200 with a page of serialized notifications and next_cursor.
+        """
+        try:
+            notifications, next_cursor = await CursorPaginator.from_request(request).apaginate(
+                NotificationService().list_auth_user_notifications(auth_user=request.user.id)
+            )
+            return ResponseProvider.paginated(
+                data=[cls._serialize(n) for n in notifications],
+                next_cursor=next_cursor,
+            )
+        except Exception as ex:
+            return ResponseProvider.handle_exception(ex)
+
+    @classmethod
+    async def aget_unread_count(cls, request):
+        """
+        Async get_unread_count() — the badge poll, served without a thread per request.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            JsonResponse: 200 with unread count.
+        """
+        try:
+            count = await NotificationService().aget_unread_count(auth_user=request.user.id)
+            return ResponseProvider.success(data={"unread_count": count})
+        except Exception as ex:
+            return ResponseProvider.handle_exception(ex)
+
+    @classmethod
+    async def stream_unread_count(cls, request):
+        """
+        Server-Sent Events stream of the authenticated user's unread count.
+
+        Sends the count on connect and again whenever UnreadCountBroker reports
+        a change (notify / notify_many / mark as read), instead of the client
+        polling get_unread_count. Comment frames keep idle proxies from closing
+        the connection; after SSE_STREAM_SECONDS the stream ends and the client
+        reconnects (EventSource does so automatically, using the retry hint).
+
+        No database connection is held while the stream is idle: each count
+        opens one on a shared executor thread and closes it again.
+
+        Only under ASGI does the stream stay open. Under WSGI (the default
+        gthread workers) Django drains an async body with async_to_sync, so the
+        client would get nothing for SSE_STREAM_SECONDS while a worker thread
+        sat blocked. There the response is a single count event with a retry
+        hint of SSE_HEARTBEAT_SECONDS, and EventSource falls back to polling at
+        that interval.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            StreamingHttpResponse: text/event-stream of "unread_count" events.
+        """
+        user_id = request.user.id
+        duration = getattr(settings, "SSE_STREAM_SECONDS", 300)
+        heartbeat = getattr(settings, "SSE_HEARTBEAT_SECONDS", 15)
+
+        if not isinstance(request, ASGIRequest):
+            count = await sync_to_async(NotificationService().get_unread_count)(auth_user=user_id)
+            return ResponseProvider.event_stream(
+                [
+                    f"retry: {heartbeat * 1000}\n\n",
+                    ResponseProvider.sse_frame("unread_count", {"unread_count": count}),
+                ]
+            )
+
+        # login_required may have opened a connection on this request's thread
+        await sync_to_async(connections.close_all)()
+
+        async def events():
+            # subscribe before the first count so no change can slip in between
+            subscription = UnreadCountBroker.subscribe(user_id)
+            try:
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + duration
+                yield f"retry: {heartbeat * 1000}\n\n"
+
+                last = await cls._count_unread(user_id)
+                yield ResponseProvider.sse_frame("unread_count", {"unread_count": last})
+
+                while (remaining := deadline - loop.time()) > 0:
+                    try:
+                        await asyncio.wait_for(
+                            subscription.queue.get(), timeout=min(heartbeat, remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+                        continue
+
+                    count = await cls._count_unread(user_id)
+                    if count != last:
+                        last = count
+                        yield ResponseProvider.sse_frame("unread_count", {"unread_count": count})
+            finally:
+                UnreadCountBroker.unsubscribe(subscription)
+
+        return ResponseProvider.event_stream(events())
+
+    @staticmethod
+    async def _count_unread(user_id) -> int:
+        def count():
+            try:
+                return NotificationService().get_unread_count(auth_user=user_id)
+            finally:
+                connections.close_all()
+
+        return await sync_to_async(count, thread_sensitive=False)()
+
     @classmethod
     def mark_notification_as_read(cls, request, notification_id: str):
         """
@@ -104,16 +235,15 @@ class NotificationController:
             "is_read": notification.is_read,
             "read_at": notification.read_at.isoformat() if notification.read_at else None,
             "created_at": notification.created_at.isoformat(),
-            # transaction log fields
-            "message": log.event_message,
-            "entity_type": log.entity_type,
-            "entity_id": log.entity_id,
-            # sender — who triggered the event
-            "sender": log.triggered_by.email if log.triggered_by else "System",
-            # event fields
-            "event_code": log.event_type.code,
-            "event_name": log.event_type.name,
-            "event_category": log.event_type.event_category.name,
-            # log status
-            "log_status": log.status.name,
+            # transaction log fields — message, entity, sender, event and log status;
+            # read from archived_log once manage_log_partitions has archived the log
+            **(
+                NotificationService.log_fields(log)
+                if log is not None
+                else {
+                    key: value
+                    for key, value in (notification.archived_log or {}).items()
+                    if key not in ("log_id", "log_created_at")
+                }
+            ),
         }
\ No newline at end of file
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from audit.models import EventTypes
+from services.lookup_registry import LookupRegistry
+
+
+@receiver([post_save, post_delete], sender=EventTypes)
+def invalidate_lookup_registry(sender, **kwargs):
+    """Admin edits to event types must not be served stale from the registry."""
+    LookupRegistry.invalidate(sender)
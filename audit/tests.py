@@ -1,3 +1,771 @@
-from django.test import TestCase
+import base64
+import datetime
+import json
+import tempfile
+import uuid
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from audit import partitions
+from audit.models import EmailOutbox, EventTypes, Notifications, TransactionLogBase
+from audit.services.notification_service import NotificationController
+from authenticate.services.token_service import TokenService
+from base.models import Category, Status
+from finance.models import DisbursementReconciliation
+from services.audit_writer import DeferredAuditWriter, _AuditBuffer
+from services.lookup_registry import LookupRegistry
+from services.otp_email.email_service import EmailService
+from services.otp_email.template_cache import TemplateCache
+from services.services import (
+    DashboardCounterService,
+    DashboardService,
+    EmailOutboxService,
+    ExpenseRequestService,
+    NotificationService,
+    TransactionLogService,
+)
+from users.models import User
+from utils.pagination import CursorPaginator
+from utils.response_provider import ResponseProvider
+from utils.testing import QueryPlanTestCase, auth_headers, create_user
+
+
+class AuditQueryPlanTests(QueryPlanTestCase):
+    """Notification and transaction log reads use their indexes."""
+
+    @classmethod
+    def seed(cls, rows=300):
+        category, _ = Category.objects.get_or_create(code="expense", defaults={"name": "Expense"})
+        status, _ = Status.objects.get_or_create(code="ACT", defaults={"name": "Active"})
+        events = [
+            EventTypes.objects.get_or_create(
+                code=code, defaults={"name": code, "event_category": category}
+            )[0]
+            for code in ("expense_approved", "expense_rejected", "expense_submitted")
+        ]
+        users = [create_user(f"plan-{i}@test.local", "EMP") for i in range(10)]
+        cls.employee, cls.officer = users[0], users[1]
+        now = timezone.now()
+
+        logs = TransactionLogBase.objects.bulk_create(
+            [
+                TransactionLogBase(
+                    event_type=events[i % 3],
+                    status=status,
+                    triggered_by=users[i % len(users)],
+                    entity_type="ExpenseRequest",
+                    entity_id=str(i),
+                    created_at=now - datetime.timedelta(days=i % 90),
+                )
+                for i in range(rows)
+            ]
+        )
+        Notifications.objects.bulk_create(
+            [
+                Notifications(
+                    transaction_log=logs[i],
+                    recipient=users[i % len(users)],
+                    is_read=i % 4 != 0,
+                )
+                for i in range(rows)
+            ]
+        )
+
+    def test_inbox_listing_uses_recipient_recent_index(self):
+        self.assertUsesIndex(
+            NotificationService()
+            .list_auth_user_notifications(auth_user=self.officer)
+            .order_by("-created_at", "-id")[:26],
+            "notif_recipient_recent_idx",
+        )
+
+    def test_unread_recount_uses_partial_unread_index(self):
+        # update() and the counter subquery drop the default ordering
+        self.assertUsesIndex(
+            Notifications.objects.filter(recipient=self.officer, is_read=False).order_by(),
+            "notif_recipient_unread_idx",
+        )
+
+    def test_approval_summary_uses_event_created_index(self):
+        month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        self.assertUsesIndex(
+            TransactionLogBase.objects.filter(
+                created_at__gte=month_start,
+                event_type__code__in=("expense_approved", "expense_rejected"),
+            ),
+            "txlog_event_created_idx",
+        )
+
+    def test_recent_activities_uses_trigger_recent_index(self):
+        self.assertUsesIndex(
+            TransactionLogBase.objects.filter(triggered_by=self.employee).order_by("-created_at")[:5],
+            "txlog_trigger_recent_idx",
+        )
+
+
+class DashboardQueryBudgetTests(TestCase):
+    """
+    Fails when the dashboard view issues more queries than
+    DashboardService.QUERY_BUDGET, so a new N+1 or an extra section query
+    is caught in CI rather than in production.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+        request = RequestFactory().post("/")
+        request.user = cls.employee
+        for i in range(3):
+            ExpenseRequestService().create(
+                request, f"Expense {i}", "0700000000", "", 100 + i, cls.employee, "disbursement"
+            )
+
+    def setUp(self):
+        # lookups and user snapshots cached by another test point at rolled-back rows
+        LookupRegistry.invalidate()
+        cache.clear()
+
+    def assert_within_budget(self, user):
+        headers = {"Authorization": f"Bearer {TokenService.generate_access_token(user)}"}
+        # the first request warms the user snapshot and the lookup registry
+        self.client.get(reverse("dashboard"), headers=headers)
+
+        with self.assertNumQueries(DashboardService.QUERY_BUDGET):
+            response = self.client.get(reverse("dashboard"), headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_employee_dashboard_within_query_budget(self):
+        self.assert_within_budget(self.employee)
+
+    def test_finance_officer_dashboard_within_query_budget(self):
+        self.assert_within_budget(self.officer)
+
+
+class UnreadCountStreamTests(TestCase):
+    """Under WSGI the unread count stream answers at once instead of holding a worker thread."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        cache.clear()
+
+    @override_settings(SSE_HEARTBEAT_SECONDS=15)
+    def test_wsgi_request_gets_one_event_and_a_retry_hint(self):
+        log = TransactionLogService.log(
+            event_code="expense_submitted",
+            triggered_by=self.employee,
+            entity=self.employee,
+            message="Expense submitted",
+        )
+        NotificationService.notify(log, self.officer)
+        headers = {"Authorization": f"Bearer {TokenService.generate_access_token(self.officer)}"}
+
+        response = self.client.get(reverse("stream-unread-count"), headers=headers)
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(
+            b"".join(response.streaming_content).decode(),
+            'retry: 15000\n\nevent: unread_count\ndata: {"unread_count": 1}\n\n',
+        )
+
+
+class ExportStreamTests(TestCase):
+    """Streamed exports keep the usual envelope and flag an interrupted body in its tail."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.cfo = create_user("cfo@test.local", "CFO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        cache.clear()
+
+    def test_export_is_one_data_envelope(self):
+        logs = [
+            TransactionLogService.log(
+                event_code="expense_submitted",
+                triggered_by=self.employee,
+                entity=self.employee,
+                message=f"Expense {i}",
+            )
+            for i in range(3)
+        ]
+
+        response = self.client.get(reverse("export-audit-logs"), headers=auth_headers(self.cfo))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        body = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(set(body), {"data", "success", "code", "message", "error"})
+        self.assertTrue(body["success"])
+        self.assertEqual(body["code"], "200.00")
+        self.assertEqual(body["error"], "")
+        self.assertCountEqual([row["id"] for row in body["data"]], [str(log.id) for log in logs])
+
+    def test_failure_mid_stream_ends_with_error_tail(self):
+        def serialize(row):
+            if row == 3:
+                raise ValueError("row 3 is broken")
+            return {"n": row}
+
+        response = ResponseProvider.stream([1, 2, 3, 4], serialize, chunk_size=2)
+
+        body = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(body["data"], [{"n": 1}, {"n": 2}])
+        self.assertFalse(body["success"])
+        self.assertEqual(body["code"], "500.000")
+        self.assertEqual(body["message"], "Export interrupted")
+        self.assertEqual(body["error"], "row 3 is broken")
+
+    def test_asgi_request_streams_without_buffering(self):
+        serialized = []
+
+        def serialize(row):
+            serialized.append(row)
+            return {"n": row}
+
+        response = ResponseProvider.stream(
+            range(10), serialize, chunk_size=2, request=AsyncRequestFactory().get("/")
+        )
+        self.assertTrue(response.is_async)
+
+        async def first_chunks(count):
+            chunks = []
+            async for chunk in response.streaming_content:
+                chunks.append(chunk)
+                if len(chunks) == count:
+                    break
+            return chunks
+
+        chunks = async_to_sync(first_chunks)(2)
+
+        self.assertEqual(b"".join(chunks), b'{"data": [{"n": 0},{"n": 1}')
+        self.assertEqual(serialized, [0, 1])
+
+
+class CursorPaginationTests(TestCase):
+    """Keyset pages cover every row exactly once and bad input is a 400, not a 500."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        cache.clear()
+
+    def notify(self, count, same_time=True):
+        for i in range(count):
+            log = TransactionLogService.log(
+                event_code="expense_submitted",
+                triggered_by=self.employee,
+                entity=self.employee,
+                message=f"Expense {i}",
+            )
+            NotificationService.notify(log, self.officer)
+        notifications = Notifications.objects.filter(recipient=self.officer)
+        if same_time:
+            notifications.update(created_at=timezone.now())
+        return notifications
+
+    def pages(self, queryset, limit):
+        pages, cursor = [], None
+        while True:
+            rows, cursor = CursorPaginator(cursor=cursor, limit=limit).paginate(queryset)
+            pages.append([row.id for row in rows])
+            if cursor is None:
+                return pages
+
+    def test_ties_on_created_at_are_broken_by_id(self):
+        notifications = self.notify(7)
+
+        pages = self.pages(notifications, limit=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(
+            [row_id for page in pages for row_id in page],
+            sorted(notifications.values_list("id", flat=True), reverse=True),
+        )
+
+    def test_last_full_page_has_no_next_cursor(self):
+        notifications = self.notify(6, same_time=False)
+
+        pages = self.pages(notifications, limit=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3])
+
+    @override_settings(PAGINATION_DEFAULT_LIMIT=4, PAGINATION_MAX_LIMIT=10)
+    def test_limit_is_clamped(self):
+        self.assertEqual(CursorPaginator().limit, 4)
+        self.assertEqual(CursorPaginator(limit="").limit, 4)
+        self.assertEqual(CursorPaginator(limit="7").limit, 7)
+        self.assertEqual(CursorPaginator(limit="500").limit, 10)
+        for limit in ("0", "-3", "ten"):
+            with self.subTest(limit=limit), self.assertRaises(ValueError):
+                CursorPaginator(limit=limit)
+
+    def test_bad_cursor_or_limit_is_a_400_envelope(self):
+        def token(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+        self.notify(2)
+        valid = CursorPaginator.encode_cursor(Notifications.objects.first())
+        queries = [
+            {"cursor": "not a cursor"},
+            {"cursor": valid[:-3]},
+            {"cursor": token([])},
+            {"cursor": token({"c": "yesterday", "i": str(uuid.uuid4())})},
+            {"cursor": token({"c": "2026-01-01T00:00:00+00:00", "i": 123})},
+            {"limit": "lots"},
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                response = self.client.get(
+                    reverse("list-my-notifications"), query, headers=auth_headers(self.officer)
+                )
+
+                self.assertEqual(response.status_code, 400)
+                body = response.json()
+                self.assertFalse(body["success"])
+                self.assertEqual(body["code"], "400.000")
+
+
+class UnreadCounterTests(TestCase):
+    """The denormalized unread counter follows notify and mark-as-read exactly once per change."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+
+    def notify(self):
+        log = TransactionLogService.log(
+            event_code="expense_submitted",
+            triggered_by=self.employee,
+            entity=self.employee,
+            message="Expense submitted",
+        )
+        return NotificationService.notify(log, self.officer)
+
+    def unread(self, user):
+        user.refresh_from_db(fields=["unread_notifications"])
+        return user.unread_notifications
+
+    def test_notify_increments_and_mark_as_read_decrements(self):
+        first, second = self.notify(), self.notify()
+        self.assertEqual(self.unread(self.officer), 2)
+
+        with mock.patch("services.services.UnreadCountBroker.publish") as publish:
+            NotificationService().mark_as_read(first.id, self.officer)
+
+        self.assertEqual(self.unread(self.officer), 1)
+        publish.assert_called_once_with([self.officer.id])
+
+    def test_concurrent_marks_decrement_once(self):
+        notification = self.notify()
+        # both requests loaded the notification while it was still unread
+        stale = Notifications.objects.get(id=notification.id)
+        NotificationService().mark_as_read(notification.id, self.officer)
+
+        with (
+            mock.patch.object(NotificationService.manager, "get", return_value=stale),
+            mock.patch("services.services.UnreadCountBroker.publish") as publish,
+        ):
+            NotificationService().mark_as_read(notification.id, self.officer)
+
+        self.assertEqual(self.unread(self.officer), 0)
+        publish.assert_not_called()
+
+    def test_mark_all_as_read_decrements_by_the_rows_changed(self):
+        for _ in range(3):
+            self.notify()
+
+        with mock.patch("services.services.UnreadCountBroker.publish") as publish:
+            self.assertEqual(NotificationService().get_mark_all_as_read(self.officer), 3)
+            self.assertEqual(NotificationService().get_mark_all_as_read(self.officer), 0)
+
+        self.assertEqual(self.unread(self.officer), 0)
+        publish.assert_called_once_with([self.officer.id])
+
+    def test_adjust_groups_deltas_and_floors_at_zero(self):
+        User.objects.filter(id=self.officer.id).update(unread_notifications=1)
+        admin = create_user("admin@test.local", "ADM")
+
+        with self.assertNumQueries(2):
+            NotificationService.adjust_unread_counts(
+                {self.officer.id: -3, self.employee.id: 2, admin.id: 2}
+            )
+
+        self.assertEqual(self.unread(self.officer), 0)
+        self.assertEqual(self.unread(self.employee), 2)
+        self.assertEqual(self.unread(admin), 2)
+
+
+class DashboardCounterLockOrderTests(TestCase):
+    """Opposite transitions must lock the shared counter rows in the same order."""
+
+    submitted_by_id = uuid.uuid4()
+
+    def bumped_rows(self, old_status_code, new_status_code):
+        reconciliation = DisbursementReconciliation(
+            submitted_by_id=self.submitted_by_id, created_at=timezone.now()
+        )
+        with mock.patch.object(DashboardCounterService, "_bump") as bump:
+            DashboardCounterService.record_transitions(
+                [reconciliation], old_status_code, new_status_code
+            )
+        return [c.args[:4] for c in bump.call_args_list], [c.args[4] for c in bump.call_args_list]
+
+    def test_submit_and_reject_lock_rows_in_the_same_order(self):
+        submit_rows, submit_counts = self.bumped_rows("pending", "under_review")
+        reject_rows, reject_counts = self.bumped_rows("under_review", "pending")
+
+        self.assertEqual(submit_rows, reject_rows)
+        self.assertEqual(len(submit_rows), 8)
+        self.assertEqual(submit_counts, [-c for c in reject_counts])
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class EmailOutboxTests(TestCase):
+    """Notification emails are queued on the outbox and sent by send_outbox_emails."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+
+    def test_worker_sends_queued_notification(self):
+        log = TransactionLogService.log(
+            event_code="expense_submitted",
+            triggered_by=self.employee,
+            entity=self.employee,
+            message="Expense submitted",
+        )
+        notification = NotificationService.notify(log, self.officer)
+
+        entry = EmailOutbox.objects.get(notification=notification)
+        self.assertEqual(entry.status, Notifications.DeliveryStatus.PENDING)
+        self.assertEqual(mail.outbox, [])  # nothing is sent inside the workflow transaction
+
+        call_command("send_outbox_emails", "--once", "--pool-size", "1", stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.officer.email])
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, Notifications.DeliveryStatus.SENT)
+        self.assertIsNotNone(entry.sent_at)
+        notification.refresh_from_db()
+        self.assertEqual(notification.delivery_status, Notifications.DeliveryStatus.SENT)
+
+
+class NotificationEmailBatchTests(TestCase):
+    """send_notification_batch: one SMTP session, one render per log, failures kept per recipient."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officers = [create_user(f"officer{i}@test.local", "FO") for i in range(3)]
+        for i, officer in enumerate(cls.officers):
+            officer.first_name = f"Officer{i}"
+            officer.save()
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+
+    def notify_officers(self, logs=1):
+        for i in range(logs):
+            log = TransactionLogService.log(
+                event_code="expense_submitted",
+                triggered_by=self.employee,
+                entity=self.employee,
+                message=f"Expense {i} submitted",
+            )
+            NotificationService.notify_many(log, self.officers)
+        return [entry.notification for entry in EmailOutboxService.claim_batch(50)]
+
+    @staticmethod
+    def failing_for(address):
+        send_messages = locmem.EmailBackend.send_messages
+
+        def send(backend, messages):
+            if any(address in message.to for message in messages):
+                raise ConnectionResetError("recipient refused")
+            return send_messages(backend, messages)
+
+        return send
+
+    def test_batch_opens_one_connection(self):
+        notifications = self.notify_officers()
+
+        with mock.patch.object(locmem.EmailBackend, "open", autospec=True) as opened:
+            results = EmailService.send_notification_batch(notifications)
+
+        opened.assert_called_once()
+        self.assertTrue(all(result["sent"] for result in results))
+        self.assertCountEqual(
+            [message.to[0] for message in mail.outbox], [officer.email for officer in self.officers]
+        )
+
+    def test_body_is_rendered_once_per_log(self):
+        notifications = self.notify_officers(logs=2)
+
+        with mock.patch.object(TemplateCache, "render", side_effect=TemplateCache.render) as render:
+            EmailService.send_notification_batch(notifications)
+
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(len(mail.outbox), 6)
+        for message in mail.outbox:
+            html = message.alternatives[0][0]
+            officer = next(o for o in self.officers if o.email == message.to[0])
+            self.assertIn(f"{officer.first_name} {officer.last_name}", html)
+            self.assertNotIn("__tpl_", html)
+
+    def test_failing_recipient_does_not_abort_the_others(self):
+        notifications = self.notify_officers()
+        bad = self.officers[1].email
+
+        with mock.patch.object(
+            locmem.EmailBackend, "send_messages", autospec=True, side_effect=self.failing_for(bad)
+        ):
+            results = EmailService.send_notification_batch(notifications)
+
+        by_email = {result["email"]: result for result in results}
+        self.assertFalse(by_email[bad]["sent"])
+        self.assertIn("recipient refused", by_email[bad]["error"])
+        self.assertEqual(
+            sorted(email for email, result in by_email.items() if result["sent"]),
+            sorted(o.email for o in self.officers if o.email != bad),
+        )
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_worker_retries_only_the_failed_recipient(self):
+        self.notify_officers()
+        EmailOutbox.objects.update(next_attempt_at=timezone.now())  # undo the claim lease
+        bad = self.officers[1].email
+
+        with mock.patch.object(
+            locmem.EmailBackend, "send_messages", autospec=True, side_effect=self.failing_for(bad)
+        ):
+            call_command("send_outbox_emails", "--once", "--pool-size", "1", stdout=StringIO())
+
+        statuses = dict(EmailOutbox.objects.values_list("notification__recipient__email", "status"))
+        self.assertEqual(statuses.pop(bad), Notifications.DeliveryStatus.PENDING)
+        self.assertEqual(set(statuses.values()), {Notifications.DeliveryStatus.SENT})
+        failed = EmailOutbox.objects.get(notification__recipient__email=bad)
+        self.assertIn("recipient refused", failed.last_error)
+        self.assertGreater(failed.next_attempt_at, timezone.now())
+
+
+class DeferredAuditWriterTests(TransactionTestCase):
+    """Buffered logs reach the table only for work that actually committed."""
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        self.employee = create_user("employee@test.local", "EMP")
+        self.officer = create_user("officer@test.local", "FO")
+
+    def log(self, message):
+        return TransactionLogService.log(
+            event_code="expense_submitted",
+            triggered_by=self.employee,
+            entity=self.employee,
+            message=message,
+        )
+
+    def written_messages(self):
+        return list(
+            TransactionLogBase.objects.order_by("created_at").values_list("event_message", flat=True)
+        )
+
+    def test_notify_does_not_write_rolled_back_entries(self):
+        with DeferredAuditWriter.deferred():
+            try:
+                with transaction.atomic():
+                    self.log("rolled back")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            with transaction.atomic():
+                kept = self.log("kept")
+                NotificationService.notify(kept, self.officer)
+
+        self.assertEqual(self.written_messages(), ["kept"])
+
+    def test_committed_entry_survives_rollback_of_the_transaction_that_wrote_it(self):
+        with DeferredAuditWriter.deferred():
+            with transaction.atomic():
+                self.log("committed")
+
+            try:
+                with transaction.atomic():
+                    # notify() inserts every earlier entry along with this one
+                    NotificationService.notify(self.log("rolled back"), self.officer)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(self.written_messages(), ["committed"])
+
+    def test_notify_skips_entries_of_a_rolled_back_savepoint(self):
+        with DeferredAuditWriter.deferred():
+            with transaction.atomic():
+                self.log("outer")
+                try:
+                    with transaction.atomic():
+                        self.log("rolled back")
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                NotificationService.notify(self.log("after"), self.officer)
+
+        self.assertEqual(self.written_messages(), ["outer", "after"])
+
+    def test_on_commit_queue_layout_matches_what_prune_reads(self):
+        # _AuditBuffer reads the connection's private run_on_commit list; this
+        # fails loudly if a Django upgrade changes its shape or rollback handling
+        def kept():
+            pass
+
+        def dropped():
+            pass
+
+        with transaction.atomic():
+            transaction.on_commit(kept)
+            try:
+                with transaction.atomic():
+                    transaction.on_commit(dropped)
+                    self.assertEqual(_AuditBuffer._open_callbacks(), {kept, dropped})
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            queued = transaction.get_connection().run_on_commit
+            self.assertEqual(len(queued), 1)
+            sids, func, robust = queued[0]
+            self.assertIsInstance(sids, set)
+            self.assertIs(func, kept)
+            self.assertIs(robust, False)
+            self.assertEqual(_AuditBuffer._open_callbacks(), {kept})
+
+
+class NotificationArchiveTests(TestCase):
+    """Notifications keep showing the same fields after their log is archived."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+
+    def serialized(self, notification):
+        notification = (
+            NotificationService()
+            .list_auth_user_notifications(self.officer)
+            .get(id=notification.id)
+        )
+        return NotificationController._serialize(notification)
+
+    def test_detached_notification_serializes_like_before(self):
+        log = TransactionLogService.log(
+            event_code="expense_submitted",
+            triggered_by=self.employee,
+            entity=self.employee,
+            message="Expense submitted",
+        )
+        notification = NotificationService.notify(log, self.officer)
+        before = self.serialized(notification)
+
+        detached = NotificationService.detach_from_logs(
+            Notifications.objects.filter(transaction_log=log)
+        )
+
+        self.assertEqual(detached, 1)
+        notification.refresh_from_db()
+        self.assertIsNone(notification.transaction_log_id)
+        self.assertEqual(notification.archived_log["log_id"], str(log.id))
+        self.assertEqual(self.serialized(notification), before)
+
+
+@skipUnless(connection.vendor == "postgresql", "transaction_logs is only partitioned on PostgreSQL")
+class LogPartitionArchiveTests(TestCase):
+    """manage_log_partitions archives old partitions without losing users' notifications."""
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        self.archive_dir = tempfile.mkdtemp()
+
+    def test_archive_keeps_notifications_by_default(self):
+        old_month = partitions.add_months(
+            partitions.month_start(datetime.datetime.now(datetime.timezone.utc)), -24
+        )
+        log = TransactionLogService.log(
+            event_code="expense_submitted",
+            triggered_by=self.employee,
+            entity=self.employee,
+            message="Old expense",
+        )
+        TransactionLogBase.objects.filter(id=log.id).update(
+            created_at=partitions.month_bound(old_month)
+        )
+        notification = NotificationService.notify(log, self.officer)
+        with connection.cursor() as cursor:
+            partitions.ensure_month(cursor, old_month)
+
+        call_command(
+            "manage_log_partitions",
+            "--retain-months", "12",
+            "--archive-dir", self.archive_dir,
+            stdout=StringIO(),
+        )
+
+        self.assertFalse(TransactionLogBase.objects.filter(id=log.id).exists())
+        notification.refresh_from_db()
+        self.assertIsNone(notification.transaction_log_id)
+        self.assertEqual(notification.archived_log["message"], "Old expense")
+        with connection.cursor() as cursor:
+            self.assertNotIn(
+                partitions.partition_name(old_month),
+                [name for name, _ in partitions.monthly_partitions(cursor)],
+            )
@@ -1,25 +1,34 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 
 from audit.services.dashboard_service import DashBoardController
 from utils.decorators.allowed_http_methods import allowed_http_methods
 from utils.decorators.login_required import login_required
+from utils.decorators.read_replica import read_replica
 from audit.services.notification_service import NotificationController
+from audit.services.audit_log_service import AuditLogController
 
 
 # ── NOTIFICATIONS ────────────────────────────────────────────
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("EMP", "FO", "CFO", "ADM")
-def list_my_notifications_view(request) -> JsonResponse:
-    return NotificationController().get_my_notifications(request)
+async def list_my_notifications_view(request) -> JsonResponse:
+    return await NotificationController().aget_my_notifications(request)
 
 
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("EMP", "FO", "CFO", "ADM")
-def get_unread_count_view(request) -> JsonResponse:
-    return NotificationController().get_unread_count(request)
+async def get_unread_count_view(request) -> JsonResponse:
+    return await NotificationController().aget_unread_count(request)
+
+
+@csrf_exempt
+@allowed_http_methods("GET")
+@login_required("EMP", "FO", "CFO", "ADM")
+async def stream_unread_count_view(request) -> StreamingHttpResponse:
+    return await NotificationController().stream_unread_count(request)
 
 
 @csrf_exempt
@@ -44,5 +53,14 @@ def employee_dashboard_view(request):
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("EMP", "FO", "CFO", "ADM")
-def dashboard_view(request):
-    return DashBoardController().get_dashboard(request)
+@read_replica()
+async def dashboard_view(request):
+    return await DashBoardController().aget_dashboard(request)
+
+
+# ── AUDIT LOGS ───────────────────────────────────────────
+@csrf_exempt
+@allowed_http_methods("GET")
+@login_required("CFO", "ADM")
+def export_audit_logs_view(request) -> StreamingHttpResponse:
+    return AuditLogController().export_logs(request)
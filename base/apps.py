@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BaseConfig(AppConfig):
     name = 'base'
+
+    def ready(self):
+        import base.signals  # noqa: F401 — registers the lookup registry receivers
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from base.models import Category, Status
+from services.lookup_registry import LookupRegistry
+
+
+@receiver([post_save, post_delete], sender=Status)
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_lookup_registry(sender, **kwargs):
+    """Admin edits to lookup rows must not be served stale from the registry."""
+    LookupRegistry.invalidate(sender)
@@ -1,3 +1,153 @@
-from django.test import TestCase
+import uuid
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from base.models import Status
+from finance.models import ExpenseRequest
+from services.lookup_registry import LookupRegistry
+from services.replica_routing import REPLICA_ALIAS, ReplicaRouter, ReplicaRouting
+from utils.decorators.read_replica import read_replica
+from utils.middleware import ReadYourWritesMiddleware
+
+
+class LookupRegistryTests(TestCase):
+    """Lookups are served from memory, and misses do not reload the table on every call."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.active, _ = Status.objects.get_or_create(code="ACT", defaults={"name": "Active"})
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+
+    def create_elsewhere(self, code):
+        # bulk_create sends no post_save, like a row created by another worker process
+        return Status.objects.bulk_create([Status(code=code, name=code)])[0]
+
+    def test_hits_are_served_from_memory(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(LookupRegistry.status("ACT"), self.active)
+            self.assertEqual(LookupRegistry.get_by_pk(Status, self.active.pk), self.active)
+            self.assertEqual(LookupRegistry.status("ACT"), self.active)
+
+    def test_misses_right_after_a_load_do_not_reload(self):
+        LookupRegistry.status("ACT")
+
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                with self.assertRaises(Status.DoesNotExist):
+                    LookupRegistry.status("missing")
+                with self.assertRaises(Status.DoesNotExist):
+                    LookupRegistry.get_by_pk(Status, "00000000-0000-0000-0000-000000000000")
+
+    def test_cold_miss_loads_the_table_once(self):
+        with self.assertNumQueries(1), self.assertRaises(Status.DoesNotExist):
+            LookupRegistry.status("missing")
+
+    @override_settings(LOOKUP_REGISTRY_MISS_RELOAD_SECONDS=0)
+    def test_miss_reload_finds_a_row_created_elsewhere(self):
+        LookupRegistry.status("ACT")
+        created = self.create_elsewhere("archived")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(LookupRegistry.status("archived"), created)
+        self.assertEqual(LookupRegistry.get_by_pk(Status, created.pk), created)
+
+    @override_settings(LOOKUP_REGISTRY_MISS_RELOAD_SECONDS=60)
+    def test_throttled_miss_does_not_see_a_row_created_elsewhere(self):
+        LookupRegistry.status("ACT")
+        self.create_elsewhere("archived")
+
+        with self.assertRaises(Status.DoesNotExist):
+            LookupRegistry.status("archived")
+
+    def test_local_save_invalidates_the_table(self):
+        LookupRegistry.status("ACT")
+        self.active.name = "Enabled"
+        self.active.save()
+
+        self.assertEqual(LookupRegistry.status("ACT").name, "Enabled")
+
+    @override_settings(LOOKUP_REGISTRY_TTL=0)
+    def test_expired_table_picks_up_an_edit_made_elsewhere(self):
+        LookupRegistry.status("ACT")
+        Status.objects.filter(pk=self.active.pk).update(name="Enabled")
+
+        self.assertEqual(LookupRegistry.status("ACT").name, "Enabled")
+
+
+@override_settings(REPLICA_READ_YOUR_WRITES_SECONDS=5)
+class ReplicaRoutingTests(SimpleTestCase):
+    """read_replica views read from the replica unless the user just wrote; writes stay on default."""
+
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        self.user = SimpleNamespace(id=uuid.uuid4())
+        # a second alias for the router to choose; no query is ever sent to it
+        replica = mock.patch.dict(
+            settings.DATABASES, {REPLICA_ALIAS: {**settings.DATABASES[DEFAULT_DB_ALIAS]}}
+        )
+        replica.start()
+        self.addCleanup(replica.stop)
+
+    def request(self, method="get"):
+        request = getattr(RequestFactory(), method)("/")
+        request.user = self.user
+        return request
+
+    def routed(self, request):
+        """Runs a read_replica view and returns the aliases it would read and write on."""
+
+        @read_replica()
+        def view(request):
+            return (
+                self.router.db_for_read(ExpenseRequest),
+                self.router.db_for_write(ExpenseRequest),
+            )
+
+        return view(request)
+
+    def test_unpinned_reads_go_to_the_replica_and_writes_to_default(self):
+        self.assertEqual(self.routed(self.request()), (REPLICA_ALIAS, DEFAULT_DB_ALIAS))
+
+    def test_async_view_reads_from_the_replica(self):
+        @read_replica()
+        async def view(request):
+            return self.router.db_for_read(ExpenseRequest)
+
+        self.assertEqual(async_to_sync(view)(self.request()), REPLICA_ALIAS)
+
+    def test_pinned_user_reads_from_default(self):
+        ReplicaRouting.pin(self.user.id)
+
+        self.assertEqual(self.routed(self.request()), (None, DEFAULT_DB_ALIAS))
+
+    def test_reads_outside_a_read_replica_view_stay_on_default(self):
+        self.assertIsNone(self.router.db_for_read(ExpenseRequest))
+
+    def test_reads_inside_a_transaction_stay_on_default(self):
+        with mock.patch.object(connections[DEFAULT_DB_ALIAS], "in_atomic_block", True):
+            self.assertEqual(self.routed(self.request()), (DEFAULT_DB_ALIAS, DEFAULT_DB_ALIAS))
+
+    def test_without_a_replica_alias_nothing_is_routed(self):
+        del settings.DATABASES[REPLICA_ALIAS]
+
+        self.assertEqual(self.routed(self.request()), (None, DEFAULT_DB_ALIAS))
+
+    def test_non_get_request_pins_the_user(self):
+        middleware = ReadYourWritesMiddleware(lambda request: HttpResponse())
+
+        middleware(self.request("get"))
+        self.assertFalse(ReplicaRouting.is_pinned(self.user.id))
+
+        middleware(self.request("post"))
+        self.assertTrue(ReplicaRouting.is_pinned(self.user.id))
+        self.assertEqual(self.routed(self.request()), (None, DEFAULT_DB_ALIAS))
@@ -27,5 +27,48 @@ class Environment:
         self.POSTGRES_PORT = os.getenv("POSTGRES_PORT")
         self.POSTGRES_HOST = os.getenv("POSTGRES_HOST")
 
+        # gunicorn (gunicorn.conf.py); workers defaults to 2 x CPUs + 1
+        # ASGI: GUNICORN_APP=pettycash_system.asgi:application GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker
+        self.GUNICORN_APP = os.getenv("GUNICORN_APP", "pettycash_system.wsgi:application")
+        self.GUNICORN_BIND = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+        self.GUNICORN_WORKERS = os.getenv("GUNICORN_WORKERS")
+        self.GUNICORN_THREADS = os.getenv("GUNICORN_THREADS", "4")
+        self.GUNICORN_WORKER_CLASS = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+        self.GUNICORN_TIMEOUT = os.getenv("GUNICORN_TIMEOUT", "30")
+        self.GUNICORN_GRACEFUL_TIMEOUT = os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30")
+        self.GUNICORN_KEEPALIVE = os.getenv("GUNICORN_KEEPALIVE", "5")
+        self.GUNICORN_MAX_REQUESTS = os.getenv("GUNICORN_MAX_REQUESTS", "1000")
+        self.GUNICORN_LOG_LEVEL = os.getenv("GUNICORN_LOG_LEVEL", "info")
+        self.GUNICORN_RELOAD = os.getenv("GUNICORN_RELOAD", "false")
+        self.ASGI = "asgi" in self.GUNICORN_APP or "uvicorn" in self.GUNICORN_WORKER_CLASS.lower()
+
+        # connection reuse: persistent connections (seconds, 0 = per request) or a psycopg pool;
+        # under ASGI the pool is the default and persistent connections are always off
+        self.DB_CONN_MAX_AGE = os.getenv("DB_CONN_MAX_AGE", "60")
+        self.DB_CONN_HEALTH_CHECKS = os.getenv("DB_CONN_HEALTH_CHECKS", "true")
+        self.DB_POOL = os.getenv("DB_POOL", "true" if self.ASGI else "false")
+        self.DB_POOL_MIN_SIZE = os.getenv("DB_POOL_MIN_SIZE", "2")
+        self.DB_POOL_MAX_SIZE = os.getenv("DB_POOL_MAX_SIZE", "10")
+        self.DB_POOL_TIMEOUT = os.getenv("DB_POOL_TIMEOUT", "10")
+
+        # optional read replica for read-only endpoints (unset host → no replica)
+        self.POSTGRES_REPLICA_HOST = os.getenv("POSTGRES_REPLICA_HOST")
+        self.POSTGRES_REPLICA_PORT = os.getenv("POSTGRES_REPLICA_PORT", self.POSTGRES_PORT)
+        self.POSTGRES_REPLICA_DB = os.getenv("POSTGRES_REPLICA_DB", self.POSTGRES_DB)
+        self.REPLICA_READ_YOUR_WRITES_SECONDS = os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5")
+
+        # default Django cache; locmem is per process, so replicas and AUTH_USER_CACHE_SHARED
+        # need a shared backend (e.g. django.core.cache.backends.redis.RedisCache,
+        # or django.core.cache.backends.db.DatabaseCache after manage.py createcachetable)
+        self.CACHE_BACKEND = os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+        self.CACHE_LOCATION = os.getenv("CACHE_LOCATION", "")
+
+        # authenticated user snapshot cache (login_required)
+        self.AUTH_USER_CACHE_TTL = os.getenv("AUTH_USER_CACHE_TTL", "30")
+        self.AUTH_USER_CACHE_SHARED = os.getenv("AUTH_USER_CACHE_SHARED", "false")
+
+        # buffer audit logs per request and bulk insert them on commit
+        self.AUDIT_DEFERRED_WRITES = os.getenv("AUDIT_DEFERRED_WRITES", "false")
+
 
 ENV = Environment()
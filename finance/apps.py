@@ -1,5 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class FinanceConfig(AppConfig):
     name = 'finance'
+
+    def ready(self):
+        from finance.bootstrap import seed_default_lookups
+        import finance.signals  # noqa: F401 — registers the default cache receivers
+
+        post_migrate.connect(seed_default_lookups, sender=self)
@@ -0,0 +1,46 @@
+from django.apps import apps as global_apps
+
+from finance.default import (
+    DEFAULT_CATEGORIES,
+    DEFAULT_EVENT_TYPES,
+    DEFAULT_STATUSES,
+    reset_default_cache,
+)
+from services.lookup_registry import LookupRegistry
+
+
+def seed_default_lookups(sender, apps=global_apps, using="default", **kwargs):
+    """
+    post_migrate receiver — makes sure the Category, Status and EventTypes rows
+    the finance model defaults resolve to exist right after `migrate`, so the
+    defaults only ever read them.
+
+    Uses the historical models passed in by the migration executor; `flush`
+    (and so TransactionTestCase teardown) sends the signal without them, and
+    then the current models are used.
+    """
+    try:
+        Category = apps.get_model("base", "Category")
+        Status = apps.get_model("base", "Status")
+        EventTypes = apps.get_model("audit", "EventTypes")
+    except LookupError:
+        # migrating to a state where the lookup tables don't exist yet
+        return
+
+    categories = {}
+    for code, defaults in DEFAULT_CATEGORIES.items():
+        categories[code], _ = Category.objects.using(using).get_or_create(
+            code=code, defaults=defaults
+        )
+
+    for code, defaults in DEFAULT_STATUSES.items():
+        Status.objects.using(using).get_or_create(code=code, defaults=defaults)
+
+    for code, (category_code, defaults) in DEFAULT_EVENT_TYPES.items():
+        EventTypes.objects.using(using).get_or_create(
+            code=code,
+            defaults={**defaults, "event_category": categories[category_code]},
+        )
+
+    LookupRegistry.invalidate()
+    reset_default_cache()
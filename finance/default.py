@@ -1,7 +1,74 @@
-
 from base.models import Category, Status
 from users.models import User
 from audit.models import EventTypes
+from services.lookup_registry import LookupRegistry
+
+# Lookup rows the model defaults below depend on.
+# Seeded at migrate time by finance.bootstrap.seed_default_lookups so the
+# defaults never have to create them while the ORM is instantiating rows.
+DEFAULT_CATEGORIES = {
+    'expense': {
+        'name': 'Expense Management',
+        'description': 'Expense submission and approval workflow'
+    },
+    'topup': {
+        'name': 'Top Up',
+        'description': 'Petty cash top-up workflow'
+    },
+}
+
+DEFAULT_STATUSES = {
+    'pending': {
+        'name': 'Pending',
+        'description': 'Awaiting review and approval'
+    },
+}
+
+# event code -> (category code, defaults)
+DEFAULT_EVENT_TYPES = {
+    'expense_submitted': ('expense', {
+        'name': 'Expense Submitted',
+        'description': 'Employee submitted an expense request',
+    }),
+    'topup_requested': ('topup', {
+        'name': 'Top Up Requested',
+        'description': 'Finance Officer initiated a top-up request',
+    }),
+}
+
+# (model name, code) -> primary key, resolved once per process
+_resolved_ids = {}
+
+
+def _memoized_id(model, code: str, resolve):
+    """
+    Returns the cached primary key for (model, code), calling resolve() only
+    the first time. Every ExpenseRequest/TopUpRequest the ORM builds calls the
+    defaults, so after the first row they cost a dict lookup instead of a query.
+    """
+    key = (model.__name__, code)
+    if key not in _resolved_ids:
+        _resolved_ids[key] = resolve().id
+    return _resolved_ids[key]
+
+
+def reset_default_cache():
+    """Forgets the memoized ids — called when a lookup row is edited or re-seeded."""
+    _resolved_ids.clear()
+
+
+def _category(code: str):
+    return LookupRegistry.get_or_create(Category, code, defaults=DEFAULT_CATEGORIES[code])
+
+
+def _event_type(code: str):
+    category_code, defaults = DEFAULT_EVENT_TYPES[code]
+    return LookupRegistry.get_or_create(
+        EventTypes,
+        code,
+        defaults={**defaults, 'event_category': _category(category_code)},
+    )
+
 
 # EXPENSEREQUEST
 def get_default_expense_category():
@@ -10,14 +77,7 @@ def get_default_expense_category():
     Returns the ID of the 'Expense Management' category,
     creating it if it doesn't exist.
     """
-    category, _ = Category.objects.get_or_create(
-        code='expense',
-        defaults={
-            'name': 'Expense Management',
-            'description': 'Expense submission and approval workflow'
-        }
-    )
-    return category.id
+    return _memoized_id(Category, 'expense', lambda: _category('expense'))
 
 
 def get_default_pending_status():
@@ -26,14 +86,11 @@ def get_default_pending_status():
     Returns the ID of the 'Pending' status,
     creating it if it doesn't exist.
     """
-    status, _ = Status.objects.get_or_create(
-        code='pending',
-        defaults={
-            'name': 'Pending',
-            'description': 'Awaiting review and approval'
-        }
+    return _memoized_id(
+        Status,
+        'pending',
+        lambda: LookupRegistry.get_or_create(Status, 'pending', defaults=DEFAULT_STATUSES['pending'])
     )
-    return status.id
 
 def get_default_finance_officers():
     """
@@ -41,12 +98,12 @@ def get_default_finance_officers():
     Returns the ID of the first active user with the FO role.
     Returns None if no Finance Officer exists.
     """
-    
+
     officer = User.objects.filter(
         role__code='FO',
         is_active=True
     )
-    
+
     return officer.id if officer else None
 
 
@@ -55,23 +112,7 @@ def get_default_expense_submitted_event():
     Auto-resolves the default event type for a newly submitted expense request.
     Returns the ID of the 'expense_submitted' event, creating it if it doesn't exist.
     """
-       # local import to avoid circular imports
-    category, _ = Category.objects.get_or_create(
-        code='expense',
-        defaults={
-            'name': 'Expense Management',
-            'description': 'Expense submission and approval workflow'
-        }
-    )
-    event, _ = EventTypes.objects.get_or_create(
-        code='expense_submitted',
-        defaults={
-            'name': 'Expense Submitted',
-            'description': 'Employee submitted an expense request',
-            'event_category': category,
-        }
-    )
-    return event.id
+    return _memoized_id(EventTypes, 'expense_submitted', lambda: _event_type('expense_submitted'))
 
 
 def get_default_topup_requested_event():
@@ -79,19 +120,4 @@ def get_default_topup_requested_event():
     Auto-resolves the default event type for a newly created top-up request.
     Returns the ID of the 'topup_requested' event, creating it if it doesn't exist.
     """
-    category, _ = Category.objects.get_or_create(
-        code='topup',
-        defaults={
-            'name': 'Top Up',
-            'description': 'Petty cash top-up workflow'
-        }
-    )
-    event, _ = EventTypes.objects.get_or_create(
-        code='topup_requested',
-        defaults={
-            'name': 'Top Up Requested',
-            'description': 'Finance Officer initiated a top-up request',
-            'event_category': category,
-        }
-    )
-    return event.id
\ No newline at end of file
+    return _memoized_id(EventTypes, 'topup_requested', lambda: _event_type('topup_requested'))
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0012_hot_query_indexes'),
+        ('base', '0005_category_is_active_status_is_active'),
+        ('finance', '0013_remove_disbursementreconciliation_total_amount_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expenserequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='expense_active_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenserequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['employee', '-created_at'], name='expense_employee_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenserequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['status', '-created_at'], name='expense_status_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topuprequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['pettycash_account', 'status'], name='topup_account_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topuprequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at', '-id'], name='topup_active_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topuprequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['requested_by', '-created_at'], name='topup_requester_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topuprequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['status', '-created_at'], name='topup_status_active_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:32
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_status_code(apps, schema_editor):
+    Status = apps.get_model("base", "Status")
+    code = Coalesce(
+        Subquery(Status.objects.filter(pk=OuterRef("status_id")).values("code")[:1]),
+        Value(""),
+    )
+    for model_name in ("ExpenseRequest", "TopUpRequest", "DisbursementReconciliation"):
+        apps.get_model("finance", model_name).objects.update(status_code=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0012_hot_query_indexes'),
+        ('base', '0005_category_is_active_status_is_active'),
+        ('finance', '0014_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='expenserequest',
+            name='expense_status_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='topuprequest',
+            name='topup_account_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='topuprequest',
+            name='topup_status_active_idx',
+        ),
+        migrations.AddField(
+            model_name='disbursementreconciliation',
+            name='status_code',
+            field=models.CharField(blank=True, default='', editable=False, max_length=20, verbose_name='Status Code'),
+        ),
+        migrations.AddField(
+            model_name='expenserequest',
+            name='status_code',
+            field=models.CharField(blank=True, default='', editable=False, max_length=20, verbose_name='Status Code'),
+        ),
+        migrations.AddField(
+            model_name='topuprequest',
+            name='status_code',
+            field=models.CharField(blank=True, default='', editable=False, max_length=20, verbose_name='Status Code'),
+        ),
+        migrations.RunPython(backfill_status_code, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='disbursementreconciliation',
+            index=models.Index(fields=['status_code', '-created_at'], name='recon_status_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenserequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['status_code', '-created_at'], name='expense_status_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topuprequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['pettycash_account', 'status_code'], name='topup_account_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topuprequest',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['status_code', '-created_at'], name='topup_status_active_idx'),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:50
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def open_ledgers(apps, schema_editor):
+    # balances that predate the ledger become its first entry, so entries always sum to the balance
+    PettyCashAccount = apps.get_model("finance", "PettyCashAccount")
+    PettyCashLedgerEntry = apps.get_model("finance", "PettyCashLedgerEntry")
+    now = timezone.now()
+    PettyCashLedgerEntry.objects.bulk_create(
+        PettyCashLedgerEntry(
+            account=account,
+            entry_type="credit" if account.current_balance > 0 else "debit",
+            amount=abs(account.current_balance),
+            balance_after=account.current_balance,
+            description="Opening balance",
+            created_at=now,
+        )
+        for account in PettyCashAccount.objects.exclude(current_balance=0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0015_expense_topup_reconciliation_status_code'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PettyCashBalanceSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date created')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('as_of', models.DateTimeField(verbose_name='As of')),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Balance')),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='balance_snapshots', to='finance.pettycashaccount', verbose_name='Petty Cash Account')),
+            ],
+            options={
+                'verbose_name': 'PettyCash balance snapshot',
+                'verbose_name_plural': 'PettyCash balance snapshots',
+                'db_table': 'pettycash_balance_snapshots',
+                'ordering': ['-as_of'],
+                'constraints': [models.UniqueConstraint(fields=('account', 'as_of'), name='unique_balance_snapshot')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PettyCashLedgerEntry',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('entry_type', models.CharField(choices=[('credit', 'Credit'), ('debit', 'Debit')], max_length=10, verbose_name='Entry Type')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Amount')),
+                ('balance_after', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Balance After')),
+                ('entity_type', models.CharField(blank=True, max_length=50, verbose_name='Entity Type')),
+                ('entity_id', models.CharField(blank=True, max_length=100, verbose_name='Entity ID')),
+                ('description', models.CharField(blank=True, max_length=255, verbose_name='Description')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Date created')),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='finance.pettycashaccount', verbose_name='Petty Cash Account')),
+                ('triggered_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to=settings.AUTH_USER_MODEL, verbose_name='Triggered by')),
+            ],
+            options={
+                'verbose_name': 'PettyCash ledger entry',
+                'verbose_name_plural': 'PettyCash ledger entries',
+                'db_table': 'pettycash_ledger_entries',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['account', 'created_at'], name='ledger_account_created_idx'), models.Index(fields=['entity_type', 'entity_id'], name='ledger_entity_idx')],
+            },
+        ),
+        migrations.RunPython(open_ledgers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0016_pettycash_ledger'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expenserequest',
+            name='claim_expires_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Claim expires at'),
+        ),
+        migrations.AddField(
+            model_name='expenserequest',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_expense_requests', to=settings.AUTH_USER_MODEL, verbose_name='Claimed by'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-17 07:01
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0017_expense_review_claims'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceiptBlob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date created')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Date modified')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('file', models.FileField(max_length=255, upload_to='', verbose_name='File')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='Size (bytes)')),
+                ('content_type', models.CharField(blank=True, max_length=100, verbose_name='Content Type')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='Reference Count')),
+            ],
+            options={
+                'verbose_name': 'Receipt blob',
+                'verbose_name_plural': 'Receipt blobs',
+                'db_table': 'receipt_blobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='disbursementreconciliation',
+            name='receipt_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='reconciliations', to='finance.receiptblob', verbose_name='Receipt Blob'),
+        ),
+        migrations.AddField(
+            model_name='expenserequest',
+            name='receipt_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='expense_requests', to='finance.receiptblob', verbose_name='Receipt blob'),
+        ),
+    ]
@@ -1,13 +1,96 @@
 from django.db import models
+from django.db.models import Q
 from base.models import BaseModel,GenericBaseModel,Status, Category
 from department.models import Department
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from users.models import User
 from finance.default import (get_default_expense_category, get_default_expense_submitted_event, get_default_pending_status, get_default_topup_requested_event)
 from audit.models import EventTypes
+from services.lookup_registry import LookupRegistry
 
 
 # Create your models here.
+class DenormalizedStatusQuerySet(models.QuerySet):
+    """
+    The bulk paths that skip save(): bulk_create, bulk_update and update() keep
+    status_code in step with the status they write, unless the caller sets
+    status_code itself.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.sync_status_code()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if {'status', 'status_id'} & set(fields):
+            for obj in objs:
+                obj.sync_status_code()
+            fields = {*fields, 'status_code'}
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        if 'status_code' not in kwargs and ('status' in kwargs or 'status_id' in kwargs):
+            status = kwargs.get('status', kwargs.get('status_id'))
+            if status is None:
+                kwargs['status_code'] = ''
+            elif isinstance(status, Status):
+                kwargs['status_code'] = status.code
+            else:
+                kwargs['status_code'] = LookupRegistry.get_by_pk(Status, status).code
+        return super().update(**kwargs)
+
+
+class DenormalizedStatusModel(models.Model):
+    """
+    Copies status.code onto the row itself so list filters, counts and the
+    dashboard can filter on status_code without joining the status table.
+
+    Kept in sync in save(): whenever the status FK differs from what was loaded
+    (or the code is missing) status_code is refreshed, and a save with
+    update_fields containing status/status_id also writes status_code.
+    bulk_create, bulk_update and QuerySet.update(status=...) are covered by
+    DenormalizedStatusQuerySet; raw SQL and F()/subquery status values are not.
+    """
+
+    status_code = models.CharField(max_length=20, blank=True, default='', editable=False, verbose_name=_('Status Code'))
+
+    objects = DenormalizedStatusQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status_id = instance.__dict__.get('status_id')
+        return instance
+
+    def sync_status_code(self) -> bool:
+        """Refreshes status_code from the status FK. Returns True if it was recomputed."""
+        if self.status_code and self.status_id == getattr(self, '_loaded_status_id', object()):
+            return False
+        if not self.status_id:
+            self.status_code = ''
+        elif self._meta.get_field('status').is_cached(self):
+            self.status_code = self.status.code
+        else:
+            # e.g. the default status id — resolve from the registry instead of a query
+            self.status_code = LookupRegistry.get_by_pk(Status, self.status_id).code
+        self._loaded_status_id = self.status_id
+        return True
+
+    def save(self, *args, **kwargs):
+        self.sync_status_code()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'status', 'status_id'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'status_code'}
+        super().save(*args, **kwargs)
+
+
 class PettyCashAccount(GenericBaseModel):
 
     is_active = models.BooleanField(default=True,verbose_name=_('Is Active'))
@@ -24,7 +107,137 @@ class PettyCashAccount(GenericBaseModel):
         ordering = ['-created_at']
 
 
-class ExpenseRequest(BaseModel):
+class PettyCashLedgerEntry(BaseModel):
+    """
+    Append-only record of every change to PettyCashAccount.current_balance.
+    Written by PettyCashLedgerService.record() in the same transaction as the
+    balance update, so balance_after is the account balance right after this
+    entry and the entries of an account form an unbroken running balance.
+
+    Rows are never edited or deleted through the model; a correction is a new
+    entry in the opposite direction.
+    """
+    updated_at = None
+
+    class EntryType(models.TextChoices):
+        CREDIT = 'credit', _('Credit')
+        DEBIT = 'debit', _('Debit')
+
+    account = models.ForeignKey(
+        PettyCashAccount,
+        on_delete=models.PROTECT,
+        related_name='ledger_entries',
+        verbose_name=_('Petty Cash Account')
+    )
+    entry_type = models.CharField(max_length=10, choices=EntryType.choices, verbose_name=_('Entry Type'))
+    amount = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_('Amount'))
+    balance_after = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_('Balance After'))
+
+    # the workflow row that moved the money e.g. ("TopUpRequest", "<uuid>")
+    entity_type = models.CharField(max_length=50, blank=True, verbose_name=_('Entity Type'))
+    entity_id = models.CharField(max_length=100, blank=True, verbose_name=_('Entity ID'))
+
+    triggered_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_entries',
+        verbose_name=_('Triggered by')
+    )
+    description = models.CharField(max_length=255, blank=True, verbose_name=_('Description'))
+    # set while the account row is locked, so created_at order is balance order
+    created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name=_('Date created'))
+
+    # USAGE:
+    # account.ledger_entries.order_by('-created_at').first().balance_after  → current balance
+    # PettyCashLedgerService.balance_as_of(account, at)                    → balance at a point in time
+
+    class Meta:
+        db_table = 'pettycash_ledger_entries'
+        verbose_name = _('PettyCash ledger entry')
+        verbose_name_plural = _('PettyCash ledger entries')
+        ordering = ['-created_at']
+        indexes = [
+            # statement listing and the delta since a snapshot in balance_as_of
+            models.Index(fields=['account', 'created_at'], name='ledger_account_created_idx'),
+            models.Index(fields=['entity_type', 'entity_id'], name='ledger_entity_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Ledger entries are append-only and cannot be changed.')
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError('Ledger entries are append-only and cannot be deleted.')
+
+    @property
+    def signed_amount(self):
+        return self.amount if self.entry_type == self.EntryType.CREDIT else -self.amount
+
+    def __str__(self):
+        return f"{self.entry_type} {self.amount} → {self.balance_after}"
+
+
+class PettyCashBalanceSnapshot(BaseModel):
+    """
+    Checkpoint of an account balance, taken periodically by
+    snapshot_petty_cash_balances. balance_as_of() starts from the latest
+    snapshot at or before the requested time and adds only the ledger entries
+    after it, instead of replaying the account's whole history.
+    """
+    updated_at = None
+
+    account = models.ForeignKey(
+        PettyCashAccount,
+        on_delete=models.PROTECT,
+        related_name='balance_snapshots',
+        verbose_name=_('Petty Cash Account')
+    )
+    as_of = models.DateTimeField(verbose_name=_('As of'))
+    balance = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_('Balance'))
+
+    class Meta:
+        db_table = 'pettycash_balance_snapshots'
+        verbose_name = _('PettyCash balance snapshot')
+        verbose_name_plural = _('PettyCash balance snapshots')
+        ordering = ['-as_of']
+        constraints = [
+            # also the index balance_as_of seeks on: (account, as_of <= X) ORDER BY as_of DESC
+            models.UniqueConstraint(fields=['account', 'as_of'], name='unique_balance_snapshot'),
+        ]
+
+    def __str__(self):
+        return f"{self.account_id} @ {self.as_of:%Y-%m-%d %H:%M} = {self.balance}"
+
+
+class ReceiptBlob(BaseModel):
+    """
+    One stored receipt file per distinct content, addressed by its SHA-256.
+    Written by ReceiptStorageService.store(): uploads with the same bytes share
+    a blob and ref_count tracks how many expense requests and reconciliations
+    point at it. Blobs left at zero references are removed by collect_receipt_blobs.
+    """
+
+    # unique → indexed: store() and the duplicate check look blobs up by hash
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name=_('SHA-256'))
+    file = models.FileField(max_length=255, verbose_name=_('File'))
+    size = models.PositiveBigIntegerField(default=0, verbose_name=_('Size (bytes)'))
+    content_type = models.CharField(max_length=100, blank=True, verbose_name=_('Content Type'))
+    ref_count = models.PositiveIntegerField(default=0, verbose_name=_('Reference Count'))
+
+    class Meta:
+        db_table = 'receipt_blobs'
+        verbose_name = _('Receipt blob')
+        verbose_name_plural = _('Receipt blobs')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.ref_count} refs)"
+
+
+class ExpenseRequest(BaseModel, DenormalizedStatusModel):
 
     class ExpenseType(models.TextChoices):
         REIMBURSEMENT = 'reimbursement', _('Reimbursement')
@@ -81,20 +294,50 @@ class ExpenseRequest(BaseModel):
     description = models.TextField(blank=True, verbose_name=_('Description'))
     amount = models.DecimalField(max_digits=8, decimal_places=2, verbose_name=_('Amount'))
     receipt = models.FileField(upload_to='receipts/%Y/%m/%d/',null=True, blank=True, verbose_name=_('Receipt'))
+    # deduplicated copy of the receipt; receipt then holds the blob's file name
+    receipt_blob = models.ForeignKey(
+        ReceiptBlob,
+        on_delete=models.PROTECT,
+        related_name='expense_requests',
+        null=True,
+        blank=True,
+        verbose_name=_('Receipt blob')
+    )
 
     metadata = models.JSONField(default=dict, blank=True, verbose_name=_('Metadata'))  # store approved_by, timestamps, comments, etc.
 
+    # review lease — the FO working this request until claim_expires_at (ExpenseRequestService.claim_next);
+    # cleared when the request leaves the queue it was claimed from
+    claimed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='claimed_expense_requests',
+        null=True,
+        blank=True,
+        verbose_name=_('Claimed by')
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True, verbose_name=_('Claim expires at'))
+
     class Meta:
         db_table = 'expense_requests'
         verbose_name = _('Expense Request')
         verbose_name_plural = _('Expense Requests')
         ordering = ['-created_at']
+        # partial on is_active — every service query excludes deactivated requests
+        indexes = [
+            # get_all / paginated FO list: newest first, keyset on (created_at, id)
+            models.Index(fields=['-created_at', '-id'], condition=Q(is_active=True), name='expense_active_recent_idx'),
+            # get_my_expense_requests
+            models.Index(fields=['employee', '-created_at'], condition=Q(is_active=True), name='expense_employee_active_idx'),
+            # get_all_pending_for_fo and other status-filtered lists
+            models.Index(fields=['status_code', '-created_at'], condition=Q(is_active=True), name='expense_status_active_idx'),
+        ]
 
     def __str__(self):
          return f"{self.title or 'No Title'} - {self.employee.email}"
 
 
-class TopUpRequest(BaseModel):
+class TopUpRequest(BaseModel, DenormalizedStatusModel):
     pettycash_account = models.ForeignKey(
         PettyCashAccount,
         on_delete=models.PROTECT,
@@ -146,9 +389,20 @@ class TopUpRequest(BaseModel):
         verbose_name = _('Top-up Request')
         verbose_name_plural = _('TopUp Requests')
         ordering = ['-created_at']
-
-
-class DisbursementReconciliation(BaseModel):
+        # partial on is_active — every service query excludes deactivated requests
+        indexes = [
+            # auto top-up guard (pending request for this account?) and get_by_account
+            models.Index(fields=['pettycash_account', 'status_code'], condition=Q(is_active=True), name='topup_account_status_idx'),
+            # get_all / paginated list
+            models.Index(fields=['-created_at', '-id'], condition=Q(is_active=True), name='topup_active_recent_idx'),
+            # get_authuser_top_up_requests
+            models.Index(fields=['requested_by', '-created_at'], condition=Q(is_active=True), name='topup_requester_active_idx'),
+            # get_by_status
+            models.Index(fields=['status_code', '-created_at'], condition=Q(is_active=True), name='topup_status_active_idx'),
+        ]
+
+
+class DisbursementReconciliation(BaseModel, DenormalizedStatusModel):
     """
     Tracks the reconciliation of disbursement-type expense requests.
     """
@@ -219,6 +473,15 @@ class DisbursementReconciliation(BaseModel):
         verbose_name='Receipt'
     )
 
+    receipt_blob = models.ForeignKey(
+        ReceiptBlob,
+        on_delete=models.PROTECT,
+        related_name='reconciliations',
+        null=True,
+        blank=True,
+        verbose_name='Receipt Blob'
+    )
+
     comments = models.TextField(
         blank=True, null=True,
         verbose_name='Comments'
@@ -235,6 +498,10 @@ class DisbursementReconciliation(BaseModel):
         verbose_name = 'Disbursement Reconciliation'
         verbose_name_plural = 'Disbursement Reconciliations'
         ordering = ['-submitted_at']
+        indexes = [
+            # status-filtered reconciliation queues and dashboard recomputes
+            models.Index(fields=['status_code', '-created_at'], name='recon_status_recent_idx'),
+        ]
 
     def __str__(self):
         return f"Reconciliation for {self.expense_request.id} | Status: {self.status.name}"
\ No newline at end of file
@@ -1,5 +1,6 @@
 from utils.response_provider import ResponseProvider
 from utils.common import get_clean_request_data
+from utils.pagination import CursorPaginator
 from services.services import DisbursementReconciliationService
 from decimal import Decimal, InvalidOperation
 
@@ -31,19 +32,22 @@ class DisbursementReconciliationController:
     @classmethod
     def get_all_reconciliations(cls, request):
         """
-        Retrieves all reconciliations across all employees.
+        Retrieves one page of reconciliations across all employees, newest first.
         Intended for Finance Officer use.
 
         Args:
-            request: The HTTP request object.
+            request: The HTTP request object. Reads the limit/cursor query params.
 
         Returns:
-            JsonResponse: 200 with list of serialized reconciliations.
+            JsonResponse: 200 with a page of serialized reconciliations and next_cursor.
         """
         try:
-            reconciliations = DisbursementReconciliationService().get_all_reconciliations()
-            return ResponseProvider.success(
-                data=[cls._serialize(r) for r in reconciliations]
+            reconciliations, next_cursor = CursorPaginator.from_request(request).paginate(
+                DisbursementReconciliationService().get_all_reconciliations()
+            )
+            return ResponseProvider.paginated(
+                data=[cls._serialize(r) for r in reconciliations],
+                next_cursor=next_cursor,
             )
         except Exception as ex:
             return ResponseProvider.handle_exception(ex)
@@ -179,6 +183,7 @@ class DisbursementReconciliationController:
             "approved_by": reconciliation.approved_by.email if reconciliation.approved_by else None,
             "approved_at": reconciliation.approved_at.isoformat() if reconciliation.approved_at else None,
             "receipt": reconciliation.receipt.url if reconciliation.receipt else None,
+            "duplicate_receipt_of": (reconciliation.metadata or {}).get("duplicate_receipt_of", []),
             "is_active": reconciliation.is_active,
             "created_at": str(reconciliation.created_at),
             "updated_at": str(reconciliation.updated_at),
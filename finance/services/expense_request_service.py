@@ -2,6 +2,7 @@ from django.conf.locale import tr
 
 from utils.response_provider import ResponseProvider
 from utils.common import get_clean_request_data
+from utils.pagination import CursorPaginator
 from services.services import ExpenseRequestService, NotificationService, UserService
 from finance.models import ExpenseRequest
 from users.models import User
@@ -101,18 +102,43 @@ class ExpenseRequestController:
     @classmethod
     def get_all_expense_requests(cls, request):
         """
-        Retrieves all active expense requests.
+        Retrieves one page of active expense requests, newest first.
+
+        Args:
+            request: The HTTP request object. Reads the limit/cursor query params.
+
+        Returns:
+            JsonResponse: 200 with a page of serialized expense requests and next_cursor.
+        """
+        try:
+            expenses, next_cursor = CursorPaginator.from_request(request).paginate(
+                ExpenseRequestService().get_all()
+            )
+            return ResponseProvider.paginated(
+                data=[cls._serialize(expense) for expense in expenses],
+                next_cursor=next_cursor,
+            )
+        except Exception as ex:
+            return ResponseProvider().handle_exception(ex)
+
+    @classmethod
+    def export_expense_requests(cls, request):
+        """
+        Streams every active expense request, newest first, for exports.
+        Unlike get_all_expense_requests this is not paged — rows are encoded as
+        they are read so memory stays flat regardless of table size.
 
         Args:
             request: The HTTP request object.
 
         Returns:
-            JsonResponse: 200 with list of serialized expense requests.
+            StreamingHttpResponse: 200 with the full list of serialized expense requests.
         """
         try:
-            expenses = ExpenseRequestService().get_all()
-            return ResponseProvider.success(
-                data=[cls._serialize(expense) for expense in expenses]
+            return ResponseProvider.stream(
+                ExpenseRequestService().get_all().order_by("-created_at", "-id"),
+                cls._serialize,
+                request=request,
             )
         except Exception as ex:
             return ResponseProvider().handle_exception(ex)
@@ -281,6 +307,142 @@ class ExpenseRequestController:
         except Exception as ex:
             return ResponseProvider().handle_exception(ex)
 
+    # most requests one reviewer can hold at a time
+    CLAIM_LIMIT = 50
+
+    @classmethod
+    def claim_expense_requests(cls, request):
+        """
+            Finance Officer takes the next batch of requests from a queue.
+        Each FO gets a disjoint set, leased for ExpenseRequestService.CLAIM_LEASE_SECONDS,
+        so reviewers working the same queue never block on each other's row locks.
+        Calling it again renews the FO's unfinished claims and tops the batch up.
+
+        Args:
+            request: The HTTP request object. May contain:
+                - limit (int, optional): Batch size, default 10, at most CLAIM_LIMIT.
+                - stage (str, optional): 'pending' (to decide, default) or 'approved' (to disburse).
+
+        Returns:
+            JsonResponse: 200 with the claimed expenses and their lease expiry.
+        """
+        try:
+            data = get_clean_request_data(request, allowed_fields={"limit", "stage"})
+
+            try:
+                limit = int(data.get("limit") or 10)
+            except (TypeError, ValueError):
+                raise ValueError("limit must be a whole number.")
+            if not 1 <= limit <= cls.CLAIM_LIMIT:
+                raise ValueError(f"limit must be between 1 and {cls.CLAIM_LIMIT}.")
+
+            expenses = ExpenseRequestService().claim_next(
+                reviewer=request.user, limit=limit, stage=data.get("stage") or "pending"
+            )
+            return ResponseProvider().success(
+                message=f"{len(expenses)} expense request(s) claimed",
+                data=[
+                    {
+                        **cls._serialize(expense),
+                        "employee_email": expense.employee.email,
+                        "claim_expires_at": expense.claim_expires_at.isoformat(),
+                    }
+                    for expense in expenses
+                ],
+            )
+        except Exception as ex:
+            return ResponseProvider().handle_exception(ex)
+
+    @classmethod
+    def release_expense_claims(cls, request):
+        """
+            Finance Officer hands claimed requests back to the queue.
+
+        Args:
+            request: The HTTP request object. May contain:
+                - expense_ids (list[str], optional): Requests to release; all claims when omitted.
+
+        Returns:
+            JsonResponse: 200 with the number of released requests.
+        """
+        try:
+            data = get_clean_request_data(request, allowed_fields={"expense_ids"})
+            expense_ids = data.get("expense_ids")
+            if expense_ids is not None and not isinstance(expense_ids, list):
+                raise ValueError("expense_ids must be a list of expense request ids.")
+
+            released = ExpenseRequestService().release_claims(request.user, expense_ids)
+            return ResponseProvider().success(
+                message=f"{released} expense request(s) released",
+                data={"released": released},
+            )
+        except Exception as ex:
+            return ResponseProvider().handle_exception(ex)
+
+    # upper bound on one bulk decision — keeps the lock set and the request time bounded
+    BULK_DECISION_LIMIT = 500
+
+    @classmethod
+    def bulk_decide_expense_requests(cls, request):
+        """
+            Finance Officer approves or rejects many pending expense requests at once,
+        e.g. the month-end queue. Each employee is notified about their own
+        request; items that cannot be decided are reported without failing the rest.
+
+        Args:
+            request: The HTTP request object. Must contain:
+                - expense_ids (list[str]): IDs of the expense requests, at most BULK_DECISION_LIMIT.
+                - decision (str): 'approved' or 'rejected'.
+                - reason (str, optional): Reason stored on every decided request.
+
+        Returns:
+            JsonResponse: 200 with the decided expenses and the per-item failures.
+        """
+        try:
+            data = get_clean_request_data(
+                request,
+                required_fields={"expense_ids", "decision"},
+                allowed_fields={"expense_ids", "decision", "reason"},
+            )
+
+            expense_ids = data.get("expense_ids")
+            decision = data.get("decision")
+
+            if not isinstance(expense_ids, list):
+                raise ValueError("expense_ids must be a list of expense request ids.")
+            if len(expense_ids) > cls.BULK_DECISION_LIMIT:
+                raise ValueError(
+                    f"At most {cls.BULK_DECISION_LIMIT} expense requests can be decided at once."
+                )
+
+            with transaction.atomic():
+                expenses, logs, failures = ExpenseRequestService().bulk_approve_or_reject(
+                    request=request,
+                    expense_ids=expense_ids,
+                    decision=decision,
+                    triggered_by=request.user,
+                    reason=data.get("reason"),
+                )
+
+                NotificationService().notify_bulk(
+                    [(log, expense.employee) for expense, log in zip(expenses, logs)],
+                    channel=Notifications.Channel.EMAIL,
+                )
+
+            return ResponseProvider().success(
+                message=f"{len(expenses)} expense request(s) {decision}, {len(failures)} skipped",
+                data={
+                    "decided": [cls._serialize(expense) for expense in expenses],
+                    "failed": [
+                        {"id": expense_id, "error": error}
+                        for expense_id, error in failures.items()
+                    ],
+                },
+            )
+
+        except Exception as ex:
+            return ResponseProvider().handle_exception(ex)
+
     @classmethod
     def disburse_expense_request(cls, request, expense_id: str):
         """
@@ -291,7 +453,9 @@ class ExpenseRequestController:
           DisbursementReconciliation record pending employee receipt submission.
 
         Args:
-            request: The HTTP request object.
+            request: The HTTP request object. May contain:
+                - pettycash_account_id (str, optional): Account to pay from.
+                  Defaults to the active petty cash account.
             expense_id (str): The UUID of the expense request to disburse.
 
         Returns:
@@ -301,9 +465,15 @@ class ExpenseRequestController:
             :return:
         """
         try:
+            data = get_clean_request_data(
+                request, allowed_fields={"pettycash_account_id"}
+            )
             with transaction.atomic():
                 expense, log = ExpenseRequestService().disburse(
-                    request=request, expense_id=expense_id, triggered_by=request.user
+                    request=request,
+                    expense_id=expense_id,
+                    triggered_by=request.user,
+                    pettycash_account_id=data.get("pettycash_account_id"),
                 )
                 NotificationService().notify(
                     transaction_log=log,
@@ -329,5 +499,6 @@ class ExpenseRequestController:
             "expense_type": expense.expense_type,
             "description": expense.description,
             "status": expense.status.name if expense.status else None,
+            "duplicate_receipt_of": expense.metadata.get("duplicate_receipt_of", []),
             "created_at": expense.created_at.isoformat(),
         }
@@ -2,6 +2,7 @@ from django.db import DataError, IntegrityError,OperationalError
 from finance.models import TopUpRequest
 from utils.response_provider import ResponseProvider
 from utils.common import get_clean_request_data
+from utils.pagination import CursorPaginator
 from services.services import TopUpRequestService
 import logging
 logger = logging.getLogger(__name__)
@@ -49,19 +50,22 @@ class TopUpRequestController:
     @classmethod
     def list_all(cls, request):
         """
-        Retrieves all active top-up requests.
+        Retrieves one page of active top-up requests, newest first.
 
         Args:
-            request: The HTTP request object.
+            request: The HTTP request object. Reads the limit/cursor query params.
 
         Returns:
-            JsonResponse: 200 with list of serialized top-up requests.
+            JsonResponse: 200 with a page of serialized top-up requests and next_cursor.
 
         """
         try:
-            topups = TopUpRequestService().get_all()
-            return ResponseProvider().success(
-                data=[cls._serialize(topup) for topup in topups]
+            topups, next_cursor = CursorPaginator.from_request(request).paginate(
+                TopUpRequestService().get_all()
+            )
+            return ResponseProvider().paginated(
+                data=[cls._serialize(topup) for topup in topups],
+                next_cursor=next_cursor,
             )
         except Exception as ex:
             return ResponseProvider().handle_exception(ex)
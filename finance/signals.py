@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from audit.models import EventTypes
+from base.models import Category, Status
+from finance.default import reset_default_cache
+
+
+@receiver([post_save, post_delete], sender=Status)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=EventTypes)
+def reset_memoized_defaults(sender, **kwargs):
+    """The memoized default ids must follow admin edits to the lookup rows."""
+    reset_default_cache()
@@ -1,3 +1,717 @@
-from django.test import TestCase
+import datetime
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from io import StringIO
+from threading import Barrier, Event, Thread
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Case, F, Sum, When
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from audit.models import DashboardCounter, EmailOutbox, EventTypes, Notifications, TransactionLogBase
+from base.models import Category, Status
+from finance.models import (
+    DisbursementReconciliation,
+    ExpenseRequest,
+    PettyCashAccount,
+    PettyCashLedgerEntry,
+    ReceiptBlob,
+    TopUpRequest,
+)
+from services.lookup_registry import LookupRegistry
+from services.services import (
+    ExpenseRequestService,
+    NotificationService,
+    PettyCashLedgerService,
+    PettyCashThresholdMonitor,
+    ReceiptStorageService,
+    TopUpRequestService,
+)
+from utils.testing import QueryPlanTestCase, auth_headers, create_user, create_workflow_lookups
+
+
+def create_expense(employee, amount=100, title="Expense", receipt=None):
+    request = RequestFactory().post("/")
+    request.user = employee
+    expense, _ = ExpenseRequestService().create(
+        request, title, "0700000000", "", amount, employee, "disbursement", receipt=receipt
+    )
+    return expense
+
+
+def dashboard_count(status_code, entity_type="ExpenseRequest") -> int:
+    """The all-users, all-time DashboardCounter for a status bucket."""
+    counter = DashboardCounter.objects.filter(
+        entity_type=entity_type, status_code=status_code, user=None, month=None
+    ).first()
+    return counter.count if counter else 0
+
+
+class FinanceQueryPlanTests(QueryPlanTestCase):
+    """Expense request and top-up reads use their indexes."""
+
+    @classmethod
+    def seed(cls, rows=300):
+        category, _ = Category.objects.get_or_create(code="expense", defaults={"name": "Expense"})
+        statuses = [
+            Status.objects.get_or_create(code=code, defaults={"name": code.title()})[0]
+            for code in ("pending", "approved", "rejected")
+        ]
+        events = {
+            code: EventTypes.objects.get_or_create(
+                code=code, defaults={"name": code, "event_category": category}
+            )[0]
+            for code in ("expense_submitted", "topup_requested")
+        }
+        users = [create_user(f"plan-{i}@test.local", "EMP") for i in range(10)]
+        accounts = [PettyCashAccount.objects.create(name=f"plan-{i}") for i in range(10)]
+        cls.employee, cls.officer, cls.account = users[0], users[1], accounts[0]
+
+        ExpenseRequest.objects.bulk_create(
+            [
+                ExpenseRequest(
+                    employee=users[i % len(users)],
+                    category=category,
+                    event_type=events["expense_submitted"],
+                    status=statuses[i % 3],
+                    amount=Decimal("10.00"),
+                    is_active=i % 10 != 0,
+                )
+                for i in range(rows)
+            ]
+        )
+        TopUpRequest.objects.bulk_create(
+            [
+                TopUpRequest(
+                    pettycash_account=accounts[i % len(accounts)],
+                    requested_by=users[i % len(users)],
+                    event_type=events["topup_requested"],
+                    status=statuses[i % 3],
+                    amount=Decimal("100.00"),
+                )
+                for i in range(rows)
+            ]
+        )
+
+    def test_expense_listing_uses_active_recent_index(self):
+        self.assertUsesIndex(
+            ExpenseRequestService().get_all().order_by("-created_at", "-id")[:26],
+            "expense_active_recent_idx",
+        )
+
+    def test_my_expense_requests_uses_employee_index(self):
+        self.assertUsesIndex(
+            ExpenseRequestService().get_my_expense_requests(authUser=self.employee),
+            "expense_employee_active_idx",
+        )
+
+    def test_pending_for_fo_uses_status_index(self):
+        self.assertUsesIndex(
+            ExpenseRequestService().get_all_pending_for_fo(),
+            "expense_status_active_idx",
+        )
+
+    def test_top_up_listing_uses_active_recent_index(self):
+        self.assertUsesIndex(
+            TopUpRequestService().get_all().order_by("-created_at", "-id")[:26],
+            "topup_active_recent_idx",
+        )
+
+    def test_auto_top_up_pending_guard_uses_account_status_index(self):
+        # exists() drops the default ordering
+        self.assertUsesIndex(
+            TopUpRequest.objects.filter(
+                pettycash_account=self.account, status_code="pending", is_active=True
+            ).order_by(),
+            "topup_account_status_idx",
+        )
+
+    def test_my_top_up_requests_uses_requester_index(self):
+        self.assertUsesIndex(
+            TopUpRequestService().get_authuser_top_up_requests(auth_user=self.officer),
+            "topup_requester_active_idx",
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "sqlite serialises writers with 'database is locked'")
+class PettyCashLedgerConcurrencyTests(TransactionTestCase):
+    """Parallel credits and debits through PettyCashLedgerService.record() lose no update."""
+
+    writers = 8
+    operations = 25
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        self.account = PettyCashAccount.objects.create(name="ledger stress", is_active=False)
+
+    @staticmethod
+    def delta(writer, operation):
+        # every writer credits twice what it then debits, so the balance never goes negative
+        amount = Decimal(writer + 1)
+        return amount * 2 if operation % 2 == 0 else -amount
+
+    def write(self, writer, start):
+        start.wait()
+        try:
+            for operation in range(self.operations):
+                delta = self.delta(writer, operation)
+                entry_type = (
+                    PettyCashLedgerEntry.EntryType.CREDIT
+                    if delta > 0
+                    else PettyCashLedgerEntry.EntryType.DEBIT
+                )
+                PettyCashLedgerService.record(
+                    PettyCashAccount.objects.get(id=self.account.id),
+                    abs(delta),
+                    entry_type,
+                    description="stress",
+                )
+        finally:
+            connection.close()
+
+    def test_final_balance_equals_ledger_total(self):
+        start = Barrier(self.writers)
+        with ThreadPoolExecutor(max_workers=self.writers) as pool:
+            for future in [pool.submit(self.write, w, start) for w in range(self.writers)]:
+                future.result()
+
+        expected = sum(
+            (self.delta(w, o) for w in range(self.writers) for o in range(self.operations)),
+            Decimal("0"),
+        )
+        entries = PettyCashLedgerEntry.objects.filter(account=self.account)
+        ledger_total = entries.aggregate(
+            total=Sum(
+                Case(
+                    When(entry_type=PettyCashLedgerEntry.EntryType.CREDIT, then=F("amount")),
+                    default=-F("amount"),
+                )
+            )
+        )["total"]
+        self.account.refresh_from_db(fields=["current_balance"])
+
+        self.assertEqual(entries.count(), self.writers * self.operations)
+        self.assertEqual(ledger_total, expected)
+        self.assertEqual(self.account.current_balance, ledger_total)
+
+        # balance_after chains in commit order: each entry moves the previous one by its amount
+        running = Decimal("0")
+        for entry_type, amount, balance_after in entries.order_by("created_at", "id").values_list(
+            "entry_type", "amount", "balance_after"
+        ):
+            running += amount if entry_type == PettyCashLedgerEntry.EntryType.CREDIT else -amount
+            self.assertEqual(balance_after, running)
+
+
+class BulkDecisionTests(TestCase):
+    """ExpenseRequestService.bulk_approve_or_reject and the expense/decide/ endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_workflow_lookups()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.other_employee = create_user("other@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+        cls.other_officer = create_user("officer2@test.local", "FO")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        cache.clear()
+        self.first = create_expense(self.employee, title="First")
+        self.second = create_expense(self.other_employee, title="Second")
+        self.decided = create_expense(self.employee, title="Decided")
+        ExpenseRequestService().approve_or_reject(None, self.decided.id, "approved", self.officer)
+
+    def decide(self, expense_ids, decision="rejected", reviewer=None):
+        return self.client.post(
+            reverse("bulk-decide-expense-requests"),
+            {"expense_ids": expense_ids, "decision": decision, "reason": "month end"},
+            content_type="application/json",
+            headers=auth_headers(reviewer or self.officer),
+        )
+
+    def test_mixed_batch_decides_pending_items_and_reports_the_rest(self):
+        unknown = str(uuid.uuid4())
+        first, second, decided = str(self.first.id), str(self.second.id), str(self.decided.id)
+        response = self.decide([first, second, first, decided, unknown, "garbage"])
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(sorted(item["id"] for item in data["decided"]), sorted([first, second]))
+        failed = {item["id"]: item["error"] for item in data["failed"]}
+        self.assertEqual(set(failed), {decided, unknown, "garbage"})
+        self.assertIn("Current status: approved", failed[decided])
+        self.assertEqual(failed[unknown], "Expense request not found.")
+        self.assertEqual(failed["garbage"], "Invalid expense request id.")
+
+        for expense in (self.first, self.second):
+            expense.refresh_from_db()
+            self.assertEqual(expense.status.code, "rejected")
+            self.assertEqual(expense.status_code, "rejected")
+            self.assertEqual(expense.metadata["decision_reason"], "month end")
+        self.decided.refresh_from_db()
+        self.assertEqual(self.decided.status_code, "approved")
+
+    def test_mixed_batch_moves_dashboard_counters_once_per_decided_item(self):
+        self.assertEqual((dashboard_count("pending"), dashboard_count("rejected")), (2, 0))
+
+        first, second, decided = str(self.first.id), str(self.second.id), str(self.decided.id)
+        self.decide([first, second, first, decided])
+
+        self.assertEqual(dashboard_count("pending"), 0)
+        self.assertEqual(dashboard_count("rejected"), 2)
+        self.assertEqual(dashboard_count("approved"), 1)
+
+    def test_each_employee_is_notified_about_their_own_request(self):
+        first, second = str(self.first.id), str(self.second.id)
+        self.decide([first, second])
+
+        logs = TransactionLogBase.objects.filter(event_type__code="expense_rejected")
+        self.assertEqual(sorted(logs.values_list("entity_id", flat=True)), sorted([first, second]))
+        notifications = Notifications.objects.filter(transaction_log__in=logs)
+        self.assertEqual(
+            sorted((n.transaction_log.entity_id, n.recipient_id) for n in notifications),
+            sorted([(first, self.employee.id), (second, self.other_employee.id)]),
+        )
+        self.assertEqual(EmailOutbox.objects.filter(notification__in=notifications).count(), 2)
+
+    def test_items_claimed_by_another_reviewer_are_skipped(self):
+        ExpenseRequest.objects.filter(id=self.first.id).update(
+            claimed_by=self.other_officer,
+            claim_expires_at=timezone.now() + datetime.timedelta(minutes=5),
+        )
+
+        expenses, _, failures = ExpenseRequestService().bulk_approve_or_reject(
+            None, [self.first.id, self.second.id], "approved", self.officer
+        )
+
+        self.assertEqual([expense.id for expense in expenses], [self.second.id])
+        self.assertEqual(failures, {str(self.first.id): "Claimed by another reviewer."})
+
+    def test_unknown_decision_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ExpenseRequestService().bulk_approve_or_reject(
+                None, [self.first.id], "disbursed", self.officer
+            )
+
+    def test_rollback_leaves_no_decision_notification_or_wake_up(self):
+        notifications_before = Notifications.objects.count()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    expenses, logs, _ = ExpenseRequestService().bulk_approve_or_reject(
+                        None, [self.first.id, self.second.id], "approved", self.officer
+                    )
+                    NotificationService.notify_bulk(
+                        [(log, expense.employee) for expense, log in zip(expenses, logs)]
+                    )
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(callbacks, [])  # no outbox wake-up or unread count push
+        self.assertEqual(Notifications.objects.count(), notifications_before)
+        self.assertEqual(dashboard_count("pending"), 2)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.status_code, "pending")
+
+
+class DenormalizedStatusTests(TestCase):
+    """status_code follows the status FK through save(), the bulk paths and every service transition."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_workflow_lookups()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+        cls.cfo = create_user("cfo@test.local", "CFO")
+        cls.system_user = create_user("system@test.local", "SYS")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        cache.clear()
+        self.expense = create_expense(self.employee)
+        self.approved = LookupRegistry.status("approved")
+
+    def assert_status_codes_in_sync(self):
+        for model in (ExpenseRequest, TopUpRequest, DisbursementReconciliation):
+            with self.subTest(model=model.__name__):
+                self.assertQuerySetEqual(model.objects.exclude(status_code=F("status__code")), [])
+
+    def stored_code(self, expense=None):
+        return ExpenseRequest.objects.values_list("status_code", flat=True).get(
+            id=(expense or self.expense).id
+        )
+
+    def test_save_after_a_status_change(self):
+        self.expense.status = self.approved
+        self.expense.save()
+
+        self.assertEqual(self.expense.status_code, "approved")
+        self.assertEqual(self.stored_code(), "approved")
+
+    def test_save_with_update_fields_writes_status_code(self):
+        self.expense.status = self.approved
+        self.expense.save(update_fields=["status"])
+
+        self.assertEqual(self.stored_code(), "approved")
+
+    def test_uncached_status_is_resolved_from_the_registry(self):
+        expense = ExpenseRequest.objects.get(id=self.expense.id)
+        expense.status_id = self.approved.id
+
+        with self.assertNumQueries(0):
+            self.assertTrue(expense.sync_status_code())
+        self.assertEqual(expense.status_code, "approved")
+
+    def test_bulk_create(self):
+        (created,) = ExpenseRequest.objects.bulk_create(
+            [ExpenseRequest(employee=self.employee, title="Bulk", amount=Decimal("5.00"))]
+        )
+
+        self.assertEqual(created.status_code, "pending")
+        self.assertEqual(self.stored_code(created), "pending")
+
+    def test_bulk_update(self):
+        self.expense.status = self.approved
+        ExpenseRequest.objects.bulk_update([self.expense], ["status"])
+
+        self.assertEqual(self.stored_code(), "approved")
+
+    def test_queryset_update(self):
+        expenses = ExpenseRequest.objects.filter(id=self.expense.id)
+
+        expenses.update(status=self.approved)
+        self.assertEqual(self.stored_code(), "approved")
+
+        expenses.update(status_id=LookupRegistry.status("rejected").id)
+        self.assertEqual(self.stored_code(), "rejected")
+
+    def test_service_transitions_keep_status_code_in_sync(self):
+        service = ExpenseRequestService()
+        account = PettyCashAccount.objects.create(
+            name="Main", current_balance=Decimal("1000.00"), minimum_threshold=Decimal("950.00")
+        )
+        request = RequestFactory().post("/")
+        request.user = self.officer
+
+        service.approve_or_reject(None, self.expense.id, "approved", self.officer)
+        self.assert_status_codes_in_sync()
+        with self.captureOnCommitCallbacks(execute=True):  # falls below threshold → auto top-up
+            service.disburse(None, self.expense.id, self.officer, str(account.id))
+        self.assert_status_codes_in_sync()
+
+        rejected, first, second, withdrawn = (create_expense(self.employee) for _ in range(4))
+        service.approve_or_reject(None, rejected.id, "rejected", self.officer, reason="No receipt")
+        service.bulk_approve_or_reject(None, [first.id, second.id], "approved", self.officer)
+        employee_request = RequestFactory().post("/")
+        employee_request.user = self.employee
+        service.deactivate(employee_request, withdrawn.id, self.employee)
+        self.assert_status_codes_in_sync()
+
+        topups = TopUpRequestService()
+        topup = topups.create_top_up_request(request, account.id, self.officer, "Float", 200)
+        topups.decide_top_up_request(None, topup.id, "approved", self.cfo, "")
+        topups.disburse_top_up_request(topup.id, self.officer)
+        self.assert_status_codes_in_sync()
+
+        self.assertEqual(
+            sorted(ExpenseRequest.objects.values_list("status_code", flat=True)),
+            ["INACT", "approved", "approved", "disbursed", "rejected"],
+        )
+        self.assertEqual(
+            sorted(TopUpRequest.objects.values_list("is_auto_triggered", "status_code")),
+            [(False, "complete"), (True, "pending")],
+        )
+
+
+class ReceiptStorageTests(TestCase):
+    """Receipts are stored once per content and reference counted."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_workflow_lookups()
+        cls.employee = create_user("employee@test.local", "EMP")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    @staticmethod
+    def upload(content=b"%PDF-1.4 receipt", name="receipt.pdf"):
+        return SimpleUploadedFile(name, content, content_type="application/pdf")
+
+    def test_same_bytes_share_one_blob_and_flag_the_duplicate(self):
+        first = create_expense(self.employee, title="First", receipt=self.upload())
+        second = create_expense(self.employee, title="Second", receipt=self.upload(name="copy.pdf"))
+        other = create_expense(self.employee, title="Other", receipt=self.upload(b"other bytes"))
+
+        self.assertEqual(first.receipt_blob_id, second.receipt_blob_id)
+        self.assertNotEqual(first.receipt_blob_id, other.receipt_blob_id)
+        self.assertEqual(ReceiptBlob.objects.count(), 2)
+        blob = ReceiptBlob.objects.get(id=first.receipt_blob_id)
+        self.assertEqual(blob.ref_count, 2)
+        self.assertTrue(default_storage.exists(blob.file.name))
+        self.assertEqual(second.receipt, blob.file.name)
+
+        self.assertNotIn("duplicate_receipt_of", first.metadata)
+        self.assertEqual(second.metadata["duplicate_receipt_of"], [str(first.id)])
+        self.assertNotIn("duplicate_receipt_of", other.metadata)
+
+    def test_release_drops_one_reference_and_never_goes_negative(self):
+        blob = ReceiptStorageService.store(self.upload())
+        ReceiptStorageService.store(self.upload())
+
+        ReceiptStorageService.release(blob.id)
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 1)
+
+        ReceiptStorageService.release(blob.id)
+        ReceiptStorageService.release(blob.id)
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 0)
+
+    def test_collect_removes_only_unreferenced_blobs(self):
+        kept = create_expense(self.employee, receipt=self.upload()).receipt_blob
+        released = ReceiptStorageService.store(self.upload(b"released"))
+        ReceiptStorageService.release(released.id)
+
+        call_command("collect_receipt_blobs", "--no-backfill", stdout=StringIO())
+
+        self.assertEqual(list(ReceiptBlob.objects.values_list("id", flat=True)), [kept.id])
+        self.assertTrue(default_storage.exists(kept.file.name))
+        self.assertFalse(default_storage.exists(released.file.name))
+
+    def test_rolled_back_upload_leaves_a_file_that_collect_removes(self):
+        kept = create_expense(self.employee, receipt=self.upload()).receipt_blob
+        try:
+            with transaction.atomic():
+                orphan = ReceiptStorageService.store(self.upload(b"rolled back")).file.name
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertTrue(default_storage.exists(orphan))
+
+        # still inside the grace period: its transaction might not have committed yet
+        self.assertEqual(ReceiptStorageService.purge_orphan_files(), 0)
+
+        with mock.patch.object(ReceiptStorageService, "ORPHAN_GRACE_SECONDS", -60):
+            call_command("collect_receipt_blobs", "--no-backfill", stdout=StringIO())
+
+        self.assertFalse(default_storage.exists(orphan))
+        self.assertTrue(default_storage.exists(kept.file.name))
+
+    def test_leftover_file_at_the_hash_path_is_not_reused(self):
+        try:
+            with transaction.atomic():
+                orphan = ReceiptStorageService.store(self.upload()).file.name
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        blob = create_expense(self.employee, receipt=self.upload()).receipt_blob
+
+        # the sweep may delete the leftover at any time, so the new blob must not point at it
+        self.assertNotEqual(blob.file.name, orphan)
+        self.assertTrue(default_storage.exists(blob.file.name))
+
+
+class PettyCashLedgerTests(TestCase):
+    """Debits through the ledger: overdraw guard, disbursement and auto top-ups."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_workflow_lookups()
+        cls.employee = create_user("employee@test.local", "EMP")
+        cls.officer = create_user("officer@test.local", "FO")
+        cls.system_user = create_user("system@test.local", "SYS")
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        self.account = PettyCashAccount.objects.create(
+            name="Main", current_balance=Decimal("100.00"), minimum_threshold=Decimal("60.00")
+        )
+
+    def debit(self, amount):
+        return PettyCashLedgerService.record(
+            PettyCashAccount.objects.get(id=self.account.id),
+            Decimal(amount),
+            PettyCashLedgerEntry.EntryType.DEBIT,
+        )
+
+    def auto_top_ups(self):
+        return TopUpRequest.objects.filter(pettycash_account=self.account, is_auto_triggered=True)
+
+    def test_overdraw_is_rolled_back(self):
+        account = PettyCashAccount.objects.get(id=self.account.id)
+
+        with self.assertRaises(ValueError):
+            PettyCashLedgerService.record(account, Decimal("150"), PettyCashLedgerEntry.EntryType.DEBIT)
+
+        self.assertEqual(account.current_balance, Decimal("100.00"))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.current_balance, Decimal("100.00"))
+        self.assertFalse(PettyCashLedgerEntry.objects.filter(account=self.account).exists())
+
+    def test_disburse_debits_the_ledger_once(self):
+        expense = create_expense(self.employee, amount=30)
+        ExpenseRequestService().approve_or_reject(None, expense.id, "approved", self.officer)
+
+        ExpenseRequestService().disburse(None, expense.id, self.officer, str(self.account.id))
+        with self.assertRaises(ValueError):  # no longer approved
+            ExpenseRequestService().disburse(None, expense.id, self.officer, str(self.account.id))
+
+        entries = PettyCashLedgerEntry.objects.filter(account=self.account)
+        self.assertEqual(
+            list(entries.values_list("entry_type", "amount", "balance_after", "entity_id")),
+            [(PettyCashLedgerEntry.EntryType.DEBIT, Decimal("30.00"), Decimal("70.00"), str(expense.id))],
+        )
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.current_balance, Decimal("70.00"))
+        expense.refresh_from_db()
+        self.assertEqual(expense.status_code, "disbursed")
+
+    def test_debit_below_threshold_raises_one_auto_top_up_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.debit("50")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.debit("10")  # still below, but a top-up is already pending
+
+        topup = self.auto_top_ups().get()
+        self.assertEqual(topup.status_code, "pending")
+        self.assertEqual(topup.requested_by, self.system_user)
+        self.assertEqual(topup.amount, Decimal("10.00"))  # back up to the threshold at the time
+
+    def test_debit_above_threshold_raises_no_top_up(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.debit("40")
+
+        self.assertFalse(self.auto_top_ups().exists())
+
+    def test_rolled_back_debit_raises_no_top_up(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.debit("50")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertEqual(callbacks, [])
+        self.assertFalse(self.auto_top_ups().exists())
+
+    def test_missing_system_user_is_logged_as_an_error(self):
+        self.system_user.delete()
+
+        with self.assertLogs("services.services", "ERROR") as logs:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.debit("50")
+
+        self.assertIn("No system user found", "\n".join(logs.output))
+        self.assertFalse(self.auto_top_ups().exists())
+        with self.assertRaises(ImproperlyConfigured):
+            PettyCashThresholdMonitor.sweep()
+
+
+@skipUnless(connection.vendor == "postgresql", "claims rely on SELECT ... FOR UPDATE SKIP LOCKED")
+class ExpenseClaimTests(TransactionTestCase):
+    """ExpenseRequestService.claim_next leases: SKIP LOCKED, expiry and release on decision."""
+
+    def setUp(self):
+        create_workflow_lookups()
+        self.employee = create_user("employee@test.local", "EMP")
+        self.reviewer = create_user("officer@test.local", "FO")
+        self.other_reviewer = create_user("officer2@test.local", "FO")
+        self.expenses = [create_expense(self.employee, title=f"Expense {i}") for i in range(6)]
+
+    def claimed_ids(self, reviewer, limit):
+        return {expense.id for expense in ExpenseRequestService().claim_next(reviewer, limit)}
+
+    def test_rows_locked_by_another_claim_are_skipped_not_waited_on(self):
+        locked, release = Event(), Event()
+        held = [expense.id for expense in self.expenses[:3]]
+
+        def hold_locks():
+            try:
+                with transaction.atomic():
+                    list(ExpenseRequest.objects.select_for_update().filter(id__in=held))
+                    locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        holder = Thread(target=hold_locks)
+        holder.start()
+        try:
+            self.assertTrue(locked.wait(10))
+            with connection.cursor() as cursor:
+                cursor.execute("SET lock_timeout = '2s'")  # waiting instead of skipping fails fast
+            claimed = self.claimed_ids(self.reviewer, 3)
+        finally:
+            release.set()
+            holder.join()
+            with connection.cursor() as cursor:
+                cursor.execute("RESET lock_timeout")
+
+        self.assertEqual(claimed, {expense.id for expense in self.expenses[3:]})
+
+    def test_parallel_reviewers_get_disjoint_rows(self):
+        start = Barrier(2)
+
+        def claim(reviewer):
+            start.wait()
+            try:
+                return self.claimed_ids(reviewer, 3)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first, second = pool.map(claim, [self.reviewer, self.other_reviewer])
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 3)
+        self.assertFalse(first & second)
+
+    def test_live_claim_is_kept_and_expired_claim_is_reclaimable(self):
+        claimed = self.claimed_ids(self.reviewer, 6)
+        self.assertEqual(self.claimed_ids(self.other_reviewer, 6), set())
+        self.assertEqual(self.claimed_ids(self.reviewer, 6), claimed)  # renewed, not lost
+
+        expired = self.expenses[0].id
+        ExpenseRequest.objects.filter(id=expired).update(
+            claim_expires_at=timezone.now() - datetime.timedelta(seconds=1)
+        )
+
+        self.assertEqual(self.claimed_ids(self.other_reviewer, 6), {expired})
+        self.assertEqual(ExpenseRequest.objects.get(id=expired).claimed_by, self.other_reviewer)
+
+    def test_claim_is_cleared_when_the_request_leaves_the_queue(self):
+        decided, bulk_decided = self.expenses[0].id, self.expenses[1].id
+        self.claimed_ids(self.reviewer, 2)
+
+        ExpenseRequestService().approve_or_reject(None, decided, "approved", self.reviewer)
+        ExpenseRequestService().bulk_approve_or_reject(None, [bulk_decided], "rejected", self.reviewer)
+
+        for expense in ExpenseRequest.objects.filter(id__in=[decided, bulk_decided]):
+            self.assertIsNone(expense.claimed_by_id)
+            self.assertIsNone(expense.claim_expires_at)
+
+        # the approved request enters the disbursement queue unclaimed
+        approved = ExpenseRequestService().claim_next(self.other_reviewer, 1, stage="approved")
+        self.assertEqual([expense.id for expense in approved], [decided])
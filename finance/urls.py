@@ -5,7 +5,8 @@ from .views import (create_expense_view, create_petty_cash_view, create_topup_vi
   list_all_expenses_view, list_all_reconciliations_view, list_all_topups_view,
   list_my_expenses_view, list_my_reconciliations_view, list_my_topups_view,
   review_reconciliation_view, submit_reconciliation_receipt_view, update_expense_view,
-  update_petty_cash_view, update_topup_view, decide_expense_view,disburse_expense_view)
+  update_petty_cash_view, update_topup_view, decide_expense_view,disburse_expense_view,
+  export_expenses_view, bulk_decide_expenses_view, claim_expenses_view, release_expense_claims_view)
 
 urlpatterns = [
   path('petty_cash/create/',create_petty_cash_view, name='create-petty-cash-account'),
@@ -18,6 +19,10 @@ urlpatterns = [
   path('expense/create/', create_expense_view, name='create-expense-request'),
   path('expense/', list_all_expenses_view, name='list-all-expense-requests'),
   path('expense/mine/', list_my_expenses_view, name='list-my-expense-requests'),
+  path('expense/export/', export_expenses_view, name='export-expense-requests'),
+  path('expense/decide/', bulk_decide_expenses_view, name='bulk-decide-expense-requests'),
+  path('expense/claim/', claim_expenses_view, name='claim-expense-requests'),
+  path('expense/claim/release/', release_expense_claims_view, name='release-expense-claims'),
   path('expense/<str:expense_id>/decide/', decide_expense_view, name='decide-expense-request'),
   path('expense/<str:expense_id>/disburse/', disburse_expense_view, name='disburse-expense-request'),
   path('expense/<str:expense_id>/update/', update_expense_view, name='update-expense-request'),
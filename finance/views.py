@@ -1,9 +1,10 @@
 from typing import Any
 
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from utils.decorators.allowed_http_methods import allowed_http_methods
 from utils.decorators.login_required import login_required
+from utils.decorators.read_replica import read_replica
 
 from utils.response_provider import ResponseProvider
 from finance.services.expense_request_service import ExpenseRequestController
@@ -73,10 +74,18 @@ def create_expense_view(request) -> JsonResponse:
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("ADM", "CFO", "FO")
+@read_replica()
 def list_all_expenses_view(request) -> JsonResponse:
     return ExpenseRequestController().get_all_expense_requests(request)
 
 
+@csrf_exempt
+@allowed_http_methods("GET")
+@login_required("ADM", "CFO", "FO")
+def export_expenses_view(request) -> StreamingHttpResponse:
+    return ExpenseRequestController().export_expense_requests(request)
+
+
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("EMP", "FO", "CFO", "ADM")
@@ -106,6 +115,27 @@ def decide_expense_view(request, expense_id: str) -> JsonResponse:
     return ExpenseRequestController().approve_or_rejext_expense_request(request, expense_id)
 
 
+@csrf_exempt
+@allowed_http_methods("POST")
+@login_required("FO", "CFO", "ADM")
+def claim_expenses_view(request) -> JsonResponse:
+    return ExpenseRequestController().claim_expense_requests(request)
+
+
+@csrf_exempt
+@allowed_http_methods("POST")
+@login_required("FO", "CFO", "ADM")
+def release_expense_claims_view(request) -> JsonResponse:
+    return ExpenseRequestController().release_expense_claims(request)
+
+
+@csrf_exempt
+@allowed_http_methods("POST")
+@login_required("FO", "CFO", "ADM")
+def bulk_decide_expenses_view(request) -> JsonResponse:
+    return ExpenseRequestController().bulk_decide_expense_requests(request)
+
+
 @csrf_exempt
 @allowed_http_methods("POST")
 @login_required("FO", "CFO", "ADM")
@@ -123,6 +153,7 @@ def create_topup_view(request, pettycash_account_id: str) -> JsonResponse:
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("ADM", "CFO", "FO")
+@read_replica()
 def list_all_topups_view(request) -> JsonResponse:
     return TopUpRequestController().list_all(request)
 
@@ -173,6 +204,7 @@ def list_my_reconciliations_view(request) -> JsonResponse:
 @csrf_exempt
 @allowed_http_methods("GET")
 @login_required("ADM", "CFO", "FO")
+@read_replica()
 def list_all_reconciliations_view(request) -> JsonResponse:
     return DisbursementReconciliationController().get_all_reconciliations(request)
 
@@ -0,0 +1,50 @@
+"""
+Gunicorn settings for the production container (see Dockerfile), read from ENV.
+
+    gunicorn -c gunicorn.conf.py
+
+Serves the WSGI app with threaded workers by default. For the async views
+(notifications, unread count, dashboard) run ASGI instead, where one worker
+holds many concurrent polls on its event loop:
+
+    GUNICORN_APP=pettycash_system.asgi:application
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker
+
+The unread-count SSE stream (notifications/unread/stream/) only stays open
+under ASGI; on WSGI workers it answers with one event and the client polls.
+In ASGI mode settings turn persistent connections off and enable DB_POOL
+unless it is set explicitly (see config.env_config ASGI).
+
+Graceful reload: send SIGHUP to the master (docker compose kill -s HUP
+pettycash-backend). It starts workers with the new code and settings and lets
+the old ones finish their in-flight requests within GUNICORN_GRACEFUL_TIMEOUT.
+
+With DB_POOL enabled, keep DB_POOL_MAX_SIZE at or above GUNICORN_THREADS —
+every thread of a worker draws from that worker's pool.
+"""
+
+import multiprocessing
+
+from config.env_config import ENV
+
+wsgi_app = ENV.GUNICORN_APP
+bind = ENV.GUNICORN_BIND
+workers = int(ENV.GUNICORN_WORKERS) if ENV.GUNICORN_WORKERS else multiprocessing.cpu_count() * 2 + 1
+worker_class = ENV.GUNICORN_WORKER_CLASS
+threads = int(ENV.GUNICORN_THREADS)  # gthread only; uvicorn workers are single-threaded event loops
+
+timeout = int(ENV.GUNICORN_TIMEOUT)
+graceful_timeout = int(ENV.GUNICORN_GRACEFUL_TIMEOUT)
+keepalive = int(ENV.GUNICORN_KEEPALIVE)
+
+# recycle workers now and then so slow leaks cannot grow without bound;
+# the jitter keeps them from all restarting at once
+max_requests = int(ENV.GUNICORN_MAX_REQUESTS)
+max_requests_jitter = max_requests // 10
+
+# development only — restarts workers when code changes
+reload = ENV.GUNICORN_RELOAD.lower() == "true"
+
+accesslog = "-"
+errorlog = "-"
+loglevel = ENV.GUNICORN_LOG_LEVEL
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 from pathlib import Path
 from config.env_config import ENV
 
+from django.core.exceptions import ImproperlyConfigured
+
 from django.conf.global_settings import AUTH_USER_MODEL, EMAIL_BACKEND, EMAIL_HOST, EMAIL_USE_TLS, EMAIL_HOST_USER
 import os
 
@@ -58,6 +60,10 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Collect the audit logs written during a request and insert them with one bulk_create on commit
+if ENV.AUDIT_DEFERRED_WRITES.lower() == "true":
+    MIDDLEWARE.append('utils.middleware.DeferredAuditMiddleware')
+
 ROOT_URLCONF = 'pettycash_system.urls'
 
 TEMPLATES = [
@@ -87,12 +93,66 @@ DATABASES = {
         'NAME': ENV.POSTGRES_DB,
         'USER': ENV.POSTGRES_USER,
         'PASSWORD':ENV.POSTGRES_PASSWORD,
-        'HOST':ENV.POSRGRES_HOST,
-        'PORT':ENV.POSTGRES_PORT
+        'HOST':ENV.POSTGRES_HOST,
+        'PORT':ENV.POSTGRES_PORT,
+        # reused connections are pinged before use, so a restarted server is not an error
+        'CONN_HEALTH_CHECKS': ENV.DB_CONN_HEALTH_CHECKS.lower() == "true",
+    }
+}
+
+# Connection reuse. DB_POOL=true uses psycopg's pool (connections shared by the threads of a
+# worker process); otherwise each thread keeps its connection open for DB_CONN_MAX_AGE seconds.
+# CONN_HEALTH_CHECKS also makes the pool check connections before handing them out.
+# Under ASGI (ENV.ASGI: GUNICORN_APP is the asgi app or a uvicorn worker) DB_POOL defaults to
+# true and persistent connections are never used: sync ORM calls run in executor threads, so a
+# connection kept open per thread outlives the request that opened it and is never reused.
+if ENV.DB_POOL.lower() == "true":
+    DATABASES['default']['CONN_MAX_AGE'] = 0  # Django refuses persistent connections with a pool
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(ENV.DB_POOL_MIN_SIZE),
+            'max_size': int(ENV.DB_POOL_MAX_SIZE),
+            'timeout': float(ENV.DB_POOL_TIMEOUT),
+        },
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = 0 if ENV.ASGI else int(ENV.DB_CONN_MAX_AGE)
+
+# Read replica for the list/dashboard views decorated with @read_replica (services.replica_routing).
+# Locally any second database works as a stand-in; under the test runner it mirrors default.
+if ENV.POSTGRES_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': ENV.POSTGRES_REPLICA_DB,
+        'HOST': ENV.POSTGRES_REPLICA_HOST,
+        'PORT': ENV.POSTGRES_REPLICA_PORT,
+        'TEST': {'MIRROR': 'default'},
+    }
+    # after a write the user reads from default for this many seconds
+    REPLICA_READ_YOUR_WRITES_SECONDS = int(ENV.REPLICA_READ_YOUR_WRITES_SECONDS)
+    MIDDLEWARE.append('utils.middleware.ReadYourWritesMiddleware')
+
+DATABASE_ROUTERS = ['services.replica_routing.ReplicaRouter']
 
+CACHES = {
+    'default': {
+        'BACKEND': ENV.CACHE_BACKEND,
+        'LOCATION': ENV.CACHE_LOCATION,
     }
 }
 
+# Read-your-writes pins live in the default cache; with a per-process cache a pin set by one
+# gunicorn worker is invisible to the others and the user reads stale rows from the replica.
+_PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+if 'replica' in DATABASES and CACHES['default']['BACKEND'] in _PER_PROCESS_CACHES:
+    raise ImproperlyConfigured(
+        "POSTGRES_REPLICA_HOST needs a cache shared by all workers: set CACHE_BACKEND "
+        "(and CACHE_LOCATION) to Redis, Memcached or the database cache."
+    )
+
 #------------LOCALHOST----------
 # DATABASES = {
 #     'default': {
@@ -130,6 +190,18 @@ EMAIL_USE_TLS=ENV.EMAIL_USE_TLS #  TLS encrypts the connection between: Your Dja
 EMAIL_PORT=ENV.EMAIL_PORT
 EMAIL_HOST_USER=ENV.EMAIL_HOST_USER # The Gmail account used to send emails
 EMAIL_HOST_PASSWORD=ENV.EMAIL_HOST_PASSWORD# The password used to log in to Gmail
+
+# login_required caches the authenticated user/role/status for this many seconds (0 disables).
+# Invalidation is in-process only: other workers may authenticate a deactivated user or an old
+# role for up to this long after the change (see services.auth_user_cache).
+# AUTH_USER_CACHE_SHARED also stores snapshots in the default Django cache for other workers.
+AUTH_USER_CACHE_TTL=int(ENV.AUTH_USER_CACHE_TTL)
+AUTH_USER_CACHE_SHARED=ENV.AUTH_USER_CACHE_SHARED.lower() == "true"
+if AUTH_USER_CACHE_SHARED and CACHES['default']['BACKEND'] in _PER_PROCESS_CACHES:
+    raise ImproperlyConfigured(
+        "AUTH_USER_CACHE_SHARED needs a cache shared by all workers: set CACHE_BACKEND "
+        "(and CACHE_LOCATION) to Redis, Memcached or the database cache."
+    )
 # LOGGING = {
 #     'version': 1,
 #     'handlers': {
@@ -0,0 +1,109 @@
+import copy
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+
+class AuthUserCache:
+    """
+    Short-lived user_id → User (role, status joined) cache for login_required.
+
+    Every authenticated request used to load the user, role and status from the
+    database after verifying the JWT. The snapshot is cached per process for
+    AUTH_USER_CACHE_TTL seconds, and optionally in the shared Django cache
+    (AUTH_USER_CACHE_SHARED) so a fresh worker process does not start cold.
+
+    Invalidation:
+        users.signals — any User save/delete drops that user (update_user,
+        update_profile, deactivation, role changes, last_login).
+        users.signals / base.signals — Role and Status edits clear every entry
+        in this process.
+
+        Signals only reach the process that made the change. Every other worker
+        keeps authenticating from its own snapshot — a deactivated user, a
+        demoted role — for up to AUTH_USER_CACHE_TTL seconds (30 by default),
+        and AUTH_USER_CACHE_SHARED entries for a changed Role or Status live out
+        their TTL too. Set the TTL to 0 where that window is not acceptable.
+
+    Callers get a copy of the cached instance, so handlers that set attributes
+    on request.user (update_profile does) never leak into later requests.
+
+    USAGE:
+        AuthUserCache.get(user_id)      → User, or raises User.DoesNotExist
+        await AuthUserCache.aget(id)    → same, for async views
+        AuthUserCache.invalidate(id)    → drop one user
+        AuthUserCache.invalidate()      → drop every user cached in this process
+
+    A TTL of 0 disables the cache and every call goes to the database.
+    """
+
+    _lock = threading.Lock()
+    _entries = {}  # user_id (str) -> (expires_at, User)
+
+    @staticmethod
+    def _ttl() -> float:
+        return getattr(settings, "AUTH_USER_CACHE_TTL", 30)
+
+    @staticmethod
+    def _shared() -> bool:
+        return getattr(settings, "AUTH_USER_CACHE_SHARED", False)
+
+    @staticmethod
+    def _shared_key(user_id) -> str:
+        return f"auth_user:{user_id}"
+
+    @staticmethod
+    def _load(user_id):
+        from users.models import User
+
+        return User.objects.select_related("role", "status").get(id=user_id, is_active=True)
+
+    @classmethod
+    def get(cls, user_id):
+        """
+        Returns the active user with role and status joined.
+
+        Raises:
+            User.DoesNotExist: If the user does not exist or is inactive.
+        """
+        ttl = cls._ttl()
+        if ttl <= 0:
+            return cls._load(user_id)
+
+        key = str(user_id)
+        cached = cls._entries.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return copy.copy(cached[1])
+
+        user = cache.get(cls._shared_key(key)) if cls._shared() else None
+        if user is None:
+            user = cls._load(user_id)
+            if cls._shared():
+                cache.set(cls._shared_key(key), user, ttl)
+
+        with cls._lock:
+            cls._entries[key] = (time.monotonic() + ttl, user)
+        return copy.copy(user)
+
+    @classmethod
+    async def aget(cls, user_id):
+        """Async get(): a fresh in-process entry is returned without leaving the event loop."""
+        cached = cls._entries.get(str(user_id)) if cls._ttl() > 0 else None
+        if cached is not None and cached[0] > time.monotonic():
+            return copy.copy(cached[1])
+        return await sync_to_async(cls.get)(user_id)
+
+    @classmethod
+    def invalidate(cls, user_id=None) -> None:
+        """Drops one user (here and in the shared cache), or every user cached in this process."""
+        with cls._lock:
+            if user_id is None:
+                cls._entries.clear()
+            else:
+                cls._entries.pop(str(user_id), None)
+
+        if user_id is not None and cls._shared():
+            cache.delete(cls._shared_key(user_id))
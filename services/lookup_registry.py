@@ -0,0 +1,133 @@
+import threading
+import time
+
+from django.conf import settings
+
+
+class LookupRegistry:
+    """
+    Process-wide code → row cache for the small lookup tables every workflow
+    transition touches (Status, EventTypes, Category).
+
+    Each table is loaded in one query the first time it is needed and then served
+    from memory. Rows are invalidated by the post_save/post_delete receivers in
+    base.signals and audit.signals whenever an admin edits a lookup row.
+
+    Those signals only reach the process that made the edit. Other workers
+    pick up edits to existing rows when their copy expires after
+    LOOKUP_REGISTRY_TTL seconds (300 by default). A code or pk they have never
+    seen triggers a reload instead, but at most once per
+    LOOKUP_REGISTRY_MISS_RELOAD_SECONDS (5 by default), so a request looping
+    over an unknown code cannot turn every lookup into a table scan.
+
+    The returned instances are shared across requests — assign them to foreign
+    keys, never mutate them.
+
+    USAGE:
+        LookupRegistry.status("pending")               → Status
+        LookupRegistry.event_type("expense_approved")  → EventTypes (event_category joined)
+        LookupRegistry.category("expense")             → Category
+    """
+
+    _lock = threading.Lock()
+    _tables = {}  # model -> (loaded_at, {code: instance})
+
+    @classmethod
+    def _ttl(cls) -> float:
+        return getattr(settings, "LOOKUP_REGISTRY_TTL", 300)
+
+    @classmethod
+    def _miss_reload_interval(cls) -> float:
+        return getattr(settings, "LOOKUP_REGISTRY_MISS_RELOAD_SECONDS", 5)
+
+    @classmethod
+    def _load(cls, model) -> dict:
+        queryset = model.objects.all()
+        if model.__name__ == "EventTypes":
+            queryset = queryset.select_related("event_category")
+
+        rows = {row.code: row for row in queryset if row.code}
+        with cls._lock:
+            cls._tables[model] = (time.monotonic(), rows)
+        return rows
+
+    @classmethod
+    def _rows(cls, model) -> dict:
+        cached = cls._tables.get(model)
+        if cached is None or time.monotonic() - cached[0] > cls._ttl():
+            return cls._load(model)
+        return cached[1]
+
+    @classmethod
+    def _reload_on_miss(cls, model) -> dict:
+        """Reloads a table that lacks a requested row, unless it was loaded too recently."""
+        cached = cls._tables.get(model)
+        if cached is not None and time.monotonic() - cached[0] < cls._miss_reload_interval():
+            return {}
+        return cls._load(model)
+
+    @classmethod
+    def get(cls, model, code: str):
+        """
+        Returns the row of `model` with the given code.
+
+        Raises:
+            model.DoesNotExist: If no row with that code exists, even after a reload.
+        """
+        rows = cls._rows(model)
+        if code in rows:
+            return rows[code]
+
+        # the row may have been created by another process since the table was loaded
+        rows = cls._reload_on_miss(model)
+        if code in rows:
+            return rows[code]
+
+        raise model.DoesNotExist(f"{model.__name__} matching code '{code}' does not exist.")
+
+    @classmethod
+    def get_by_pk(cls, model, pk):
+        """Same as get() but looks the row up by primary key."""
+        for load in (cls._rows, cls._reload_on_miss):  # reload on a miss, like get()
+            for row in load(model).values():
+                if str(row.pk) == str(pk):
+                    return row
+
+        raise model.DoesNotExist(f"{model.__name__} with id '{pk}' does not exist.")
+
+    @classmethod
+    def get_or_create(cls, model, code: str, defaults: dict = None):
+        """Same as get() but creates the row (and refreshes the cache) when missing."""
+        try:
+            return cls.get(model, code)
+        except model.DoesNotExist:
+            row, _ = model.objects.get_or_create(code=code, defaults=defaults or {})
+            cls.invalidate(model)
+            return row
+
+    @classmethod
+    def invalidate(cls, model=None) -> None:
+        """Drops one cached table, or every table when no model is given."""
+        with cls._lock:
+            if model is None:
+                cls._tables.clear()
+            else:
+                cls._tables.pop(model, None)
+
+    @classmethod
+    def status(cls, code: str):
+        from base.models import Status
+
+        return cls.get(Status, code)
+
+    @classmethod
+    def category(cls, code: str):
+        from base.models import Category
+
+        return cls.get(Category, code)
+
+    @classmethod
+    def event_type(cls, code: str):
+        from audit.models import EventTypes
+
+        return cls.get(EventTypes, code)
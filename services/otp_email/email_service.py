@@ -1,5 +1,5 @@
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import get_template, render_to_string
+from django.core.mail import EmailMultiAlternatives, get_connection
+from services.otp_email.template_cache import TemplateCache
 from django.conf import settings
 from config.env_config import ENV
 from users.models import User
@@ -9,7 +9,35 @@ from audit.models import Notifications
 class EmailService:
 
     @staticmethod
-    def _send(subject: str, to_email: str, html_content: str, plain_text: str) -> None:
+    def _build(
+        subject: str, to_email: str, html_content: str, plain_text: str, connection=None
+    ) -> EmailMultiAlternatives:
+        """
+        Builds the multipart (plain text + HTML) message without sending it,
+        so callers can send it over a connection they already hold open.
+
+        Args:
+            subject (str): Email subject line.
+            to_email (str): Recipient email address.
+            html_content (str): Rendered HTML body.
+            plain_text (str): Plain text fallback body.
+            connection: Optional open mail backend connection.
+
+        Returns:
+            EmailMultiAlternatives: The message ready to send.
+        """
+        email = EmailMultiAlternatives(
+            from_email=ENV.EMAIL_HOST_USER,
+            to=[to_email],
+            subject=subject,
+            body=plain_text,
+            connection=connection,
+        )
+        email.attach_alternative(html_content, "text/html")
+        return email
+
+    @classmethod
+    def _send(cls, subject: str, to_email: str, html_content: str, plain_text: str) -> None:
         """
 
         Base email sender — reused by all email methods.
@@ -32,13 +60,7 @@ class EmailService:
         :return:
         """
         try:
-            email = EmailMultiAlternatives(
-                from_email=ENV.EMAIL_HOST_USER,
-                to=[to_email],
-                subject=subject,
-                body=plain_text,
-            )
-            email.attach_alternative(html_content, "text/html")
+            email = cls._build(subject, to_email, html_content, plain_text)
             #lets exceptions bubble up to your try/except
             email.send(fail_silently=False)
         except Exception as ex:
@@ -58,9 +80,8 @@ class EmailService:
         """
         try:
             # render the HTML template with context
-            html_content = render_to_string(
-                "otp_email.html",  # ← just the filename since APP_DIRS=True
-                #   Django will find it inside services/otp_email/templates/
+            html_content = TemplateCache.render(
+                "otp_email.html",  # compiled once per process, found via TEMPLATES DIRS
                 {
                     "fullname": user.first_name + " " + user.last_name,
                     "otp_code": otp_code,
@@ -84,11 +105,77 @@ class EmailService:
         except Exception as ex:
             raise Exception(f"failed to send OTP email to {user.email}: {str(ex)}")
 
+    @staticmethod
+    def _notification_context(notification: Notifications) -> dict:
+        """The part of the notification email context shared by every recipient of a log."""
+        log = notification.transaction_log
+        return {
+            "event_name": log.event_type.name,
+            "message": log.event_message,
+            "triggered_by": log.triggered_by.email if log.triggered_by else "System",
+        }
+
+    @classmethod
+    def render_notification_shared(cls, notification: Notifications):
+        """
+        Renders notification_email.html once for a transaction log, leaving the
+        recipient's full name as a placeholder (see TemplateCache.render_shared).
+
+        Returns:
+            SharedRender | None: None when the template cannot be shared safely.
+        """
+        return TemplateCache.render_shared(
+            "notification_email.html",
+            cls._notification_context(notification),
+            per_recipient=("fullname",),
+        )
+
+    @classmethod
+    def build_notification(
+        cls, user: User, notification: Notifications, shared=None
+    ) -> EmailMultiAlternatives:
+        """
+        Renders a notification email for the user without sending it.
+
+        Args:
+            user (User): The recipient.
+            notification: The Notifications model instance.
+            shared (SharedRender): Optional pre-rendered body for this notification's
+                transaction log — only the full name is substituted when given.
+
+        Returns:
+            EmailMultiAlternatives: The rendered message.
+        """
+        context = cls._notification_context(notification)
+        fullname = user.first_name + " " + user.last_name
+
+        if shared is not None:
+            html_content = shared.for_recipient(fullname=fullname)
+        else:
+            html_content = TemplateCache.render(
+                "notification_email.html", {**context, "fullname": fullname}
+            )
+
+        plain_text = (
+            f"Hello {user.first_name},\n\n"
+            f"You have a new notification {context['event_name']}\n\n"
+            f"{context['message']}\n\n"
+            f"Triggered by {context['triggered_by']}"
+        )
+
+        return cls._build(
+            subject=f"Notification: {context['event_name']}",
+            to_email=user.email,
+            html_content=html_content,
+            plain_text=plain_text,
+        )
+
     @classmethod
     def send_notification(cls, user: User, notification: Notifications):
         """
-        Sends an in-app notification as an email to the user.
-        Called from NotificationService.notify() when channel is EMAIL.
+        Sends an in-app notification as an email to the user, right away.
+        Queued EMAIL notifications do not come through here — the
+        send_outbox_emails worker delivers them with send_notification_batch().
 
         Args:
             user (User): The recipient.
@@ -99,36 +186,79 @@ class EmailService:
 
         """
         try:
-
-            html_content = render_to_string(
-                "notification_email.html",
-                {
-                    "fullname": user.first_name + " " + user.last_name,
-                    "event_name": notification.transaction_log.event_type.name,
-                    "message": notification.transaction_log.event_message,
-                    "triggered_by": (
-                        notification.transaction_log.triggered_by.email
-                        if notification.transaction_log.triggered_by
-                        else "System"
-                    ),
-                },
+            cls.build_notification(user, notification).send(fail_silently=False)
+        except Exception as ex:
+            raise Exception(
+                f"Failed to send notification email to {user.email}: {str(ex)}"
             )
 
-            plain_text = (
-                f"Hello {user.first_name},\n\n"
-                f"You have a new notification {notification.transaction_log.event_type.name}\n\n"
-                f"{notification.transaction_log.event_message}\n\n"
-                f"Triggered by {notification.transaction_log.triggered_by.email if notification.transaction_log.triggered_by else "System"}"
-            )
+    @classmethod
+    def send_notification_batch(cls, notifications, connection=None) -> list:
+        """
+        Sends many notification emails over a single SMTP session.
+        The body is rendered once per transaction log (only the recipient's name is
+        substituted per message) and every message goes out over the same
+        connection, so notifying N finance officers costs one render and one TLS
+        handshake instead of N. Each recipient is sent and reported on its own —
+        one bad address does not abort the rest.
 
-            cls._send(
-                subject=f"Notification: {notification.transaction_log.event_type.name}",
-                to_email=user.email,
-                html_content=html_content,
-                plain_text=plain_text,
-            )
+        Args:
+            notifications (list[Notifications]): Notifications with recipient and
+                transaction_log (event_type, triggered_by) already loaded.
+            connection: Optional mail backend connection. One is opened (and closed)
+                for the batch when not given.
+
+        Returns:
+            list[dict]: One result per notification, in input order:
+                {"notification": Notifications, "email": str, "sent": bool, "error": str | None}
+        """
+        shared_by_log = {}  # transaction_log_id -> SharedRender | None
+        results, outgoing = [], []
+
+        for notification in notifications:
+            result = {
+                "notification": notification,
+                "email": notification.recipient.email,
+                "sent": False,
+                "error": None,
+            }
+            results.append(result)
+            try:
+                log_id = notification.transaction_log_id
+                if log_id not in shared_by_log:
+                    shared_by_log[log_id] = cls.render_notification_shared(notification)
+                outgoing.append(
+                    (
+                        result,
+                        cls.build_notification(
+                            notification.recipient, notification, shared_by_log[log_id]
+                        ),
+                    )
+                )
+            except Exception as ex:
+                result["error"] = f"Failed to render notification email: {str(ex)}"
+
+        if not outgoing:
+            return results
 
+        owns_connection = connection is None
+        connection = connection or get_connection(fail_silently=False)
+        try:
+            connection.open()
         except Exception as ex:
-            raise Exception(
-                f"Failed to send notification email to {user.email}: {str(ex)}"
-            )
+            for result, _ in outgoing:
+                result["error"] = f"SMTP connection failed: {str(ex)}"
+            return results
+
+        try:
+            for result, message in outgoing:
+                try:
+                    connection.send_messages([message])
+                    result["sent"] = True
+                except Exception as ex:
+                    result["error"] = f"Failed to send email to {result['email']}: {str(ex)}"
+        finally:
+            if owns_connection:
+                connection.close()
+
+        return results
@@ -0,0 +1,82 @@
+import threading
+import uuid
+
+from django.template.loader import get_template
+from django.utils.html import escape
+
+
+class SharedRender:
+    """
+    A template rendered once with placeholder tokens standing in for the
+    per-recipient fields. for_recipient() swaps the tokens for the real,
+    HTML-escaped values — a few str.replace calls instead of a full render.
+    """
+
+    def __init__(self, html: str, tokens: dict):
+        self.html = html
+        self.tokens = tokens  # field name -> placeholder token
+
+    def for_recipient(self, **values) -> str:
+        html = self.html
+        for field, token in self.tokens.items():
+            html = html.replace(token, escape(values.get(field, "")))
+        return html
+
+
+class TemplateCache:
+    """
+    Process-wide cache of compiled email templates.
+
+    USAGE:
+        TemplateCache.render("otp_email.html", context)                         → str
+        shared = TemplateCache.render_shared("notification_email.html",
+                                             context, per_recipient=("fullname",))
+        shared.for_recipient(fullname="Jane Doe")                                → str
+
+    Per-recipient fields must be output as plain {{ field }} in the template
+    (no filters) — a filter would transform the placeholder token and the
+    substitution could not find it. render_shared() detects that and falls
+    back to returning None so callers render per recipient instead.
+    """
+
+    _lock = threading.Lock()
+    _templates = {}  # template name -> compiled template
+
+    @classmethod
+    def get(cls, template_name: str):
+        template = cls._templates.get(template_name)
+        if template is None:
+            template = get_template(template_name)
+            with cls._lock:
+                cls._templates[template_name] = template
+        return template
+
+    @classmethod
+    def render(cls, template_name: str, context: dict) -> str:
+        return cls.get(template_name).render(context)
+
+    @classmethod
+    def render_shared(cls, template_name: str, context: dict, per_recipient=("fullname",)):
+        """
+        Renders everything in the template except the per-recipient fields.
+
+        Args:
+            template_name (str): Template to render.
+            context (dict): The context shared by every recipient.
+            per_recipient (tuple[str]): Context keys that differ per recipient.
+
+        Returns:
+            SharedRender | None: None if a per-recipient placeholder did not survive
+                rendering verbatim, meaning the template cannot be shared safely.
+        """
+        tokens = {field: f"__tpl_{field}_{uuid.uuid4().hex}__" for field in per_recipient}
+        html = cls.render(template_name, {**context, **tokens})
+
+        if not all(token in html for token in tokens.values()):
+            return None
+        return SharedRender(html, tokens)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._templates.clear()
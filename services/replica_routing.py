@@ -0,0 +1,101 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_ALIAS = "replica"
+
+_read_alias = ContextVar("replica_read_alias", default=None)
+
+
+class ReplicaRouting:
+    """
+    Opt-in routing of read-only endpoints to the read replica.
+
+    Reads go to the replica only inside a reads() block — the read_replica view
+    decorator opens one — and only when settings.DATABASES defines the alias.
+    Every write, and every read outside such a block, stays on default.
+
+    Read-your-writes:
+        The replica lags the primary, so a user who just mutated data would
+        not see it on the next list/dashboard call. utils.middleware.
+        ReadYourWritesMiddleware pins a user to the primary for
+        REPLICA_READ_YOUR_WRITES_SECONDS after any non-GET request they make;
+        read_replica skips the replica while the pin is set. Pins live in the
+        Django cache, so settings refuse a replica with a per-process cache
+        (locmem) — every worker must see the pin (CACHE_BACKEND).
+
+    USAGE:
+        with ReplicaRouting.reads():
+            ExpenseRequest.objects.filter(...)   → read from "replica"
+        ReplicaRouting.pin(user_id)              → primary-only for the window
+        ReplicaRouting.is_pinned(user_id)        → bool
+    """
+
+    @staticmethod
+    def is_configured(alias: str = REPLICA_ALIAS) -> bool:
+        return alias in settings.DATABASES
+
+    @staticmethod
+    def _window() -> int:
+        return getattr(settings, "REPLICA_READ_YOUR_WRITES_SECONDS", 5)
+
+    @staticmethod
+    def _pin_key(user_id) -> str:
+        return f"replica_pin:{user_id}"
+
+    @staticmethod
+    def current_alias():
+        return _read_alias.get()
+
+    @classmethod
+    def pin(cls, user_id) -> None:
+        if user_id is not None and cls._window() > 0:
+            cache.set(cls._pin_key(user_id), True, cls._window())
+
+    @classmethod
+    async def apin(cls, user_id) -> None:
+        if user_id is not None and cls._window() > 0:
+            await cache.aset(cls._pin_key(user_id), True, cls._window())
+
+    @classmethod
+    def is_pinned(cls, user_id) -> bool:
+        return user_id is not None and bool(cache.get(cls._pin_key(user_id)))
+
+    @classmethod
+    async def ais_pinned(cls, user_id) -> bool:
+        return user_id is not None and bool(await cache.aget(cls._pin_key(user_id)))
+
+    @staticmethod
+    @contextmanager
+    def reads(alias: str = REPLICA_ALIAS):
+        token = _read_alias.set(alias)
+        try:
+            yield
+        finally:
+            _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    """settings.DATABASE_ROUTERS entry; sends reads to the alias chosen by ReplicaRouting.reads()."""
+
+    def db_for_read(self, model, **hints):
+        alias = ReplicaRouting.current_alias()
+        if alias is None or alias not in settings.DATABASES:
+            return None
+        # inside a transaction on the primary the replica cannot see its rows yet
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # both aliases hold the same data, so rows read from either can be related
+        databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import threading
+import time
+
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "unread_counts"
+# pg_notify payloads are capped at 8000 bytes; 36-char UUIDs plus a separator
+_IDS_PER_NOTIFY = 200
+
+
+class UnreadCountBroker:
+    """
+    Pushes "your unread count changed" signals to open SSE streams
+    (NotificationController.stream_unread_count), so clients stop polling
+    notifications/unread/count/ and the COUNT runs only when something changed.
+
+    NotificationService calls publish() with the recipients whenever
+    notifications are created or marked read. The signal is sent on commit — a
+    rolled back notify never reaches a stream.
+
+    Fan-out:
+        PostgreSQL — publish() runs NOTIFY unread_counts with the user ids; each
+        worker process that has open streams LISTENs on a dedicated connection
+        in a background thread and wakes its local subscribers, so a change
+        made in one gunicorn worker reaches streams held by every other one.
+        Other databases — subscribers in the publishing process only.
+
+    Subscribers are asyncio queues on the event loop of the streaming view;
+    they receive a bare wake-up and re-read the count themselves.
+
+    USAGE:
+        UnreadCountBroker.publish([user_id, ...])     → after commit
+        subscription = UnreadCountBroker.subscribe(user_id)   (inside the event loop)
+        await subscription.queue.get()
+        UnreadCountBroker.unsubscribe(subscription)
+    """
+
+    _lock = threading.Lock()
+    _subscribers = {}  # user_id (str) -> set of _Subscription
+    _listener = None
+
+    class _Subscription:
+        def __init__(self, user_id: str):
+            self.user_id = user_id
+            self.loop = asyncio.get_running_loop()
+            self.queue = asyncio.Queue()
+
+        def wake(self) -> None:
+            # coalesce: one pending wake-up is enough to trigger a re-count
+            if self.queue.empty():
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
+    @staticmethod
+    def _uses_listen_notify() -> bool:
+        return connection.vendor == "postgresql"
+
+    @classmethod
+    def subscribe(cls, user_id) -> "_Subscription":
+        subscription = cls._Subscription(str(user_id))
+        with cls._lock:
+            cls._subscribers.setdefault(subscription.user_id, set()).add(subscription)
+        if cls._uses_listen_notify():
+            cls._ensure_listener()
+        return subscription
+
+    @classmethod
+    def unsubscribe(cls, subscription) -> None:
+        with cls._lock:
+            subscriptions = cls._subscribers.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del cls._subscribers[subscription.user_id]
+
+    @classmethod
+    def publish(cls, user_ids) -> None:
+        """Signals the given users' streams once the current transaction commits."""
+        user_ids = sorted({str(user_id) for user_id in user_ids})
+        if user_ids:
+            transaction.on_commit(lambda: cls._send(user_ids))
+
+    @classmethod
+    def _send(cls, user_ids) -> None:
+        if not cls._uses_listen_notify():
+            cls.dispatch(user_ids)
+            return
+
+        try:
+            with connection.cursor() as cursor:
+                for start in range(0, len(user_ids), _IDS_PER_NOTIFY):
+                    cursor.execute(
+                        "SELECT pg_notify(%s, %s)",
+                        [CHANNEL, ",".join(user_ids[start : start + _IDS_PER_NOTIFY])],
+                    )
+        except Exception:
+            # a lost wake-up only delays the badge until the stream's next refresh
+            logger.exception("Failed to publish unread count changes")
+
+    @classmethod
+    def dispatch(cls, user_ids) -> None:
+        """Wakes this process's subscribers for the given users."""
+        with cls._lock:
+            subscriptions = [
+                subscription
+                for user_id in user_ids
+                for subscription in cls._subscribers.get(str(user_id), ())
+            ]
+        for subscription in subscriptions:
+            subscription.wake()
+
+    @classmethod
+    def _ensure_listener(cls) -> None:
+        with cls._lock:
+            if cls._listener is not None and cls._listener.is_alive():
+                return
+            cls._listener = threading.Thread(
+                target=cls._listen, name="unread-count-listener", daemon=True
+            )
+            cls._listener.start()
+
+    @classmethod
+    def _listen(cls) -> None:
+        """LISTEN loop on its own autocommit connection; reconnects after errors."""
+        import psycopg
+
+        while True:
+            try:
+                params = connection.get_connection_params()
+                with psycopg.connect(**params, autocommit=True) as listener:
+                    listener.execute(f"LISTEN {CHANNEL}")
+                    for notify in listener.notifies():
+                        cls.dispatch(notify.payload.split(","))
+            except Exception:
+                logger.exception("unread count listener lost its connection; retrying")
+                time.sleep(5)
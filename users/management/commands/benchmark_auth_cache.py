@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from authenticate.services.token_service import TokenService
+from services.auth_user_cache import AuthUserCache
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures requests/sec and queries per request on the authenticated auth/me "
+        "endpoint with the login_required user cache disabled and enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--email",
+            help="Email of the user to authenticate as. Defaults to the first active user.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="How many requests to send in each mode.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        if options["email"]:
+            users = users.filter(email=options["email"])
+        user = users.first()
+        if not user:
+            raise CommandError("No active user found to authenticate as.")
+
+        client = Client(
+            HTTP_HOST="localhost",
+            HTTP_AUTHORIZATION=f"Bearer {TokenService.generate_access_token(user)}",
+        )
+        url = reverse("get-auth-user")
+
+        for label, ttl in (("without cache", 0), ("with cache", 30)):
+            with override_settings(AUTH_USER_CACHE_TTL=ttl):
+                AuthUserCache.invalidate()
+                response = client.get(url)  # warm-up, and primes the cache when enabled
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"auth/me returned {response.status_code}: {response.content.decode()}"
+                    )
+
+                with CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    for _ in range(options["requests"]):
+                        client.get(url)
+                    elapsed = time.perf_counter() - started
+
+            self.stdout.write(
+                f"{label}: {options['requests'] / elapsed:.0f} req/s, "
+                f"{len(captured.captured_queries) / options['requests']:.2f} queries/request"
+            )
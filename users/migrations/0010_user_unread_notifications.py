@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-17 06:46
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread_notifications(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    Notifications = apps.get_model("audit", "Notifications")
+    unread = (
+        Notifications.objects.filter(recipient=OuterRef("pk"), is_read=False)
+        .order_by()
+        .values("recipient")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    User.objects.update(unread_notifications=Coalesce(Subquery(unread), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0012_hot_query_indexes'),
+        ('users', '0009_alter_role_permissions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='unread_notifications',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Unread notifications'),
+        ),
+        migrations.RunPython(backfill_unread_notifications, migrations.RunPython.noop),
+    ]
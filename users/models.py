@@ -147,14 +147,34 @@ class User(BaseModel, AbstractBaseUser, PermissionsMixin):
         blank=True, null=True, verbose_name=_("OTP Expires At")
     )
 
+    # notification badge — maintained with F() updates by NotificationService,
+    # repaired by the reconcile_unread_counts command
+    unread_notifications = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_("Unread notifications")
+    )
+
     # default manager for this class
     objects = UserManager()
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    # columns only ever changed in place by UPDATE ... SET col = col + n
+    COUNTER_FIELDS = ("unread_notifications",)
+
     def __str__(self):
         return self.first_name + " " + self.last_name
 
+    def save(self, *args, **kwargs):
+        # a full save of an existing user (admin edit) would write back a stale
+        # copy of the counters, so it saves every other column instead
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = "users"
         verbose_name = _("User")
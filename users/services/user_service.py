@@ -7,6 +7,7 @@ from django.core.exceptions import ValidationError
 from services.services import UserService, TransactionLogService
 from django.contrib.auth import get_user_model
 from utils.response_provider import ResponseProvider
+from utils.pagination import CursorPaginator
 from services.otp_email.otp_service import OTPService
 from ..models import User
 
@@ -79,17 +80,21 @@ class UserController:
     @classmethod
     def list_users(cls, request) -> ResponseProvider:
         """
-        Returns all users. Admin only (enforced at the decorator level).
+        Returns one page of active users, newest first. Admin only (enforced at the decorator level).
+        Reads the limit/cursor query params; the response carries next_cursor.
         :param request:
         :return:
         """
         try:
-            users = UserService.manager.select_related(
-                "role", "status", "department"
-            ).filter(is_active=True)
+            users, next_cursor = CursorPaginator.from_request(request).paginate(
+                UserService.manager.select_related(
+                    "role", "status", "department"
+                ).filter(is_active=True)
+            )
 
-            return ResponseProvider.success(
-                data=[cls._serialize(user) for user in users]
+            return ResponseProvider.paginated(
+                data=[cls._serialize(user) for user in users],
+                next_cursor=next_cursor,
             )
         except Exception as ex:
             return ResponseProvider.handle_exception(ex)
@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from base.models import Status
+from services.auth_user_cache import AuthUserCache
+from users.models import Role, User
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    A saved or deleted user must not keep authenticating from a stale snapshot.
+    Dropped again on commit so a request racing the open transaction cannot
+    re-cache the old row.
+    """
+    AuthUserCache.invalidate(instance.pk)
+    transaction.on_commit(lambda: AuthUserCache.invalidate(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Role)
+@receiver([post_save, post_delete], sender=Status)
+def clear_cached_users(sender, **kwargs):
+    """Cached users carry their role and status — edits to those rows clear them all."""
+    AuthUserCache.invalidate()
@@ -1,3 +1,70 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from services.auth_user_cache import AuthUserCache
+from users.models import User
+from utils.testing import create_user
+
+
+@override_settings(AUTH_USER_CACHE_TTL=30)
+class AuthUserCacheTests(TestCase):
+    """Changes to a user, or to the role it carries, evict the cached snapshot."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user("employee@test.local", "EMP")
+
+    def setUp(self):
+        AuthUserCache.invalidate()
+        cache.clear()
+
+    def warm(self):
+        AuthUserCache.get(self.user.id)
+        with self.assertNumQueries(0):
+            return AuthUserCache.get(self.user.id)
+
+    def test_user_save_evicts_the_entry(self):
+        self.warm()
+        self.user.first_name = "Renamed"
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(AuthUserCache.get(self.user.id).first_name, "Renamed")
+
+    def test_deactivated_user_is_no_longer_returned(self):
+        self.warm()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(User.DoesNotExist):
+            AuthUserCache.get(self.user.id)
+
+    def test_user_delete_evicts_the_entry(self):
+        self.warm()
+        self.user.delete()
+
+        with self.assertRaises(User.DoesNotExist):
+            AuthUserCache.get(self.user.id)
+
+    def test_role_change_evicts_the_entry(self):
+        self.warm()
+        role = self.user.role
+        role.name = "Employee (renamed)"
+        role.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(AuthUserCache.get(self.user.id).role.name, "Employee (renamed)")
+
+    @override_settings(AUTH_USER_CACHE_SHARED=True)
+    def test_user_save_evicts_the_shared_entry(self):
+        self.warm()
+        self.assertIsNotNone(cache.get(AuthUserCache._shared_key(self.user.id)))
+
+        self.user.save()
+
+        self.assertIsNone(cache.get(AuthUserCache._shared_key(self.user.id)))
+
+    def test_callers_get_a_copy(self):
+        AuthUserCache.get(self.user.id).first_name = "Leaked"
+
+        self.assertEqual(AuthUserCache.get(self.user.id).first_name, "Test")
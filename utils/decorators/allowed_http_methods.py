@@ -1,16 +1,30 @@
 from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
 from utils.response_provider import ResponseProvider
 
 def allowed_http_methods(*allowed_methods):
     def decorator(func):
-        @wraps(func)
-        def wrapper(request, *args, **kwargs):
+        def check(request):
             if allowed_methods and request.method not in allowed_methods:
                 return ResponseProvider().bad_request(
                     message='Method not allowed',
-                    error=f"{request.method} method is not allowed. Allowed methods: {','.join(allowed_methods)}"       
+                    error=f"{request.method} method is not allowed. Allowed methods: {','.join(allowed_methods)}"
                 )
-            return func(request, *args, **kwargs)
-        
+            return None
+
+        # async views get an async wrapper so Django runs them on the event loop
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(request, *args, **kwargs):
+                return check(request) or await func(request, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            return check(request) or func(request, *args, **kwargs)
+
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
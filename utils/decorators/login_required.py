@@ -1,11 +1,13 @@
 import jwt
 from functools import wraps
 
+from asgiref.sync import iscoroutinefunction
 from django.core.exceptions import PermissionDenied
 
 from authenticate.services.token_service import TokenService
 from users.models import User
 from config.env_config import ENV
+from services.auth_user_cache import AuthUserCache
 from utils.response_provider import ResponseProvider
 
 
@@ -21,11 +23,11 @@ from utils.response_provider import ResponseProvider
 
 def login_required(*allowed_roles):
     def decorator(func):
-        @wraps(func)
-        def wrapper(request, *args, **kwargs):
+        def check_header(request):
+            """Returns (token, None) or (None, error response)."""
             auth_header = request.headers.get("Authorization", "")
             if not auth_header.startswith("Bearer "):
-                return ResponseProvider.unauthorized(
+                return None, ResponseProvider.unauthorized(
                     message="Authentication required",
                     error="Authorization header missing or malformed. Expected: Bearer <token>",
                 )
@@ -33,15 +35,50 @@ def login_required(*allowed_roles):
             token = auth_header.split(" ")[1]
 
             if not token:
-                return ResponseProvider().unauthorized(
+                return None, ResponseProvider().unauthorized(
                     message="No bearer token provided"
                 )
+            return token, None
+
+        def check_role(user):
+            if allowed_roles and user.role.code not in allowed_roles:
+                return ResponseProvider().forbidden(
+                    error="You dont have permissions to access this resource"
+                )
+            return None
+
+        # async views authenticate without leaving the event loop on a cache hit
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(request, *args, **kwargs):
+                token, error = check_header(request)
+                if error:
+                    return error
+
+                try:
+                    payload = TokenService.decode_access_token(token)
+                    user = await AuthUserCache.aget(payload["user_id"])
+                    request.user = user
+
+                except PermissionDenied as ex:
+                    return ResponseProvider.unauthorized(error=str(ex))
+                except User.DoesNotExist:
+                    return ResponseProvider.not_found(error="User not found.")
+
+                return check_role(user) or await func(request, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            token, error = check_header(request)
+            if error:
+                return error
 
             try:
                 payload = TokenService.decode_access_token(token)
-                user = User.objects.select_related("role", "status").get(
-                    id=payload["user_id"], is_active=True
-                )
+                # served from a short-TTL snapshot; see services.auth_user_cache
+                user = AuthUserCache.get(payload["user_id"])
                 request.user = user
 
             except PermissionDenied as ex:
@@ -50,12 +87,7 @@ def login_required(*allowed_roles):
                 return ResponseProvider.not_found(error="User not found.")
 
             # role check
-            if allowed_roles and user.role.code not in allowed_roles:
-                return ResponseProvider().forbidden(
-                    error="You dont have permissions to access this resource"
-                )
-
-            return func(request, *args, **kwargs)
+            return check_role(user) or func(request, *args, **kwargs)
 
         return wrapper
 
@@ -0,0 +1,48 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
+from services.replica_routing import REPLICA_ALIAS, ReplicaRouting
+
+
+"""
+    Decorator to serve a read-only view from the read replica.
+
+    Place it below login_required so request.user is known — a user pinned to
+    the primary after a recent write (read-your-writes window) is served from
+    default. Without a "replica" entry in settings.DATABASES it does nothing.
+
+    Usage:
+        @login_required("ADM", "CFO", "FO")
+        @read_replica()
+        def list_all_expenses_view(request): ...
+    """
+
+
+def read_replica(alias=REPLICA_ALIAS):
+    def decorator(func):
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(request, *args, **kwargs):
+                user_id = getattr(getattr(request, "user", None), "id", None)
+                if not ReplicaRouting.is_configured(alias) or await ReplicaRouting.ais_pinned(user_id):
+                    return await func(request, *args, **kwargs)
+
+                # the context variable follows the async ORM into its worker thread
+                with ReplicaRouting.reads(alias):
+                    return await func(request, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(request, *args, **kwargs):
+            user_id = getattr(getattr(request, "user", None), "id", None)
+            if not ReplicaRouting.is_configured(alias) or ReplicaRouting.is_pinned(user_id):
+                return func(request, *args, **kwargs)
+
+            with ReplicaRouting.reads(alias):
+                return func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
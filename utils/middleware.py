@@ -0,0 +1,62 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from services.audit_writer import DeferredAuditWriter
+from services.replica_routing import ReplicaRouting
+
+
+class DeferredAuditMiddleware:
+    """Buffers every audit log written while handling a request (AUDIT_DEFERRED_WRITES)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with DeferredAuditWriter.deferred():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        async with DeferredAuditWriter.adeferred():
+            return await self.get_response(request)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins a user to the primary database for REPLICA_READ_YOUR_WRITES_SECONDS
+    after a non-GET request, so read_replica views show them their own writes.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _user_id(request):
+        # login_required sets request.user on the request object
+        return getattr(getattr(request, "user", None), "id", None)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if request.method not in self.SAFE_METHODS:
+            ReplicaRouting.pin(self._user_id(request))
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method not in self.SAFE_METHODS:
+            await ReplicaRouting.apin(self._user_id(request))
+        return response
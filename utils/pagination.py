@@ -0,0 +1,117 @@
+import base64
+import json
+import uuid
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class CursorPaginator:
+    """
+    Keyset (created_at, id) pagination for list endpoints.
+
+    Rows are returned newest first, ordered by (-created_at, -id), and the next
+    page starts strictly after the last row served — so fetching page N costs
+    the same as page 1 no matter how deep the client scrolls, and rows inserted
+    while paging never shift or duplicate results the way OFFSET does.
+
+    The cursor is an opaque url-safe token; clients just echo back the
+    next_cursor from the previous response.
+
+    USAGE (in a controller):
+        paginator = CursorPaginator.from_request(request)
+        rows, next_cursor = paginator.paginate(ExpenseRequestService().get_all())
+        (async views: rows, next_cursor = await paginator.apaginate(...))
+        return ResponseProvider.paginated(
+            data=[cls._serialize(row) for row in rows], next_cursor=next_cursor
+        )
+
+    QUERY PARAMS:
+        limit   → page size, default PAGINATION_DEFAULT_LIMIT (25), capped at PAGINATION_MAX_LIMIT (100)
+        cursor  → next_cursor from the previous page; omit for the first page
+    """
+
+    def __init__(self, cursor: str = None, limit=None):
+        self.cursor = cursor
+        self.limit = self._clean_limit(limit)
+
+    @classmethod
+    def from_request(cls, request) -> "CursorPaginator":
+        return cls(cursor=request.GET.get("cursor") or None, limit=request.GET.get("limit"))
+
+    @staticmethod
+    def _clean_limit(limit) -> int:
+        default = getattr(settings, "PAGINATION_DEFAULT_LIMIT", 25)
+        maximum = getattr(settings, "PAGINATION_MAX_LIMIT", 100)
+        if limit in (None, ""):
+            return default
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("limit must be an integer.")
+        if limit < 1:
+            raise ValueError("limit must be at least 1.")
+        return min(limit, maximum)
+
+    @staticmethod
+    def encode_cursor(row) -> str:
+        payload = json.dumps({"c": row.created_at.isoformat(), "i": str(row.id)})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        """
+        Returns the (created_at, id) position encoded in a cursor.
+
+        Raises:
+            ValueError: If the cursor was not produced by encode_cursor.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            created_at = parse_datetime(payload["c"])
+            row_id = uuid.UUID(payload["i"])
+        except (ValueError, TypeError, KeyError, AttributeError):
+            # AttributeError: a non-string id, which uuid.UUID does not type-check
+            raise ValueError("Invalid pagination cursor.")
+        if created_at is None:
+            raise ValueError("Invalid pagination cursor.")
+        return created_at, row_id
+
+    def _page_queryset(self, queryset):
+        queryset = queryset.order_by("-created_at", "-id")
+
+        if self.cursor:
+            created_at, row_id = self.decode_cursor(self.cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=row_id)
+            )
+
+        # one extra row tells us whether another page exists without a COUNT(*)
+        return queryset[: self.limit + 1]
+
+    def _split_page(self, rows: list):
+        if len(rows) <= self.limit:
+            return rows, None
+
+        rows = rows[: self.limit]
+        return rows, self.encode_cursor(rows[-1])
+
+    def paginate(self, queryset):
+        """
+        Returns one page of the queryset.
+
+        Args:
+            queryset: Any queryset over a BaseModel (needs created_at and id).
+                Its existing ordering is replaced by (-created_at, -id).
+
+        Returns:
+            tuple[list, str | None]: The rows of this page and the cursor for the
+                next one, or None when this is the last page.
+        """
+        return self._split_page(list(self._page_queryset(queryset)))
+
+    async def apaginate(self, queryset):
+        """Async paginate() for async views, fetched with the async ORM."""
+        return self._split_page([row async for row in self._page_queryset(queryset)])
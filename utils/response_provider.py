@@ -1,14 +1,30 @@
-from django.http import JsonResponse
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.exceptions import ValidationError, ObjectDoesNotExist, PermissionDenied
 from django.db import IntegrityError, OperationalError, DataError
 from utils.exceptions import TransactionLogError
 
 
+async def _pull_async(chunks):
+    """Async iterator over a sync generator, advancing it one item at a time on the sync thread."""
+    pull = sync_to_async(next)
+    done = object()
+    try:
+        while (chunk := await pull(chunks, done)) is not done:
+            yield chunk
+    finally:
+        # a client that disconnects early must not leave the server-side cursor open
+        await sync_to_async(chunks.close)()
+
+
 class ResponseProvider:
     @staticmethod
     def _response(
-        success: bool, code: str, message: str, status: int, data=None, error=None
+        success: bool, code: str, message: str, status: int, data=None, error=None, **extra
     ) -> JsonResponse:
         if data is None:
             data = {}
@@ -20,11 +36,93 @@ class ResponseProvider:
                 "message": message,
                 "data": data,
                 "error": error or "",
+                **extra,
             },
             status=status,
             encoder=DjangoJSONEncoder,
         )
 
+    @staticmethod
+    def stream(
+        rows, serialize, code="200.00", message="Success", chunk_size: int = 500, request=None
+    ) -> StreamingHttpResponse:
+        """
+        Streams a large list as the usual success/code/message/data/error envelope.
+
+        Rows are pulled with queryset.iterator(chunk_size) and encoded as they go,
+        so memory stays flat however many rows there are — the full list and the
+        full JSON string never exist at once.
+
+        "data" is written first and the status keys last: if a row fails to load or
+        serialize half way through, the array is closed and the envelope ends with
+        success=false and the error, so clients never accept a truncated export as
+        complete. The HTTP status is already 200 by then and cannot change.
+
+        Under ASGI Django would drain a plain generator into a list before sending
+        a byte, so for an ASGIRequest the chunks are pulled one at a time from the
+        request's sync thread (where the queryset's connection lives) instead.
+
+        Args:
+            rows: QuerySet (or any iterable) of rows to export.
+            serialize: Callable turning one row into a JSON-safe dict — usually the
+                controller's _serialize.
+            chunk_size (int): Rows fetched per database round trip and per write.
+            request: The HTTP request, so the body is streamed the way its server needs.
+
+        Returns:
+            StreamingHttpResponse: application/json body.
+        """
+        encoder = DjangoJSONEncoder()
+
+        def envelope():
+            yield '{"data": ['
+            error = ""
+            try:
+                iterator = rows.iterator(chunk_size=chunk_size) if hasattr(rows, "iterator") else iter(rows)
+                buffer, first = [], True
+                for row in iterator:
+                    buffer.append(("" if first else ",") + encoder.encode(serialize(row)))
+                    first = False
+                    if len(buffer) >= chunk_size:
+                        yield "".join(buffer)
+                        buffer = []
+                if buffer:
+                    yield "".join(buffer)
+            except Exception as ex:
+                error = str(ex)
+
+            tail = {
+                "success": not error,
+                "code": code if not error else "500.000",
+                "message": message if not error else "Export interrupted",
+                "error": error,
+            }
+            yield "], " + json.dumps(tail)[1:]
+
+        chunks = envelope()
+        if isinstance(request, ASGIRequest):
+            chunks = _pull_async(chunks)
+        return StreamingHttpResponse(chunks, content_type="application/json")
+
+    @staticmethod
+    def event_stream(events) -> StreamingHttpResponse:
+        """
+        Server-Sent Events response around an (async) iterator of ready-made
+        frames ("event: ...\ndata: ...\n\n"). Caching and proxy buffering are
+        switched off so each frame reaches the client as soon as it is yielded.
+
+        Returns:
+            StreamingHttpResponse: text/event-stream body.
+        """
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # nginx
+        return response
+
+    @staticmethod
+    def sse_frame(event: str, data) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
     @classmethod
     def handle_exception(cls, ex: Exception):
         if isinstance(ex, ValidationError):
@@ -63,6 +161,12 @@ class ResponseProvider:
         # we use it to call _response from the class
         return cls._response(True, code, message, 200, data=data)
 
+    @classmethod
+    def paginated(cls, data, next_cursor=None, code="200.00", message="Success"):
+        # list endpoints paged with utils.pagination.CursorPaginator;
+        # next_cursor is null on the last page
+        return cls._response(True, code, message, 200, data=data, next_cursor=next_cursor)
+
     @classmethod
     def created(cls, code="201.000", message="Created", data=None):
         return cls._response(True, code, message, 201, data=data)
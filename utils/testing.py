@@ -0,0 +1,114 @@
+"""
+Helpers shared by the apps' tests.py modules. Not imported by application code.
+"""
+
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from authenticate.services.token_service import TokenService
+from audit.models import EventTypes
+from base.models import Category, Status
+from services.lookup_registry import LookupRegistry
+from users.models import Role, User
+
+
+# Lookup rows the workflows resolve by code; migrate only seeds the ones model defaults need.
+WORKFLOW_STATUSES = ("ACT", "INACT", "pending", "approved", "rejected", "disbursed", "complete")
+WORKFLOW_EVENT_TYPES = {
+    "expense": (
+        "expense_submitted",
+        "expense_updated",
+        "expense_approved",
+        "expense_rejected",
+        "expense_disbursed",
+    ),
+    "topup": (
+        "topup_requested",
+        "topup_approved",
+        "topup_rejected",
+        "topup_disbursed",
+        "topup_deactivated",
+    ),
+}
+
+
+def create_workflow_lookups() -> None:
+    for code in WORKFLOW_STATUSES:
+        Status.objects.get_or_create(code=code, defaults={"name": code.title()})
+    for category_code, event_codes in WORKFLOW_EVENT_TYPES.items():
+        category, _ = Category.objects.get_or_create(
+            code=category_code, defaults={"name": category_code.title()}
+        )
+        for code in event_codes:
+            EventTypes.objects.get_or_create(
+                code=code, defaults={"name": code, "event_category": category}
+            )
+    LookupRegistry.invalidate()
+
+
+def create_user(email: str, role_code: str) -> User:
+    role, _ = Role.objects.get_or_create(code=role_code, defaults={"name": role_code})
+    status, _ = Status.objects.get_or_create(code="ACT", defaults={"name": "Active"})
+    return User.objects.create_user(
+        email, "password", role=role, status=status, first_name="Test", last_name="User"
+    )
+
+
+def auth_headers(user: User) -> dict:
+    """Authorization header login_required accepts for this user."""
+    return {"Authorization": f"Bearer {TokenService.generate_access_token(user)}"}
+
+
+@skipUnless(connection.vendor == "postgresql", "index choice is only asserted on PostgreSQL")
+class QueryPlanTestCase(TestCase):
+    """
+    Seeds rows in setUpTestData and asserts that hot queries use the index added
+    for them. Sequential scans and explicit sorts are disabled for each test so a
+    small seed still exercises the indexes.
+
+    Subclasses override seed() to create the rows their queries read.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        LookupRegistry.invalidate()
+        cls.seed()
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    @classmethod
+    def seed(cls):
+        """Creates the rows the subclass's queries read; nothing by default."""
+
+    def setUp(self):
+        LookupRegistry.invalidate()
+        with connection.cursor() as cursor:
+            # SET LOCAL ends with the transaction TestCase wraps each test in
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            # on a small seed the bare FK index plus a sort beats the ordered composite
+            cursor.execute("SET LOCAL enable_sort = off")
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertTrue(
+            any(name in plan for name in self.index_names(index_name)),
+            f"expected {index_name} in:\n{plan}",
+        )
+
+    @staticmethod
+    def index_names(index_name):
+        """The index itself plus, for a partitioned index, the index on each partition."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s AND parent.relkind = 'I'
+                """,
+                [index_name],
+            )
+            return [index_name, *(name for (name,) in cursor.fetchall())]